@@ -0,0 +1,284 @@
+import pandas as pd
+
+import columnar
+
+
+class Artifact:
+    """
+    Bir registry artefaktının tanımı. Artefakt ihtiyaç duyduğu anahtar
+    yollarını, değer adlarını ve satır üreticisini bildirir; hive'ı kendisi
+    gezmez. Aynı hive'ı kullanan tüm artefaktlar scan_hive ile tek geçişte
+    beslenir.
+
+    name:       Sonuç DataFrame'inin adı (GUI kategori adı)
+    key_paths:  Anahtar desenleri. '*' herhangi bir alt anahtarı eşler ve
+                eşlenen anahtarın adı KeyMatch.captures içine eklenir.
+    values:     Okunacak değer adları. ("*",) anahtarın tüm değerlerini verir.
+    build_rows: KeyMatch alıp satır sözlükleri üreten fonksiyon (generator).
+    columns:    Sütun sırası; sonuç boş olsa da korunur.
+    finalize:   İsteğe bağlı DataFrame -> DataFrame son işlemi (sıralama vb.)
+    build_frame: İsteğe bağlı satır listesi -> DataFrame üreticisi. Verilirse
+                build_rows sözlük yerine ham kayıtlar (ör. değer verisi)
+                üretebilir; bunlar burada topluca çözülür.
+    categorical: 'category' dtype'ına çevrilecek, tekrar eden metin sütunları
+                (yayıncı, VID_PID...)
+    """
+    def __init__(self, name, key_paths, build_rows, columns, values=(), finalize=None, build_frame=None,
+                 categorical=()):
+        self.name = name
+        self.key_paths = [key_paths] if isinstance(key_paths, str) else list(key_paths)
+        self.build_rows = build_rows
+        self.columns = list(columns)
+        self.values = tuple(values)
+        self.finalize = finalize
+        self.build_frame = build_frame
+        self.categorical = tuple(categorical)
+
+    def __repr__(self):
+        return f"Artifact({self.name!r})"
+
+
+class KeyMatch:
+    """ Bir desene uyan anahtar, joker karakterlerle eşlenen adlar ve okunan değerler. """
+    __slots__ = ("key", "captures", "values", "all_values")
+
+    def __init__(self, key, captures, values, all_values):
+        self.key = key
+        self.captures = captures
+        self.values = values          # küçük harfli ad -> RegistryValue
+        self.all_values = all_values  # values=("*",) ise tüm RegistryValue listesi
+
+    def value(self, name, default=None):
+        """ Değerin içeriğini döndürür; değer yoksa veya okunamazsa default. """
+        registry_value = self.values.get(name.lower())
+        if registry_value is None:
+            return default
+        try:
+            return registry_value.value()
+        except Exception:
+            return default
+
+
+class _TrieNode:
+    __slots__ = ("literals", "wildcard", "targets", "path", "name")
+
+    def __init__(self, path, name=""):
+        self.name = name
+        self.literals = {}
+        self.wildcard = None
+        self.targets = []   # (artefakt indeksi, desen indeksi)
+        self.path = path
+
+
+def _build_trie(artifacts):
+    root = _TrieNode("")
+    prefixes = {}
+    for artifact_index, artifact in enumerate(artifacts):
+        for pattern_index, key_path in enumerate(artifact.key_paths):
+            node = root
+            prefix_node = None
+            for part in [p for p in key_path.split("\\") if p]:
+                if part == "*":
+                    if prefix_node is None:
+                        prefix_node = node
+                    if node.wildcard is None:
+                        node.wildcard = _TrieNode(node.path + "\\*")
+                    node = node.wildcard
+                else:
+                    child = node.literals.get(part.lower())
+                    if child is None:
+                        child = _TrieNode(f"{node.path}\\{part}".lstrip("\\"), part)
+                        node.literals[part.lower()] = child
+                    node = child
+            node.targets.append((artifact_index, pattern_index))
+            # Desenin joker karaktere kadarki sabit kısmı; bulunamazsa raporlanır
+            prefixes[(artifact_index, pattern_index)] = prefix_node or node
+    return root, prefixes
+
+
+def _subtree_targets(node):
+    """ Düğümün ve altındaki tüm düğümlerin hedefleri. """
+    targets = list(node.targets)
+    for child in list(node.literals.values()) + ([node.wildcard] if node.wildcard is not None else []):
+        targets.extend(_subtree_targets(child))
+    return targets
+
+
+def _key_label(key, node):
+    """ Hata mesajlarında anahtarın yolu; kökte desen yolu boştur, anahtarın kendi yolu kullanılır. """
+    path = node.path.lstrip("\\")
+    if path:
+        return path
+    try:
+        return key.path()
+    except Exception:
+        return "hive kökü"
+
+
+def _read_values(key, names):
+    if not names:
+        return {}, None
+    all_values = key.values()
+    values = {}
+    for registry_value in all_values:
+        values.setdefault(registry_value.name().lower(), registry_value)
+    if "*" in names:
+        return values, all_values
+    return {name.lower(): values[name.lower()] for name in names if name.lower() in values}, None
+
+
+def scan_hive(root_key, artifacts, open_key=None, counters=None):
+    """
+    Hive'ı kökten itibaren tek geçişte gezer; yalnızca en az bir artefaktın
+    deseninin uzandığı dallara iner. Her anahtarın alt anahtar listesi ve
+    değer listesi en fazla bir kez okunur.
+    open_key verilirse (ör. HiveSession.open_key) desenlerin joker içermeyen
+    sabit önekleri önbellekli yol çözümüyle açılır.
+    counters verilirse "keys" (ziyaret edilen anahtar) ve "matches" (desene
+    uyan anahtar) sayaçları artırılır.
+
+    Dönüş: (rows, missing, failed)
+      rows:    {(artefakt indeksi, desen indeksi): [satır, ...]}
+      missing: sabit kısmı hive'da bulunamayan desenlerin sabit yolları
+               {(artefakt indeksi, desen indeksi): yol}
+      failed:  alt anahtarları okunamayan (ör. bozuk hive kökü) dallardaki
+               desenler {(artefakt indeksi, desen indeksi): hata mesajı};
+               bunların satırları eksiktir ve missing'de yer almazlar
+    """
+    trie, prefixes = _build_trie(artifacts)
+    rows = {target: [] for target in prefixes}
+    reached = set()
+    failed = {}
+    counters = counters if counters is not None else {}
+    counters.setdefault("keys", 0)
+    counters.setdefault("matches", 0)
+
+    def visit(key, states):
+        counters["keys"] += 1
+        for node, captures in states:
+            reached.add(id(node))
+            if node.targets:
+                counters["matches"] += 1
+                wanted = set()
+                for artifact_index, _ in node.targets:
+                    wanted.update(artifacts[artifact_index].values)
+                try:
+                    values, all_values = _read_values(key, wanted)
+                except Exception:
+                    values, all_values = {}, []
+                for target in node.targets:
+                    match = KeyMatch(key, captures, values, all_values)
+                    try:
+                        rows[target].extend(artifacts[target[0]].build_rows(match))
+                    except Exception:
+                        continue
+        if not any(node.literals or node.wildcard for node, _ in states):
+            return
+        if open_key is not None and not any(node.wildcard for node, _ in states):
+            for node, captures in states:
+                for literal in node.literals.values():
+                    try:
+                        # Joker altındaki yollar hive'da tek bir anahtarı göstermez
+                        subkey = key.subkey(literal.name) if "*" in literal.path else open_key(literal.path)
+                    except Exception:
+                        continue
+                    visit(subkey, [(literal, captures)])
+            return
+        try:
+            subkeys = key.subkeys()
+        except Exception as e:
+            message = f"{_key_label(key, states[0][0])} okunurken hata oluştu: {e}"
+            print(message)
+            for node, _ in states:
+                for target in _subtree_targets(node):
+                    failed.setdefault(target, message)
+            return
+        for subkey in subkeys:
+            name = subkey.name()
+            lowered = name.lower()
+            next_states = []
+            for node, captures in states:
+                literal = node.literals.get(lowered)
+                if literal is not None:
+                    next_states.append((literal, captures))
+                if node.wildcard is not None:
+                    next_states.append((node.wildcard, captures + (name,)))
+            if next_states:
+                visit(subkey, next_states)
+
+    visit(root_key, [(trie, ())])
+    missing = {target: node.path for target, node in prefixes.items()
+               if id(node) not in reached and target not in failed}
+    return rows, missing, failed
+
+
+class KeyPathMatcher:
+    """
+    Hive'ı gezmeden, tek tek gelen anahtarları (ör. kurtarılan silinmiş
+    anahtarlar) artefakt desenleriyle eşler. Yollar kök anahtarın adı
+    olmadan verilir (ör. ControlSet001\\Enum\\USBSTOR\\Disk&Ven_X\\123).
+    """
+    def __init__(self, artifacts):
+        self.artifacts = list(artifacts)
+        self._trie, _ = _build_trie(self.artifacts)
+
+    def match(self, key_path):
+        """ Yola uyan desenler: [((artefakt indeksi, desen indeksi), captures), ...] """
+        states = [(self._trie, ())]
+        for part in [p for p in key_path.split("\\") if p]:
+            next_states = []
+            for node, captures in states:
+                literal = node.literals.get(part.lower())
+                if literal is not None:
+                    next_states.append((literal, captures))
+                if node.wildcard is not None:
+                    next_states.append((node.wildcard, captures + (part,)))
+            if not next_states:
+                return []
+            states = next_states
+        return [(target, captures) for node, captures in states for target in node.targets]
+
+    def build_rows(self, key, key_path):
+        """
+        Anahtar için scan_hive'daki gibi satırları üretir.
+        Dönüş: {(artefakt indeksi, desen indeksi): [satır, ...]}; eşleşme yoksa boş.
+        """
+        matches = self.match(key_path)
+        if not matches:
+            return {}
+        wanted = set()
+        for (artifact_index, _), _ in matches:
+            wanted.update(self.artifacts[artifact_index].values)
+        try:
+            values, all_values = _read_values(key, wanted)
+        except Exception:
+            values, all_values = {}, []
+        rows = {}
+        for target, captures in matches:
+            try:
+                rows[target] = list(self.artifacts[target[0]].build_rows(KeyMatch(key, captures, values, all_values)))
+            except Exception:
+                continue
+        return rows
+
+
+def build_frames(artifacts, rows):
+    """
+    scan_hive çıktısından artefakt başına bir DataFrame üretir. Birden fazla
+    deseni olan artefaktlarda satırlar desenlerin bildirildiği sırayla birleşir.
+    """
+    frames = {}
+    for artifact_index, artifact in enumerate(artifacts):
+        artifact_rows = []
+        for pattern_index in range(len(artifact.key_paths)):
+            artifact_rows.extend(rows.get((artifact_index, pattern_index), []))
+        if artifact.build_frame is not None:
+            df = artifact.build_frame(artifact_rows)
+        else:
+            df = pd.DataFrame(artifact_rows, columns=artifact.columns)
+        if artifact.categorical:
+            df = columnar.categorize(df, artifact.categorical)
+        if artifact.finalize is not None:
+            df = artifact.finalize(df)
+        frames[artifact.name] = df
+    return frames
@@ -0,0 +1,328 @@
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import columnar
+import evtx_checkpoint
+import exporter
+import logon_analytics
+import parser_metrics
+import registry_parser
+import result_cache
+import timeline
+
+
+# Vaka klasöründeki kanıt dosyaları ve her birinden üretilen kategoriler.
+# Dosya adı None olan kaynak kullanıcı hive'larıdır (kök ve Users\*\NTUSER.DAT).
+# Oturum logları için Security.evtx, Archive-Security-*.evtx ve alt klasörlerdeki
+# loglar birlikte okunur (registry_parser.discover_security_logs).
+CASE_SOURCES = [
+    ("Oturum Logları", "Security.evtx", None),
+    ("SYSTEM", "SYSTEM", registry_parser.SYSTEM_ARTIFACTS),
+    ("SOFTWARE", "SOFTWARE", registry_parser.SOFTWARE_ARTIFACTS),
+    ("Kullanıcı Profilleri", None, registry_parser.NTUSER_ARTIFACTS),
+]
+OUTPUT_FORMATS = tuple(exporter.FORMATS)
+# --carve: Security logları, SYSTEM ve SOFTWARE üzerinde silinmiş kayıt kurtarma
+CARVE_JOB = "Silinmiş Kayıt Kurtarma"
+
+
+def _category_names(job_name, artifacts):
+    if job_name == CARVE_JOB:
+        return list(registry_parser.CARVED_CATEGORIES)
+    if artifacts is None:
+        return ["Oturum Logları", *logon_analytics.ANALYTICS_CATEGORIES]
+    return [a.name for a in artifacts]
+
+
+def _with_logon_analytics(df):
+    """ Oturum tablosunu özet kategorileriyle (logon_analytics) birlikte döndürür. """
+    if df is None:
+        return {name: None for name in _category_names("Oturum Logları", None)}
+    return {"Oturum Logları": df, **logon_analytics.analyze_logon_frame(df)}
+
+
+def _stream_logon_events(source_paths, output_dir, output_format, metrics, keep=False):
+    """
+    Oturum loglarını parça parça okuyup doğrudan yazar (exporter.write_batches);
+    özet kategoriler parçalar geçerken hesaplanır (logon_analytics.LogonAggregator).
+    Olay tablosu bellekte tutulmaz; keep=True ise (zaman çizelgesi için) parçalar
+    birleştirilip döndürülür.
+    Dönüş: {kategori: (dosya yolu, satır sayısı, DataFrame ya da None)}
+    """
+    aggregator = logon_analytics.LogonAggregator()
+    batches = aggregator.observe(registry_parser.iter_logon_event_batches(source_paths, batch_size=exporter.CHUNK_ROWS,
+                                                                          metrics=metrics))
+    kept = []
+    if keep:
+        batches = (kept.append(df) or df for df in batches)
+    empty_frame = registry_parser.logon_column_buffer().to_frame()
+    path, rows = exporter.write_batches(batches, output_dir / exporter.file_slug("Oturum Logları"), output_format,
+                                        empty_frame=empty_frame)
+    logon = (columnar.concat_frames(kept) if kept else empty_frame) if keep else None
+    written = {"Oturum Logları": (path, rows, logon)}
+    for name, df in aggregator.frames().items():
+        written[name] = (exporter.write_frame(df, output_dir / exporter.file_slug(name), output_format), len(df), df)
+    return written
+
+
+def analyze_case(case_folder, output_dir, output_format, use_cache=False, profile=False, incremental=False,
+                 build_timeline=False, carve=False):
+    """
+    Tek bir vaka klasörünü analiz eder ve kategorileri output_dir altına yazar.
+    Parser çıktıları output_dir/parser.log dosyasına yönlendirilir; kaynak
+    özetleri ve satır sayıları output_dir/manifest.json dosyasına yazılır.
+    Bir kaynağın hatası diğerlerini durdurmaz; durum her kategori için raporlanır.
+    profile=True ise parser'lar cProfile ve tracemalloc ile ölçülür.
+    Oturum logları parça parça okunup yazılır (_stream_logon_events); önbellek
+    (use_cache) ya da artımlı okuma tüm tabloyu sakladığından o durumlarda
+    tablo bellekte kurulur.
+    incremental=True ise Security.evtx kontrol noktasıyla artımlı okunur.
+    build_timeline=True ise tüm kategorilerden zaman çizelgesi de yazılır.
+    carve=True ise silinmiş kayıtlar da kurtarılır (registry_parser.carve_case).
+
+    Dönüş: {"case", "seconds", "bytes", "rows", "categories": {ad: durum}, "metrics": [...]}
+      durum: satır sayısı (int) veya "eksik dosya" / "hata: ..." metni
+      metrics: parser çalıştırmalarının ölçümleri (ParserRun.to_dict)
+    """
+    case_folder = Path(case_folder)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache = result_cache.ResultCache() if use_cache else None
+    metrics = parser_metrics.MetricsCollector(profile=profile, trace_memory=profile)
+    summary = {"case": str(case_folder), "seconds": 0.0, "bytes": 0, "rows": 0, "categories": {}, "metrics": []}
+    started = time.perf_counter()
+    session = registry_parser.HiveSession()
+    log = io.StringIO()
+    case_frames = {}
+    manifest = exporter.ExportManifest(output_format, case_folder)
+    try:
+        for job_name, file_name, artifacts in CASE_SOURCES + ([(CARVE_JOB, None, None)] if carve else []):
+            if job_name == CARVE_JOB:
+                source_paths = registry_parser.discover_security_logs(case_folder)
+                source_paths += [path for path in (case_folder / "SYSTEM", case_folder / "SOFTWARE") if path.is_file()]
+            elif file_name is None:
+                source_paths = [path for _, path in registry_parser.discover_user_hives(case_folder)]
+            elif artifacts is None:
+                source_paths = registry_parser.discover_security_logs(case_folder)
+            else:
+                source_paths = [case_folder / file_name] if (case_folder / file_name).is_file() else []
+            if not source_paths:
+                for name in _category_names(job_name, artifacts):
+                    summary["categories"][name] = "eksik dosya"
+                    manifest.add_failure(name, "eksik dosya")
+                continue
+            summary["bytes"] += sum(path.stat().st_size for path in source_paths)
+            source_path = source_paths[0]
+
+            if artifacts is None and job_name != CARVE_JOB and not use_cache and not (incremental and len(source_paths) == 1):
+                try:
+                    with contextlib.redirect_stdout(log):
+                        written = _stream_logon_events(source_paths, output_dir, output_format, metrics,
+                                                       keep=build_timeline)
+                except Exception as e:
+                    for name in _category_names(job_name, artifacts):
+                        summary["categories"][name] = f"hata: {e}"
+                        manifest.add_failure(name, str(e), source_paths)
+                    continue
+                for name, (path, rows, df) in written.items():
+                    manifest.add_category(name, path, rows, source_paths)
+                    summary["categories"][name] = rows
+                    summary["rows"] += rows
+                    if df is not None:
+                        case_frames[name] = df
+                continue
+
+            if job_name == CARVE_JOB:
+                # Vakalar zaten süreç havuzunda; şeritler vaka içinde sırayla taranır
+                parse = lambda: registry_parser.carve_case(case_folder, workers=1, metrics=metrics)
+            elif file_name is None:
+                # Vakalar zaten süreç havuzunda; profiller vaka içinde sırayla taranır
+                parse = lambda: registry_parser.parse_user_profiles(case_folder, workers=1, metrics=metrics)
+            elif artifacts is None and incremental and len(source_paths) == 1:
+                # Kontrol noktası tek bir log içindir; birden fazla log her seferinde birleştirilir
+                parse = lambda: _with_logon_analytics(registry_parser.parse_security_log_incremental(
+                    source_path, evtx_checkpoint.EvtxCheckpointStore(), metrics=metrics))
+            elif artifacts is None:
+                parse = lambda: _with_logon_analytics(registry_parser.parse_security_log(source_paths,
+                                                                                         metrics=metrics))
+            else:
+                parse = lambda: registry_parser.parse_hive_artifacts(source_path, artifacts, session=session,
+                                                                     metrics=metrics)
+            try:
+                with contextlib.redirect_stdout(log):
+                    frames = cache.cached(job_name, source_paths, parse) if cache else parse()
+            except Exception as e:
+                for name in _category_names(job_name, artifacts):
+                    summary["categories"][name] = f"hata: {e}"
+                    manifest.add_failure(name, str(e), source_paths)
+                continue
+
+            for name, df in frames.items():
+                if df is None:
+                    summary["categories"][name] = "hata: dosya analiz edilemedi"
+                    manifest.add_failure(name, "dosya analiz edilemedi", source_paths)
+                    continue
+                try:
+                    path = exporter.write_frame(df, output_dir / exporter.file_slug(name), output_format)
+                except Exception as e:
+                    summary["categories"][name] = f"hata: yazılamadı ({e})"
+                    manifest.add_failure(name, f"yazılamadı ({e})", source_paths)
+                    continue
+                manifest.add_category(name, path, len(df), source_paths)
+                summary["categories"][name] = len(df)
+                summary["rows"] += len(df)
+                case_frames[name] = df
+
+        # USB cihaz geçmişi: SYSTEM (ve varsa SOFTWARE) tablolarının seri numarasıyla birleşimi
+        history_sources = [path for path in (case_folder / "SYSTEM", case_folder / "SOFTWARE") if path.is_file()]
+        if registry_parser.USBSTOR_ARTIFACT.name not in case_frames:
+            summary["categories"][registry_parser.USB_HISTORY_CATEGORY] = "eksik dosya"
+            manifest.add_failure(registry_parser.USB_HISTORY_CATEGORY, "SYSTEM tabloları yok", history_sources)
+        else:
+            try:
+                history = registry_parser.build_device_history(case_frames)
+                path = exporter.write_frame(history, output_dir / exporter.file_slug(
+                    registry_parser.USB_HISTORY_CATEGORY), output_format)
+                summary["categories"][registry_parser.USB_HISTORY_CATEGORY] = len(history)
+                summary["rows"] += len(history)
+                manifest.add_category(registry_parser.USB_HISTORY_CATEGORY, path, len(history), history_sources)
+                case_frames[registry_parser.USB_HISTORY_CATEGORY] = history
+            except Exception as e:
+                summary["categories"][registry_parser.USB_HISTORY_CATEGORY] = f"hata: {e}"
+                manifest.add_failure(registry_parser.USB_HISTORY_CATEGORY, str(e), history_sources)
+
+        if build_timeline:
+            try:
+                events = timeline.Timeline.from_frames(case_frames).frame
+                path = exporter.write_frame(events, output_dir / exporter.file_slug(timeline.TIMELINE_CATEGORY),
+                                            output_format)
+                summary["categories"][timeline.TIMELINE_CATEGORY] = len(events)
+                manifest.add_category(timeline.TIMELINE_CATEGORY, path, len(events), list(manifest.sources))
+            except Exception as e:
+                summary["categories"][timeline.TIMELINE_CATEGORY] = f"hata: {e}"
+                manifest.add_failure(timeline.TIMELINE_CATEGORY, str(e))
+        manifest.write(output_dir)
+    finally:
+        session.close()
+        (output_dir / "parser.log").write_text(log.getvalue(), encoding="utf-8")
+    summary["seconds"] = time.perf_counter() - started
+    summary["metrics"] = metrics.to_dict()["runs"]
+    return summary
+
+
+def expand_case_folders(patterns, list_file=None):
+    """ Komut satırındaki klasörleri/glob desenlerini ve liste dosyasını çözer. """
+    entries = list(patterns)
+    if list_file:
+        with open(list_file, "r", encoding="utf-8") as f:
+            entries.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    folders = []
+    for entry in entries:
+        matches = sorted(glob.glob(entry, recursive=True)) if glob.has_magic(entry) else [entry]
+        folders.extend(Path(m) for m in matches if Path(m).is_dir() or not glob.has_magic(entry))
+    # Aynı klasör iki kez verilirse bir kez işlenir
+    return list(dict.fromkeys(folders))
+
+
+def _output_dirs(folders, output_root):
+    """ Her vakaya klasör adından çıktı dizini atar; aynı adlar numaralandırılır. """
+    used = {}
+    dirs = []
+    for folder in folders:
+        name = folder.resolve().name or "vaka"
+        used[name] = used.get(name, 0) + 1
+        dirs.append(Path(output_root) / (name if used[name] == 1 else f"{name}_{used[name]}"))
+    return dirs
+
+
+def _print_case(summary):
+    failures = {n: s for n, s in summary["categories"].items() if not isinstance(s, int)}
+    state = "TAMAM" if not failures else "SORUNLU"
+    print(f"[{state}] {summary['case']}: {summary['rows']} satır, {summary['seconds']:.2f} sn")
+    for name, status in failures.items():
+        print(f"    - {name}: {status}")
+
+
+def run_batch(folders, output_root, output_format="parquet", jobs=None, use_cache=False, profile=False,
+              incremental=False, build_timeline=False, carve=False):
+    """
+    Vaka klasörlerini bir süreç havuzunda analiz eder. Çöken bir vaka
+    diğerlerini durdurmaz; sonuç özetleri vaka sırasıyla döndürülür.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    summaries = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(analyze_case, folder, out_dir, output_format, use_cache, profile, incremental,
+                                   build_timeline, carve)
+                   for folder, out_dir in zip(folders, _output_dirs(folders, output_root))]
+        for folder, future in zip(folders, futures):
+            try:
+                summary = future.result()
+            except Exception as e:
+                # Süreç çökmesi vb.: vaka tamamen başarısız sayılır
+                summary = {"case": str(folder), "seconds": 0.0, "bytes": 0, "rows": 0,
+                           "categories": {"(vaka)": f"hata: {e}"}, "metrics": []}
+            _print_case(summary)
+            summaries.append(summary)
+    return summaries
+
+
+def print_throughput(summaries, wall_seconds):
+    cases = len(summaries)
+    failed = sum(1 for s in summaries if any(not isinstance(v, int) for v in s["categories"].values()))
+    rows = sum(s["rows"] for s in summaries)
+    mb = sum(s["bytes"] for s in summaries) / (1024 * 1024)
+    wall = max(wall_seconds, 1e-9)
+    print("-" * 50)
+    print(f"Vaka: {cases} (sorunlu: {failed})")
+    print(f"Satır: {rows}   Girdi: {mb:.1f} MB   Süre: {wall_seconds:.2f} sn")
+    print(f"Hız: {cases / wall:.2f} vaka/sn, {rows / wall:.0f} satır/sn, {mb / wall:.1f} MB/sn")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vaka klasörlerini arayüz olmadan toplu analiz eder.")
+    parser.add_argument("cases", nargs="*", help="Vaka klasörleri veya glob desenleri (ör. 'vakalar/*')")
+    parser.add_argument("--list", dest="list_file", help="Her satırında bir vaka klasörü olan dosya")
+    parser.add_argument("-o", "--output", required=True, help="Çıktı kök dizini (vaka başına bir alt dizin)")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS, default="parquet", help="Çıktı biçimi")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Paralel süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--cache", action="store_true", help="Sonuç önbelleğini kullan (result_cache)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Security.evtx'i kontrol noktasından devam ederek yalnızca yeni kayıtlar için oku "
+                             "(vakada tek Security logu varsa)")
+    parser.add_argument("--timeline", action="store_true",
+                        help="Tüm kategorileri birleştiren zaman çizelgesini de yaz")
+    parser.add_argument("--carve", action="store_true",
+                        help="Loglarda ve hive'larda silinmiş kayıtları da kurtar (imza taraması; yavaş)")
+    parser.add_argument("--metrics", help="Vaka ve parser ölçümlerini bu JSON dosyasına yaz")
+    parser.add_argument("--profile", action="store_true",
+                        help="Parser'ları cProfile/tracemalloc ile ölç (yavaş; --metrics raporuna eklenir)")
+    args = parser.parse_args(argv)
+
+    folders = expand_case_folders(args.cases, args.list_file)
+    if not folders:
+        parser.error("Analiz edilecek vaka klasörü bulunamadı.")
+
+    started = time.perf_counter()
+    summaries = run_batch(folders, args.output, args.format, args.jobs, args.cache, args.profile,
+                          args.incremental, args.timeline, args.carve)
+    wall_seconds = time.perf_counter() - started
+    print_throughput(summaries, wall_seconds)
+    if args.metrics:
+        with open(args.metrics, "w", encoding="utf-8") as f:
+            json.dump({"wall_seconds": wall_seconds, "cases": summaries}, f, indent=2, ensure_ascii=False)
+        print(f"Ölçüm raporu yazıldı: {args.metrics}")
+    failed = any(not isinstance(v, int) for s in summaries for v in s["categories"].values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Pencere açılmadan önce yüklenmemesi gereken ağır modüller
+DEFERRED_MODULES = ("pandas", "numpy", "pyarrow", "Evtx", "Registry", "xml.etree.ElementTree")
+DEFAULT_IMPORT_BUDGET_MS = 150
+DEFAULT_WINDOW_BUDGET_MS = 250
+
+# Boş ana pencerenin gösterilene kadar geçen süresi (import dahil)
+_WINDOW_SCRIPT = """
+import time
+started = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+import main_gui
+app = QApplication([])
+window = main_gui.ForensicAnalyzerApp()
+window.show()
+app.processEvents()
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def _run(args):
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    return subprocess.run([sys.executable] + args, cwd=REPO_ROOT, env=env, capture_output=True, text=True,
+                          check=True)
+
+
+def parse_importtime(stderr):
+    """
+    '-X importtime' çıktısını okur. Dönüş: [(modül, kendi µs, toplam µs, derinlik), ...]
+    yükleme sırasıyla; derinlik 0 doğrudan import edilen modüldür.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(own), int(cumulative), depth))
+    return rows
+
+
+def measure_import(module="main_gui", repeat=5):
+    """
+    'python -X importtime -c "import module"' komutunu repeat kez çalıştırır
+    (ilki .pyc önbelleğini ısıtır) ve en hızlı çalıştırmanın ayrıntısını döndürür.
+    """
+    best = None
+    for _ in range(repeat + 1):
+        rows = parse_importtime(_run(["-X", "importtime", "-c", f"import {module}"]).stderr)
+        total = next(cumulative for name, _, cumulative, depth in rows if name == module and depth == 0)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    total, rows = best
+    loaded = {name for name, *_ in rows}
+    return {
+        "import_ms": total / 1000,
+        "deferred_loaded": [name for name in DEFERRED_MODULES if name in loaded],
+        "slowest": sorted(((name, own / 1000) for name, own, _, _ in rows), key=lambda r: -r[1])[:10],
+    }
+
+
+def measure_window(repeat=5):
+    """ Boş ana pencerenin açılış süresi (ms); repeat çalıştırmanın en iyisi. """
+    return min(float(_run(["-c", _WINDOW_SCRIPT]).stdout.strip().splitlines()[-1]) for _ in range(repeat))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="main_gui'nin açılış (import) süresini ölçer ve bütçeyi aşarsa hata döndürür.")
+    parser.add_argument("--module", default="main_gui", help="Ölçülecek modül")
+    parser.add_argument("--repeat", type=int, default=5, help="Her ölçümün tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--import-budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help="'import main_gui' için izin verilen en uzun süre")
+    parser.add_argument("--window-budget-ms", type=float, default=DEFAULT_WINDOW_BUDGET_MS,
+                        help="Boş pencerenin gösterilmesi için izin verilen en uzun süre (0: ölçme)")
+    parser.add_argument("--json", help="Sonuçları bu JSON dosyasına da yaz")
+    args = parser.parse_args(argv)
+
+    result = measure_import(args.module, args.repeat)
+    print(f"import {args.module}: {result['import_ms']:.1f} ms (bütçe {args.import_budget_ms:.0f} ms)")
+    print("En yavaş modüller (kendi süresi):")
+    for name, own_ms in result["slowest"]:
+        print(f"    {name:<40} {own_ms:>8.1f} ms")
+    if args.window_budget_ms:
+        result["window_ms"] = measure_window(args.repeat)
+        print(f"Pencere açılışı: {result['window_ms']:.1f} ms (bütçe {args.window_budget_ms:.0f} ms)")
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    failures = []
+    if result["deferred_loaded"]:
+        failures.append(f"açılışta yüklenmemesi gereken modüller yüklendi: {', '.join(result['deferred_loaded'])}")
+    if result["import_ms"] > args.import_budget_ms:
+        failures.append(f"import süresi bütçeyi aştı: {result['import_ms']:.1f} > {args.import_budget_ms:.0f} ms")
+    if args.window_budget_ms and result["window_ms"] > args.window_budget_ms:
+        failures.append(f"pencere açılışı bütçeyi aştı: {result['window_ms']:.1f} > {args.window_budget_ms:.0f} ms")
+    for failure in failures:
+        print(f"GERİLEME: {failure}")
+    if not failures:
+        print("Açılış süresi bütçe içinde.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Depo kökündeki modüller (registry_parser vb.) doğrudan import edilebilsin
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import logon_analytics
+import registry_parser
+from benchmarks import synthetic_evtx, synthetic_hive
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+# --- Sentetik veri
+def build_fixtures(folder, n_logon, n_noise, n_usbstor, n_uninstall, n_user_assist, n_networks, seed=0):
+    """ Bir vaka klasörü düzeninde (Security.evtx, SYSTEM, SOFTWARE, NTUSER.DAT) veri üretir. """
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    synthetic_evtx.write_evtx(folder / "Security.evtx", n_logon, n_noise, seed=seed)
+    synthetic_hive.build_system_hive(folder / "SYSTEM", n_usbstor, seed=seed)
+    synthetic_hive.build_software_hive(folder / "SOFTWARE", n_uninstall, n_networks, seed=seed,
+                                      n_usbstor=n_usbstor)
+    synthetic_hive.build_ntuser_hive(folder / "NTUSER.DAT", n_user_assist, seed=seed)
+    return folder
+
+
+def _row_count(result):
+    if result is None:
+        return 0
+    if isinstance(result, dict):
+        return sum(_row_count(v) for v in result.values())
+    if isinstance(result, tuple):
+        return sum(_row_count(v) for v in result)
+    return len(result)
+
+
+# --- Ölçüm
+def measure(fn, repeat=3):
+    """
+    fn'i repeat kez çalıştırır; en iyi duvar süresini, satır sayısını ve
+    (ayrı bir çalıştırmada, tracemalloc ile) Python tarafındaki tepe belleği döndürür.
+    Alt süreçlerde (workers > 1) ayrılan bellek tepe değere dahil değildir.
+    """
+    best = None
+    rows = 0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            gc.collect()
+            started = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - started
+            rows = _row_count(result)
+            del result
+            best = elapsed if best is None else min(best, elapsed)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        "wall_seconds": best,
+        "records": rows,
+        "records_per_sec": rows / best if best else 0.0,
+        "peak_mb": peak / (1024 * 1024),
+    }
+
+
+def _stream_logon_analytics(evtx_path):
+    """ Oturum olaylarını parça parça okuyup yalnızca özet kategorileri tutar (satırlar biriktirilmez). """
+    aggregator = logon_analytics.LogonAggregator()
+    for _ in aggregator.observe(registry_parser.iter_logon_event_batches(evtx_path)):
+        pass
+    return aggregator.frames()
+
+
+def parser_benchmarks(case, workers):
+    """ (ad, fonksiyon) çiftleri; her çalıştırma hive'ları yeniden açar. """
+    benchmarks = [
+        ("parse_security_log", lambda: registry_parser.parse_security_log(case / "Security.evtx")),
+        ("logon_analytics[akış]", lambda: _stream_logon_analytics(case / "Security.evtx")),
+        ("parse_usb_devices", lambda: registry_parser.parse_usb_devices(case / "SYSTEM")),
+        ("parse_installed_programs", lambda: registry_parser.parse_installed_programs(case / "SOFTWARE")),
+        ("parse_network_list", lambda: registry_parser.parse_network_list(case / "SOFTWARE")),
+        ("parse_user_assist", lambda: registry_parser.parse_user_assist(case / "NTUSER.DAT")),
+        ("parse_hive_artifacts[SOFTWARE]", lambda: registry_parser.parse_hive_artifacts(
+            case / "SOFTWARE", registry_parser.SOFTWARE_ARTIFACTS)),
+        # Canlı logda yalnızca imza taraması; kurtarılacak kayıt yoksa disk okuma hızına yakın olmalı
+        ("carve_security_log", lambda: registry_parser.carve_security_log(case / "Security.evtx")),
+        ("carve_hive_artifacts[SYSTEM]", lambda: registry_parser.carve_hive_artifacts(case / "SYSTEM")),
+    ]
+    if workers > 1:
+        benchmarks.insert(1, (f"parse_security_log[workers={workers}]", lambda: registry_parser.parse_security_log(
+            case / "Security.evtx", workers=workers)))
+    return benchmarks
+
+
+def gui_table_benchmarks(frames):
+    """
+    Her kategori için tabloya DataFrame yükleme süresi (model değişimi,
+    örneklemeli sütun genişliği ve ilk ekran hücrelerinin biçimlendirilmesi).
+    PyQt5 yoksa boş liste döner.
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication, QTableView, QHeaderView
+        from dataframe_model import DataFrameModel
+    except ImportError:
+        print("PyQt5 bulunamadı; arayüz tablo ölçümleri atlanıyor.")
+        return []
+    app = QApplication.instance() or QApplication([])
+    view = QTableView()
+    model = DataFrameModel()
+    view.setModel(model)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    view.horizontalHeader().setResizeContentsPrecision(200)
+    view.resize(1200, 800)
+
+    def populate(df):
+        model.setDataFrame(df)
+        view.resizeColumnsToContents()
+        for row in range(min(50, model.rowCount())):
+            for column in range(model.columnCount()):
+                model.data(model.index(row, column))
+        app.processEvents()
+        return df
+
+    return [(f"gui_table[{name}]", lambda df=df: populate(df)) for name, df in frames.items() if df is not None]
+
+
+# --- Karşılaştırma
+def compare(results, baseline, tolerance):
+    """ Süre veya tepe bellek baseline'dan tolerance oranından fazla kötüleşirse gerilemedir. """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current["wall_seconds"] > previous["wall_seconds"] * (1 + tolerance):
+            regressions.append((name, "wall_seconds", previous["wall_seconds"], current["wall_seconds"]))
+        if current["peak_mb"] > previous["peak_mb"] * (1 + tolerance) + 1:
+            regressions.append((name, "peak_mb", previous["peak_mb"], current["peak_mb"]))
+    return regressions
+
+
+def print_table(results, baseline):
+    print(f"{'ölçüm':<48} {'kayıt':>9} {'kayıt/sn':>11} {'süre (sn)':>10} {'tepe MB':>9} {'fark':>8}")
+    for name, r in results.items():
+        change = ""
+        if name in baseline and baseline[name]["wall_seconds"]:
+            change = f"{(r['wall_seconds'] / baseline[name]['wall_seconds'] - 1) * 100:+.0f}%"
+        print(f"{name:<48} {r['records']:>9} {r['records_per_sec']:>11.0f} {r['wall_seconds']:>10.3f} "
+              f"{r['peak_mb']:>9.1f} {change:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parser ve tablo performansını sentetik verilerle ölçer.")
+    parser.add_argument("--logons", type=int, default=20000, help="EVTX'teki oturum olayı sayısı")
+    parser.add_argument("--noise", type=int, default=20000, help="EVTX'teki ilgisiz olay sayısı")
+    parser.add_argument("--usbstor", type=int, default=2000, help="USBSTOR seri numarası sayısı")
+    parser.add_argument("--uninstall", type=int, default=2000, help="Uninstall girdisi sayısı")
+    parser.add_argument("--user-assist", type=int, default=2000, help="UserAssist değeri sayısı")
+    parser.add_argument("--networks", type=int, default=500, help="Ağ profili sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçümün tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Paralel EVTX ölçümü için süreç sayısı")
+    parser.add_argument("--fixtures", help="Sentetik verinin yazılacağı/okunacağı klasör (varsayılan: geçici)")
+    parser.add_argument("--no-gui", action="store_true", help="Arayüz tablo ölçümlerini atla")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Bu çalıştırmayı baseline olarak kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Gerileme sayılacak göreli kötüleşme")
+    parser.add_argument("--json", help="Sonuçları bu JSON dosyasına da yaz")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="registry_bench_") as tmp:
+        case = Path(args.fixtures or tmp)
+        if not (case / "Security.evtx").exists():
+            print(f"Sentetik veri üretiliyor: {case}")
+            build_fixtures(case, args.logons, args.noise, args.usbstor, args.uninstall,
+                           args.user_assist, args.networks)
+
+        results = {}
+        for name, fn in parser_benchmarks(case, args.workers):
+            results[name] = measure(fn, args.repeat)
+        if not args.no_gui:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                frames = {"Oturum Logları": registry_parser.parse_security_log(case / "Security.evtx")}
+                for hive, artifacts in (("SYSTEM", registry_parser.SYSTEM_ARTIFACTS),
+                                        ("SOFTWARE", registry_parser.SOFTWARE_ARTIFACTS),
+                                        ("NTUSER.DAT", registry_parser.NTUSER_ARTIFACTS)):
+                    frames.update(registry_parser.parse_hive_artifacts(case / hive, artifacts))
+            for name, fn in gui_table_benchmarks(frames):
+                results[name] = measure(fn, args.repeat)
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("results", {})
+    print_table(results, baseline)
+
+    report = {"python": platform.python_version(), "machine": platform.machine(),
+              "cpu_count": os.cpu_count(), "results": results}
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Baseline kaydedildi: {baseline_path}")
+        return 0
+    if not baseline:
+        print("Baseline bulunamadı; karşılaştırma için önce --save-baseline ile çalıştırın.")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, metric, before, after in regressions:
+        print(f"GERİLEME: {name} {metric}: {before:.3f} -> {after:.3f}")
+    if not regressions:
+        print(f"Baseline ile karşılaştırıldı; %{args.tolerance * 100:.0f} toleransın üzerinde gerileme yok.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+import binascii
+import random
+import struct
+from datetime import datetime, timedelta, UTC
+
+EPOCH_AS_FILETIME = 116444736000000000
+CHUNK_SIZE = 0x10000
+HEADER_SIZE = 0x1000
+NS = "http://schemas.microsoft.com/win/2004/08/events/event"
+
+
+def _to_filetime(dt):
+    return EPOCH_AS_FILETIME + int((dt - datetime(1970, 1, 1, tzinfo=UTC)).total_seconds() * 10_000_000)
+
+
+def _name(text):
+    enc = text.encode("utf-16le")
+    return struct.pack("<IHH", 0, 0, len(text)) + enc + b"\x00\x00"
+
+
+class _Tpl:
+    """ BinXml şablon gövdesini chunk içi ofsetlerle yazar. """
+    def __init__(self, chunk_base):
+        self.buf = bytearray()
+        self.base = chunk_base  # chunk-relative offset of buf[0]
+
+    def rel(self):
+        return self.base + len(self.buf)
+
+    def element(self, tag, attrs=(), content=None):
+        # content: ("norm"/"cond", indeks, tür) | çocuk eleman fonksiyonları listesi | None
+        flag = 0x41 if attrs else 0x01
+        start = len(self.buf)
+        self.buf += struct.pack("<BHI", flag, 0xFFFF, 0)
+        self.buf += struct.pack("<I", self.rel() + 4)
+        self.buf += _name(tag)
+        if attrs:
+            size_pos = len(self.buf)
+            self.buf += struct.pack("<I", 0)
+            attr_start = len(self.buf)
+            for i, (aname, aval) in enumerate(attrs):
+                more = i < len(attrs) - 1
+                self.buf += struct.pack("<B", 0x46 if more else 0x06)
+                self.buf += struct.pack("<I", self.rel() + 4)
+                self.buf += _name(aname)
+                self._content(aval)
+            struct.pack_into("<I", self.buf, size_pos, len(self.buf) - attr_start)
+        if content is None:
+            self.buf += b"\x03"
+        else:
+            self.buf += b"\x02"
+            if isinstance(content, list):
+                for child in content:
+                    child()
+            else:
+                self._content(content)
+            self.buf += b"\x04"
+        struct.pack_into("<I", self.buf, start + 3, len(self.buf) - start - 7)
+
+    def _content(self, val):
+        if isinstance(val, tuple):
+            kind, index, type_ = val
+            self.buf += struct.pack("<BHB", 0x0E if kind == "cond" else 0x0D, index, type_)
+        else:
+            self.buf += struct.pack("<BBH", 0x05, 0x01, len(val)) + val.encode("utf-16le")
+
+
+LOGON_FIELDS = ["SubjectUserName", "TargetUserName", "LogonType", "IpAddress"]
+NOISE_FIELDS = ["ProcessName"]
+
+
+def _template_body(chunk_rel_data, fields):
+    t = _Tpl(chunk_rel_data)
+    t.buf += b"\x0f\x01\x01\x00"
+    sys_children = [
+        lambda: t.element("EventID", content=("norm", 0, 0x06)),
+        lambda: t.element("TimeCreated", attrs=[("SystemTime", ("norm", 1, 0x11))]),
+        lambda: t.element("EventRecordID", content=("norm", 2, 0x0A)),
+        lambda: t.element("Computer", content=("norm", 3, 0x01)),
+    ]
+    data_children = [
+        (lambda i=i, f=f: t.element("Data", attrs=[("Name", f)], content=("cond", 4 + i, 0x01)))
+        for i, f in enumerate(fields)
+    ]
+    t.element("Event", attrs=[("xmlns", NS)], content=[
+        lambda: t.element("System", content=sys_children),
+        lambda: t.element("EventData", content=data_children),
+    ])
+    t.buf += b"\x00"
+    return bytes(t.buf)
+
+
+def _record_bytes(chunk_rel, rec_num, ts, event_id, computer, values, template_cache, tkey, fields, tid):
+    head = struct.pack("<IIQQ", 0x2A2A, 0, rec_num, _to_filetime(ts))
+    body = bytearray(b"\x0f\x01\x01\x00")
+    inst_rel = chunk_rel + len(head) + len(body)
+    if tkey in template_cache:
+        body += struct.pack("<BBII", 0x0C, 0x01, tid, template_cache[tkey])
+    else:
+        tpl_rel = inst_rel + 10
+        data = _template_body(tpl_rel + 24, fields)
+        body += struct.pack("<BBII", 0x0C, 0x01, tid, tpl_rel)
+        body += struct.pack("<I", 0) + struct.pack("<I", tid) + b"\x00" * 12 + struct.pack("<I", len(data)) + data
+        template_cache[tkey] = tpl_rel
+    subs = [
+        (0x06, struct.pack("<H", event_id)),
+        (0x11, struct.pack("<Q", _to_filetime(ts))),
+        (0x0A, struct.pack("<Q", rec_num)),
+        (0x01, computer.encode("utf-16le")),
+    ]
+    for v in values:
+        subs.append((0x01, v.encode("utf-16le")) if v else (0x00, b""))
+    body += struct.pack("<I", len(subs))
+    for type_, raw in subs:
+        body += struct.pack("<HBB", len(raw), type_, 0)
+    for _, raw in subs:
+        body += raw
+    rec = bytearray(head + body + b"\x00\x00\x00\x00")
+    struct.pack_into("<I", rec, 4, len(rec))
+    struct.pack_into("<I", rec, len(rec) - 4, len(rec))
+    return bytes(rec)
+
+
+def write_evtx(path, n_logon, n_noise=0, seed=0, computer="WS01.corp.local", start=None):
+    """
+    n_logon oturum olayı (4624/4625/4634/4647) ve n_noise gürültü olayı
+    (4688/4672/5156/4798) içeren, python-evtx ile okunabilen bir EVTX yazar.
+    Her chunk'ta iki şablon tanımlanır; sonraki kayıtlar bunlara başvurur.
+    Olaylar seed ile karıştırılır; yazılan kayıt sayısını döndürür.
+    """
+    rnd = random.Random(seed)
+    start = start or datetime(2024, 1, 1, tzinfo=UTC)
+    kinds = ["logon"] * n_logon + ["noise"] * n_noise
+    rnd.shuffle(kinds)
+    chunks = []
+    chunk = None
+    rec_num = 1
+    ts = start
+
+    def new_chunk():
+        return {"buf": bytearray(CHUNK_SIZE), "ofs": 0x200, "first": rec_num, "last": rec_num, "last_ofs": 0x200, "tpl": {}}
+
+    for kind in kinds:
+        ts = ts + timedelta(seconds=rnd.randint(1, 90))
+        if kind == "logon":
+            eid = rnd.choice([4624, 4624, 4625, 4634, 4647])
+            values = [
+                "SYSTEM" if rnd.random() < 0.3 else "",
+                rnd.choice(["alice", "bob", "carol", "admin", "svc_backup"]),
+                str(rnd.choice([2, 3, 5, 7, 10, 11])),
+                rnd.choice(["10.0.0.%d" % rnd.randint(1, 40), "-", "127.0.0.1"]),
+            ]
+            fields, tid = LOGON_FIELDS, 0x1111
+        else:
+            eid = rnd.choice([4688, 4672, 5156, 4798])
+            values = ["C:\\Windows\\System32\\svchost%d.exe" % rnd.randint(0, 999)]
+            fields, tid = NOISE_FIELDS, 0x2222
+        for _ in range(2):
+            if chunk is None:
+                chunk = new_chunk()
+            rec = _record_bytes(chunk["ofs"], rec_num, ts, eid, computer, values, chunk["tpl"], kind, fields, tid)
+            # Chunk sonunda bir kayıt başlığı (imza + boyut) kadar boşluk kalır; python-evtx
+            # son kaydın ardındaki başlığı okur ve dosyanın son chunk'ında taşmaz
+            if chunk["ofs"] + len(rec) + 8 <= CHUNK_SIZE:
+                break
+            chunks.append(chunk)
+            chunk = None
+        chunk["buf"][chunk["ofs"]:chunk["ofs"] + len(rec)] = rec
+        chunk["last_ofs"] = chunk["ofs"]
+        chunk["ofs"] += len(rec)
+        chunk["last"] = rec_num
+        rec_num += 1
+    if chunk is not None:
+        chunks.append(chunk)
+
+    out = bytearray(HEADER_SIZE)
+    out[0:8] = b"ElfFile\x00"
+    struct.pack_into("<QQQIHHHH", out, 8, 0, max(len(chunks) - 1, 0), rec_num, 0x80, 1, 3, HEADER_SIZE, len(chunks))
+    struct.pack_into("<I", out, 0x7C, binascii.crc32(bytes(out[:0x78])) & 0xFFFFFFFF)
+    for c in chunks:
+        b = c["buf"]
+        b[0:8] = b"ElfChnk\x00"
+        struct.pack_into("<QQQQIII", b, 8, c["first"], c["last"], c["first"], c["last"], 0x80, c["last_ofs"], c["ofs"])
+        for bucket, ofs in enumerate(sorted(c["tpl"].values())):
+            struct.pack_into("<I", b, 0x180 + bucket * 4, ofs)
+        struct.pack_into("<I", b, 0x34, binascii.crc32(bytes(b[0x200:c["ofs"]])) & 0xFFFFFFFF)
+        struct.pack_into("<I", b, 0x7C, binascii.crc32(bytes(b[:0x78]) + bytes(b[0x80:0x200])) & 0xFFFFFFFF)
+        out += b
+    with open(path, "wb") as f:
+        f.write(out)
+    return rec_num - 1
+
+
+def rewrite_chunks(src_path, dst_path, chunk_order):
+    """
+    src_path'teki logun chunk'larını chunk_order sırasıyla (kaynak chunk
+    indeksleri) dst_path'e yazar. Sarılmış bir logu taklit eder: ör. 8
+    chunk'lık logdan [6, 7, 2, 3, 4, 5] ilk iki chunk'ın üzerine yazılmış,
+    en eski chunk'ı 2. konumda olan bir log üretir. Başlıktaki en eski/güncel
+    chunk, sonraki kayıt numarası ve chunk sayısı buna göre yazılır.
+    """
+    with open(src_path, "rb") as f:
+        data = f.read()
+    chunks = [data[HEADER_SIZE + i * CHUNK_SIZE:HEADER_SIZE + (i + 1) * CHUNK_SIZE] for i in chunk_order]
+    firsts = [struct.unpack_from("<Q", c, 8)[0] for c in chunks]
+    lasts = [struct.unpack_from("<Q", c, 16)[0] for c in chunks]
+    out = bytearray(data[:HEADER_SIZE])
+    struct.pack_into("<QQQ", out, 8, firsts.index(min(firsts)), firsts.index(max(firsts)), max(lasts) + 1)
+    struct.pack_into("<H", out, 0x2A, len(chunks))
+    struct.pack_into("<I", out, 0x7C, binascii.crc32(bytes(out[:0x78])) & 0xFFFFFFFF)
+    with open(dst_path, "wb") as f:
+        f.write(bytes(out) + b"".join(chunks))
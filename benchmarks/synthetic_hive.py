@@ -0,0 +1,241 @@
+import codecs
+import random
+import struct
+from datetime import datetime, timedelta, UTC
+
+EPOCH_AS_FILETIME = 116444736000000000
+REG_SZ, REG_BINARY, REG_DWORD = 1, 3, 4
+
+
+def _to_filetime(dt):
+    return EPOCH_AS_FILETIME + int((dt - datetime(1970, 1, 1, tzinfo=UTC)).total_seconds() * 10_000_000)
+
+
+class _Key:
+    def __init__(self, name, timestamp):
+        self.name = name
+        self.timestamp = timestamp
+        self.children = {}
+        self.values = []
+
+
+class HiveBuilder:
+    """
+    Bellekte bir anahtar ağacı kurup python-registry ile okunabilen
+    minimal bir regf dosyası (tek hbin, lf listeleri) olarak yazar.
+    """
+    def __init__(self, hive_name="SYNTHETIC", timestamp=None):
+        self.hive_name = hive_name
+        self.default_ts = timestamp or datetime(2024, 1, 1, tzinfo=UTC)
+        self.root = _Key("ROOT", self.default_ts)
+
+    def key(self, path, timestamp=None):
+        node = self.root
+        for part in [p for p in path.split("\\") if p]:
+            child = node.children.get(part.lower())
+            if child is None:
+                child = _Key(part, timestamp or self.default_ts)
+                node.children[part.lower()] = child
+            node = child
+        if timestamp is not None:
+            node.timestamp = timestamp
+        return node
+
+    def value(self, path, name, data, type_=None):
+        if type_ is None:
+            type_ = REG_DWORD if isinstance(data, int) else REG_SZ if isinstance(data, str) else REG_BINARY
+        if type_ == REG_SZ:
+            raw = data.encode("utf-16le") + b"\x00\x00"
+        elif type_ == REG_DWORD:
+            raw = struct.pack("<I", data)
+        else:
+            raw = bytes(data)
+        self.key(path).values.append((name, type_, raw))
+
+    # --- serileştirme
+    def _cell(self, payload):
+        size = (len(payload) + 4 + 7) & ~7
+        ofs = len(self.buf)
+        self.buf += struct.pack("<i", -size) + payload + b"\x00" * (size - 4 - len(payload))
+        return ofs
+
+    def _write_key(self, node, parent_ofs, is_root=False):
+        name = node.name.encode("latin-1")
+        nk = bytearray(0x4C + len(name))
+        nk[0:2] = b"nk"
+        struct.pack_into("<HQ", nk, 2, 0x20 | (0x2C if is_root else 0), _to_filetime(node.timestamp))
+        struct.pack_into("<I", nk, 0x10, parent_ofs)
+        struct.pack_into("<I", nk, 0x2C, 0xFFFFFFFF)
+        struct.pack_into("<I", nk, 0x30, 0xFFFFFFFF)
+        struct.pack_into("<HH", nk, 0x48, len(name), 0)
+        nk[0x4C:] = name
+        my_ofs = self._cell(bytes(nk))
+        nk_data = my_ofs + 4
+
+        child_ofs = [self._write_key(c, my_ofs) for c in node.children.values()]
+        if child_ofs:
+            lf = bytearray(b"lf" + struct.pack("<H", len(child_ofs)))
+            for c, o in zip(node.children.values(), child_ofs):
+                lf += struct.pack("<I", o) + c.name.encode("latin-1")[:4].ljust(4, b"\x00")
+            list_ofs = self._cell(bytes(lf))
+            struct.pack_into("<II", self.buf, nk_data + 0x14, len(child_ofs), 0)
+            struct.pack_into("<I", self.buf, nk_data + 0x1C, list_ofs)
+        else:
+            struct.pack_into("<I", self.buf, nk_data + 0x1C, 0xFFFFFFFF)
+        if node.values:
+            vk_ofs = []
+            for vname, type_, raw in node.values:
+                vname_b = vname.encode("latin-1")
+                vk = bytearray(0x14 + len(vname_b))
+                vk[0:2] = b"vk"
+                if len(raw) <= 4:
+                    struct.pack_into("<HI", vk, 2, len(vname_b), 0x80000000 | len(raw))
+                    vk[8:8 + len(raw)] = raw
+                else:
+                    data_ofs = self._cell(raw)
+                    struct.pack_into("<HII", vk, 2, len(vname_b), len(raw), data_ofs)
+                struct.pack_into("<IH", vk, 0xC, type_, 1)
+                vk[0x14:] = vname_b
+                vk_ofs.append(self._cell(bytes(vk)))
+            vl_ofs = self._cell(b"".join(struct.pack("<I", o) for o in vk_ofs))
+            struct.pack_into("<II", self.buf, nk_data + 0x24, len(vk_ofs), vl_ofs)
+        else:
+            struct.pack_into("<II", self.buf, nk_data + 0x24, 0, 0xFFFFFFFF)
+        return my_ofs
+
+    def write(self, path):
+        self.buf = bytearray(b"\x00" * 0x20)  # hbin başlığı
+        root_ofs = self._write_key(self.root, 0, is_root=True)
+        size = (len(self.buf) + 0xFFF) & ~0xFFF
+        if size > len(self.buf):
+            free = size - len(self.buf)
+            self.buf += struct.pack("<i", free) + b"\x00" * (free - 4)
+        self.buf[0:4] = b"hbin"
+        struct.pack_into("<II", self.buf, 4, 0, size)
+        base = bytearray(0x1000)
+        base[0:4] = b"regf"
+        struct.pack_into("<IIQIIIII", base, 4, 1, 1, _to_filetime(self.default_ts), 1, 5, 0, 1, root_ofs)
+        struct.pack_into("<II", base, 0x28, size, 1)
+        hn = self.hive_name.encode("utf-16le")[:64]
+        base[0x30:0x30 + len(hn)] = hn
+        xsum = 0
+        for i in range(0, 0x1FC, 4):
+            xsum ^= struct.unpack_from("<I", base, i)[0]
+        struct.pack_into("<I", base, 0x1FC, xsum or 1)
+        with open(path, "wb") as f:
+            f.write(base + self.buf)
+
+
+# --- Parser'lara göre hazır hive üreticileri
+USER_ASSIST_KEY = r"Software\Microsoft\Windows\CurrentVersion\Explorer\UserAssist"
+USER_ASSIST_GUIDS = ("{CEBFF5CD-ACE2-4F4F-9178-9926F41749EA}", "{F4E57C4B-2036-45F0-A9AB-443BCFE33D9F}")
+
+
+USB_DISK_CLASS = "{53f56307-b6bf-11d0-94f2-00a0c91efb8b}"
+
+
+def _usbstor_device_path(device, serial):
+    return "_??_USBSTOR#%s#%s&0#%s" % (device, serial, USB_DISK_CLASS)
+
+
+def build_system_hive(path, n_usbstor, seed=0):
+    """
+    n_usbstor USBSTOR seri numarası ve her biri için bir Enum\\USB girdisi.
+    Aygıtların bir kısmı ControlSet002'de de (Select\\LastKnownGood), bir kısmı
+    yalnızca orada bulunur; her üç aygıttan biri MountedDevices'ta bir
+    birim GUID'i (ilk yirmisi sürücü harfi de) ile kayıtlıdır.
+    """
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    hive = HiveBuilder("SYSTEM")
+    for i in range(n_usbstor):
+        ts = base + timedelta(hours=rnd.randint(0, 5000))
+        device = "Disk&Ven_Kingston&Prod_DT%d&Rev_1.00" % (i % 5)
+        serial = "SER%07d" % i
+        control_sets = ("ControlSet002",) if i % 10 == 9 else ("ControlSet001", "ControlSet002") if i % 4 == 0 \
+            else ("ControlSet001",)
+        for control_set in control_sets:
+            hive.key(control_set + r"\Enum\USBSTOR\%s\%s&0" % (device, serial), ts)
+            key = control_set + r"\Enum\USB\VID_%04X&PID_%04X\%s" % (0x0951, 0x1600 + i % 7, serial)
+            hive.key(key, ts + timedelta(minutes=3))
+            hive.value(key, "DeviceDesc", "USB Mass Storage Device")
+            if i % 3:
+                hive.value(key, "FriendlyName", "Kingston DT %d" % i)
+            hive.value(key, "LocationInformation", "Port_#0001.Hub_#000%d" % (i % 4))
+        if i % 3 == 0:
+            data = _usbstor_device_path(device, serial).encode("utf-16le")
+            if i // 3 < 20: # E: .. X:
+                hive.value("MountedDevices", "\\DosDevices\\%s:" % chr(ord("E") + i // 3), data, REG_BINARY)
+            hive.value("MountedDevices", "\\??\\Volume{%08x-0000-11ef-a000-000000000000}" % i, data, REG_BINARY)
+    hive.value("MountedDevices", "\\DosDevices\\C:", struct.pack("<IQ", 0x1A2B3C4D, 0x100000), REG_BINARY)
+    for name, number in (("Current", 1), ("Default", 1), ("LastKnownGood", 2), ("Failed", 0)):
+        hive.value("Select", name, number)
+    hive.write(path)
+
+
+def _add_wpd_devices(hive, n_usbstor):
+    """ build_system_hive'daki aygıtların ikide biri için Windows Portable Devices kaydı. """
+    for i in range(0, n_usbstor, 2):
+        device_path = _usbstor_device_path("DISK&VEN_KINGSTON&PROD_DT%d&REV_1.00" % (i % 5), "SER%07d" % i).upper()
+        key = r"Microsoft\Windows Portable Devices\Devices\SWD#WPDBUSENUM#" + device_path
+        hive.key(key)
+        hive.value(key, "FriendlyName", "KINGSTON%d" % i)
+
+
+def build_software_hive(path, n_uninstall, n_networks=0, seed=0, n_usbstor=0):
+    """
+    n_uninstall program (64 bit ve WOW64 altında) ve n_networks ağ profili.
+    Eksik değerler, bozuk InstallDate ve SYSTEMTIME/FILETIME tarihleri karışık üretilir.
+    n_usbstor: build_system_hive ile aynı sayı verilirse WPD kayıtları da eklenir.
+    """
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    hive = HiveBuilder("SOFTWARE")
+    for i in range(n_uninstall):
+        for prefix in ("", "Wow6432Node\\"):
+            key = prefix + r"Microsoft\Windows\CurrentVersion\Uninstall\{%08d-APP}" % i
+            hive.key(key)
+            if i % 11 == 0:
+                continue
+            hive.value(key, "DisplayName", "App %d%s" % (i, " (x86)" if prefix else ""))
+            if i % 4:
+                hive.value(key, "Publisher", "Vendor %d" % (i % 6))
+            hive.value(key, "DisplayVersion", "1.%d" % i)
+            if i % 5 == 0:
+                hive.value(key, "InstallDate", "2023%02d%02d" % (1 + i % 12, 1 + i % 28))
+            elif i % 5 == 1:
+                hive.value(key, "InstallDate", "bogus")
+    for i in range(n_networks):
+        key = r"Microsoft\Windows NT\CurrentVersion\NetworkList\Profiles\{GUID-%06d}" % i
+        hive.key(key)
+        hive.value(key, "ProfileName", "WiFi-%d" % i)
+        dt = base + timedelta(days=rnd.randint(0, 700), seconds=rnd.randint(0, 86400))
+        if i % 3 == 0:
+            st = struct.pack("<HHHHHHHH", dt.year, dt.month, dt.weekday(), dt.day, dt.hour, dt.minute, dt.second, 123)
+            hive.value(key, "DateCreated", st, REG_BINARY)
+        elif i % 3 == 1:
+            hive.value(key, "DateCreated", struct.pack("<Q", _to_filetime(dt)), REG_BINARY)
+    _add_wpd_devices(hive, n_usbstor)
+    hive.write(path)
+
+
+def build_ntuser_hive(path, n_user_assist, seed=0):
+    """
+    İki UserAssist GUID'i altında toplam n_user_assist ROT13 kodlu değer;
+    her dördüncüsü eski 16 baytlık biçimde, bir kısmının zamanı boştur.
+    """
+    rnd = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    hive = HiveBuilder("NTUSER.DAT")
+    for i in range(n_user_assist):
+        key = USER_ASSIST_KEY + "\\" + USER_ASSIST_GUIDS[i % 2] + "\\Count"
+        name = codecs.encode("C:\\Program Files\\Tool%d\\tool%d.exe" % (i, i), "rot_13")
+        dt = base + timedelta(seconds=rnd.randint(0, 10 ** 8))
+        if i % 4 == 0:
+            data = struct.pack("<II", 0, 5 + i) + struct.pack("<Q", _to_filetime(dt))
+        else:
+            data = bytearray(72)
+            struct.pack_into("<II", data, 4, i, i * 3)
+            struct.pack_into("<Q", data, 60, _to_filetime(dt) if i % 7 else 0)
+        hive.value(key, name, bytes(data), REG_BINARY)
+    hive.write(path)
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+
+
+EPOCH_AS_FILETIME = 116444736000000000  # 1970-01-01, 100 ns birimiyle 1601'den beri
+HUNDREDS_OF_NANOSECONDS = 10000000
+# datetime'ın gösterebildiği aralık (1. yıl - 9999. yıl), Unix saniyesi
+_MIN_SECONDS = -62135596800
+_MAX_SECONDS = 253402300800
+
+# UserAssist değer verisi. Windows 7+: 72 bayt (ilk 68'i okunur), XP/Vista: 16 bayt
+USER_ASSIST_DTYPE = np.dtype([
+    ("session", "<u4"), ("run_count", "<u4"), ("focus_count", "<u4"), ("focus_time", "<u4"),
+    ("reserved", "V44"), ("last_run", "<u8"),
+])
+USER_ASSIST_LEGACY_DTYPE = np.dtype([("session", "<u4"), ("run_count", "<u4"), ("last_run", "<u8")])
+SYSTEMTIME_DTYPE = np.dtype([
+    ("year", "<u2"), ("month", "<u2"), ("day_of_week", "<u2"), ("day", "<u2"),
+    ("hour", "<u2"), ("minute", "<u2"), ("second", "<u2"), ("millisecond", "<u2"),
+])
+
+# codecs.decode(..., 'rot_13') ile aynı: yalnızca ASCII harfler döndürülür
+_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_UPPER = _LOWER.upper()
+ROT13_TABLE = str.maketrans(_LOWER + _UPPER, _LOWER[13:] + _LOWER[:13] + _UPPER[13:] + _UPPER[:13])
+
+
+def rot13(text):
+    return text.translate(ROT13_TABLE)
+
+
+def rot13_many(texts):
+    """ Metin listesini tek bir translate çağrısıyla çözer. """
+    decoded = "\0".join(texts).translate(ROT13_TABLE).split("\0")
+    if len(decoded) != len(texts): # Metinlerden biri ayırıcıyı içeriyor
+        decoded = [rot13(text) for text in texts]
+    return decoded
+
+
+def utc_column(values):
+    """ datetime64[us] dizisini (NaT'ler dahil) datetime64[us, UTC] sütununa çevirir. """
+    return pd.DatetimeIndex(values.astype("datetime64[us]")).tz_localize("UTC")
+
+
+def filetime_to_datetime64(filetimes):
+    """
+    FILETIME (1601'den beri 100 ns) dizisini datetime64[us] dizisine çevirir.
+    0 ve datetime aralığı dışındaki değerler NaT olur.
+
+    Satır satır datetime.fromtimestamp((ft - EPOCH) / 10**7, UTC) ile aynı
+    sonucu verir: saniye önce float'a yuvarlanır, mikrosaniye de CPython'daki
+    gibi float kesirden yarıda-çifte yuvarlanır (ör. ...56.1234565 -> ...56.123456).
+    """
+    filetimes = np.asarray(filetimes, dtype=np.uint64)
+    valid = (filetimes != 0) & (filetimes < np.uint64(EPOCH_AS_FILETIME + _MAX_SECONDS * HUNDREDS_OF_NANOSECONDS))
+    diff = np.where(valid, filetimes, EPOCH_AS_FILETIME).astype(np.int64) - EPOCH_AS_FILETIME
+    # q + r / 1e7, int / int bölmesinin doğru yuvarlanmış float sonucuyla aynıdır
+    seconds, remainder = np.divmod(diff, HUNDREDS_OF_NANOSECONDS)
+    timestamps = seconds.astype(np.float64) + remainder.astype(np.float64) / HUNDREDS_OF_NANOSECONDS
+    # datetime.fromtimestamp: modf, kesir * 1e6, yarıda-çifte yuvarlama, taşma düzeltmesi
+    whole = np.trunc(timestamps)
+    micros = np.rint((timestamps - whole) * 1e6)
+    carry = micros >= 1e6
+    borrow = micros < 0
+    micros = micros - carry * 1e6 + borrow * 1e6
+    whole = whole + carry - borrow
+    valid &= (whole >= _MIN_SECONDS) & (whole < _MAX_SECONDS)
+    result = (whole.astype(np.int64) * 1000000 + micros.astype(np.int64)).view("datetime64[us]")
+    result[~valid] = np.datetime64("NaT")
+    return result
+
+
+def systemtime_to_datetime64(records):
+    """
+    SYSTEMTIME_DTYPE kayıtlarını datetime64[us] dizisine çevirir. Yıl 0
+    olanlar ve datetime'ın reddedeceği alanlar (ör. 13. ay, 30 Şubat) NaT olur.
+    """
+    year = records["year"].astype(np.int64)
+    month = records["month"].astype(np.int64)
+    day = records["day"].astype(np.int64)
+    hour = records["hour"].astype(np.int64)
+    minute = records["minute"].astype(np.int64)
+    second = records["second"].astype(np.int64)
+    millisecond = records["millisecond"].astype(np.int64)
+    valid = ((year >= 1) & (year <= 9999) & (month >= 1) & (month <= 12) & (day >= 1)
+             & (hour < 24) & (minute < 60) & (second < 60) & (millisecond < 1000))
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype("datetime64[M]")
+    month_start = months.astype("datetime64[D]")
+    days_in_month = ((months + 1).astype("datetime64[D]") - month_start).astype(np.int64)
+    valid &= day <= days_in_month
+    micros = (month_start.astype("datetime64[us]").astype(np.int64)
+              + (((day - 1) * 24 + hour) * 60 + minute) * 60 * 1000000
+              + second * 1000000 + millisecond * 1000)
+    result = micros.view("datetime64[us]")
+    result[~valid] = np.datetime64("NaT")
+    return result
+
+
+def _gather(blobs, take=None):
+    """ Bayt dizilerini tek bir tampona toplar; take verilirse her birinden o parça alınır. """
+    if take is not None:
+        blobs = [take(blob) for blob in blobs]
+    return b"".join(blobs)
+
+
+def decode_user_assist(blobs):
+    """
+    UserAssist değer verilerini topluca çözer.
+    Dönüş: (keep, run_count, focus_count, last_run)
+      keep:        çözülebilen (en az 16 bayt) verilerin boolean maskesi
+      run_count:   int64; eski biçimde sayaç 5'ten başlar, 5 çıkarılır
+      focus_count: int64; eski biçimde 0
+      last_run:    datetime64[us]; zaman 0 ise NaT
+    Sonraki üç dizi yalnızca keep olan veriler içindir, girdi sırasıyla.
+    """
+    lengths = np.fromiter((len(blob) for blob in blobs), dtype=np.int64, count=len(blobs))
+    modern = lengths >= USER_ASSIST_DTYPE.itemsize
+    legacy = (lengths >= USER_ASSIST_LEGACY_DTYPE.itemsize) & ~modern
+    keep = modern | legacy
+    count = int(keep.sum())
+    run_count = np.zeros(count, dtype=np.int64)
+    focus_count = np.zeros(count, dtype=np.int64)
+    filetimes = np.zeros(count, dtype=np.uint64)
+
+    positions = np.flatnonzero(keep)
+    modern_rows = np.flatnonzero(modern[positions])
+    if len(modern_rows):
+        buffer = _gather([blobs[i] for i in positions[modern_rows]],
+                         take=lambda blob: blob[:USER_ASSIST_DTYPE.itemsize])
+        records = np.frombuffer(buffer, dtype=USER_ASSIST_DTYPE)
+        run_count[modern_rows] = records["run_count"]
+        focus_count[modern_rows] = records["focus_count"]
+        filetimes[modern_rows] = records["last_run"]
+    legacy_rows = np.flatnonzero(legacy[positions])
+    if len(legacy_rows):
+        # Eski biçim: sayaç 4. bayttan, zaman verinin son 8 baytından okunur
+        buffer = _gather([blobs[i] for i in positions[legacy_rows]],
+                         take=lambda blob: blob[:8] + blob[-8:])
+        records = np.frombuffer(buffer, dtype=USER_ASSIST_LEGACY_DTYPE)
+        raw_count = records["run_count"].astype(np.int64)
+        run_count[legacy_rows] = np.where(raw_count > 4, raw_count - 5, 0)
+        filetimes[legacy_rows] = records["last_run"]
+    return keep, run_count, focus_count, filetime_to_datetime64(filetimes)
+
+
+def decode_date_created(blobs):
+    """
+    NetworkList DateCreated verilerini topluca çözer: 16 bayt SYSTEMTIME,
+    8 bayt FILETIME. None ve diğer uzunluklar NaT olur. datetime64[us] döner.
+    """
+    result = np.full(len(blobs), np.datetime64("NaT"), dtype="datetime64[us]")
+    lengths = np.fromiter((len(blob) if blob is not None else 0 for blob in blobs), dtype=np.int64,
+                          count=len(blobs))
+    systemtimes = np.flatnonzero(lengths == SYSTEMTIME_DTYPE.itemsize)
+    if len(systemtimes):
+        buffer = _gather([blobs[i] for i in systemtimes])
+        result[systemtimes] = systemtime_to_datetime64(np.frombuffer(buffer, dtype=SYSTEMTIME_DTYPE))
+    filetimes = np.flatnonzero(lengths == 8)
+    if len(filetimes):
+        buffer = _gather([blobs[i] for i in filetimes])
+        result[filetimes] = filetime_to_datetime64(np.frombuffer(buffer, dtype="<u8"))
+    return result
@@ -0,0 +1,77 @@
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Büyük dosyalar (disk imajları dahil) bu boyutta şeritlere bölünerek taranır
+DEFAULT_STRIPE_SIZE = 64 * 1024 * 1024
+
+
+def open_map(path):
+    """
+    Dosyayı salt okunur olarak belleğe eşler (mmap); boş dosyada None.
+    Dosya kapatılsa da eşleme geçerli kalır; işi biten çağıran close() eder.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def advise_sequential(buf, start, stop):
+    """ Çekirdeğe [start, stop) aralığının sırayla okunacağını bildirir (destekleniyorsa). """
+    if not hasattr(buf, "madvise") or not hasattr(mmap, "MADV_SEQUENTIAL"):
+        return
+    start -= start % mmap.PAGESIZE # madvise sayfa hizalı başlangıç ister
+    try:
+        buf.madvise(mmap.MADV_SEQUENTIAL, start, max(0, min(stop, len(buf)) - start))
+    except (OSError, ValueError):
+        pass
+
+
+def find_all(buf, signature, start, stop):
+    """
+    [start, stop) aralığında BAŞLAYAN tüm imza ofsetlerini üretir; imza
+    şerit sınırını aşabilir. Arama mmap.find ile kopyasız yapılır.
+    """
+    end = min(len(buf), stop + len(signature) - 1)
+    offset = buf.find(signature, start, end)
+    while offset != -1:
+        yield offset
+        offset = buf.find(signature, offset + 1, end)
+
+
+def stripes(size, stripe_size=DEFAULT_STRIPE_SIZE):
+    """ [0, size) aralığını ardışık (başlangıç, bitiş) şeritlerine böler. """
+    return [(start, min(start + stripe_size, size)) for start in range(0, size, stripe_size)]
+
+
+def scan_stripes(path, worker, args=(), workers=1, stripe_size=DEFAULT_STRIPE_SIZE):
+    """
+    Dosyayı şeritlere bölüp her şerit için worker(path, start, stop, *args)
+    çağırır ve sonuçları şerit sırasıyla üretir (generator). Her şerit
+    dosyayı kendisi eşler; şeritler arasında veri kopyalanmaz.
+    workers > 1 ise şeritler bir süreç havuzunda taranır (worker modül
+    düzeyinde bir fonksiyon olmalıdır); bellekte en fazla 2 x workers
+    şeridin sonucu tutulur. Üretici erken kapatılırsa kalan işler iptal edilir.
+    """
+    ranges = stripes(os.path.getsize(path), stripe_size)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(ranges) <= 1:
+        for start, stop in ranges:
+            yield worker(str(path), start, stop, *args)
+        return
+    pending = deque()
+    next_range = 0
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        try:
+            while next_range < len(ranges) or pending:
+                while next_range < len(ranges) and len(pending) < workers * 2:
+                    start, stop = ranges[next_range]
+                    pending.append(pool.submit(worker, str(path), start, stop, *args))
+                    next_range += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
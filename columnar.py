@@ -0,0 +1,124 @@
+from array import array
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+class ColumnBuffer:
+    """
+    Satırları (sütun sırasında tuple) doğrudan sütun sütun biriktirir ve tek
+    seferde tipli bir DataFrame üretir; satır başına sözlük tutulmaz.
+
+    categorical: az sayıda farklı değeri olan sütunlar (olay türü, kullanıcı,
+                 IP...). Değerler bir sözlükle koda çevrilir ve int32 kod
+                 dizisi olarak tutulur; sonuç 'category' dtype'ıdır, kategoriler
+                 alfabetik sıralıdır (sıralama metin sırasıyla aynı kalır).
+                 None/NaN eksik değer olur.
+    datetime:    zaman sütunları; block_size satırda bir datetime64[us] dizisine
+                 çevrilir. Saat dilimsiz değerler UTC kabul edilir.
+    Diğer sütunlar Python listesinde tutulur ve dtype'ı pandas belirler.
+    """
+    def __init__(self, columns, categorical=(), datetime=(), block_size=65536):
+        self.columns = list(columns)
+        self.block_size = block_size
+        self._length = 0
+        self._codes = {c: array("i") for c in categorical}
+        self._categories = {c: {} for c in categorical}
+        self._times = {c: [] for c in datetime}
+        self._time_blocks = {c: [] for c in datetime}
+        self._values = {c: [] for c in self.columns if c not in self._codes and c not in self._times}
+        # append() içinde sütun adı yerine konum kullanılır
+        self._slots = [(i, c, self._codes.get(c), self._categories.get(c), self._times.get(c), self._values.get(c))
+                       for i, c in enumerate(self.columns)]
+
+    def __len__(self):
+        return self._length
+
+    def append(self, row):
+        for i, _, codes, categories, times, values in self._slots:
+            value = row[i]
+            if codes is not None:
+                if value is None or value != value: # None veya NaN
+                    codes.append(-1)
+                    continue
+                code = categories.get(value)
+                if code is None:
+                    code = categories[value] = len(categories)
+                codes.append(code)
+            elif times is not None:
+                times.append(value)
+            else:
+                values.append(value)
+        self._length += 1
+        if self._times and self._length % self.block_size == 0:
+            self._flush_times()
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def _flush_times(self):
+        for column, times in self._times.items():
+            if times:
+                block = pd.to_datetime(times, utc=True, errors="coerce").as_unit("us")
+                self._time_blocks[column].append(block.asi8)
+                times.clear()
+
+    def to_frame(self):
+        """ Biriken satırlardan DataFrame üretir; tampon boşalmaz, tekrar çağrılabilir. """
+        self._flush_times()
+        data = {}
+        for column in self.columns:
+            if column in self._codes:
+                categories = list(self._categories[column])
+                codes = np.frombuffer(self._codes[column], dtype=np.int32) if self._length else np.empty(0, np.int32)
+                data[column] = _sorted_categorical(codes, categories)
+            elif column in self._times:
+                blocks = self._time_blocks[column]
+                micros = np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+                data[column] = pd.DatetimeIndex(micros.view("datetime64[us]")).tz_localize("UTC")
+            else:
+                data[column] = self._values[column]
+        return pd.DataFrame(data, columns=self.columns)
+
+
+def _sorted_categorical(codes, categories):
+    """ Kodları, kategoriler alfabetik sıralanacak şekilde yeniden numaralandırır. """
+    try:
+        order = sorted(range(len(categories)), key=categories.__getitem__)
+    except TypeError: # Karşılaştırılamayan karışık türler: ilk görülme sırası korunur
+        return pd.Categorical.from_codes(codes.copy(), categories=categories)
+    remap = np.empty(len(categories) + 1, dtype=np.int32)
+    remap[order] = np.arange(len(categories), dtype=np.int32)
+    remap[-1] = -1 # -1 (eksik) kendisine eşlenir
+    return pd.Categorical.from_codes(remap[codes], categories=[categories[i] for i in order])
+
+
+def categorize(df, columns):
+    """ Verilen (varsa) sütunları alfabetik kategorili 'category' dtype'ına çevirir. """
+    for column in columns:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            values = df[column]
+            categories = sorted(values.dropna().unique(), key=str)
+            df[column] = pd.Categorical(values, categories=categories)
+    return df
+
+
+def concat_frames(frames):
+    """
+    pd.concat(frames, ignore_index=True) eşdeğeri; kategori kümeleri farklı
+    olan 'category' sütunları nesne dizisine düşmeden birleştirilir.
+    """
+    frames = [df for df in frames if df is not None]
+    # Boş tabloların kategori dtype'ı (nesne) dolu olanlarınkiyle (metin) birleşmez; sütunlar ilkinden alınır
+    columns = list(frames[0].columns) if frames else []
+    frames = [df for df in frames if len(df)] or frames[:1]
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+    categorical = [column for column in frames[0].columns
+                   if all(column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype) for df in frames)]
+    combined = pd.concat([df.drop(columns=categorical) for df in frames], ignore_index=True)
+    for column in categorical:
+        combined[column] = union_categoricals([df[column] for df in frames], sort_categories=True)
+    return combined[columns]
@@ -0,0 +1,82 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# pandas/numpy ilk tablo gösterilirken yüklenir; boş pencere açılışını yavaşlatmaz.
+
+
+def format_cell(value):
+    """ Tablo hücresinde gösterilecek metni üretir. """
+    import pandas as pd
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d %H:%M:%S') if pd.notna(value) else ""
+    return str(value) if pd.notna(value) else ""
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    Bir DataFrame'i kopyalamadan QTableView'e sunan salt okunur model.
+    Hücre metinleri yalnızca görünüm istediğinde (görünen satırlar için)
+    data() içinde üretilir; DataFrame'i değiştirmek satır sayısından
+    bağımsız olarak sabit sürer. Sıralama pandas'ta yapılır ve yalnızca
+    satır sırası (pozisyon dizisi) tutulur. DataFrame yokken (None) tablo boştur.
+    """
+    def __init__(self, df=None, parent=None):
+        super().__init__(parent)
+        self._df = None
+        self._order = None   # sıralıysa görünen satır -> DataFrame pozisyonu
+        self.setDataFrame(df)
+
+    def dataFrame(self):
+        return self._df
+
+    def setDataFrame(self, df):
+        self.beginResetModel()
+        self._df = df
+        self._order = None
+        self.endResetModel()
+
+    def value(self, row, column_name):
+        """ Görünen satırdaki ham değeri (biçimlendirilmemiş) döndürür. """
+        if self._order is not None:
+            row = self._order[row]
+        return self._df.iat[row, self._df.columns.get_loc(column_name)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self._df is None else len(self._df)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self._df is None else self._df.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if self._order is not None:
+            row = self._order[row]
+        return format_cell(self._df.iat[row, index.column()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """ Sütuna göre kararlı sıralama; boş değerler her zaman sona gelir. """
+        if self._df is None or column < 0 or column >= self._df.shape[1] or self._df.empty:
+            return
+        import numpy as np
+        import pandas as pd
+        self.layoutAboutToBeChanged.emit()
+        # Pozisyonel indeksli görünüm: DataFrame'in kendi indeksi tekrar edebilir.
+        # .array kategorik/zaman sütunlarını nesne dizisine çevirmeden sıralar.
+        series = pd.Series(self._df.iloc[:, column].array, copy=False)
+        ascending = order == Qt.AscendingOrder
+        try:
+            ordered = series.sort_values(ascending=ascending, kind="stable", na_position="last")
+        except TypeError:
+            # Karışık türler (ör. metin ve sayı) birbirleriyle karşılaştırılamaz
+            ordered = series.where(series.isna(), series.astype(str)).sort_values(
+                ascending=ascending, kind="stable", na_position="last")
+        self._order = ordered.index.to_numpy(dtype=np.intp)
+        self.layoutChanged.emit()
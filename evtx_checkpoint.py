@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+import result_cache
+
+
+DEFAULT_CHECKPOINT_DIR = result_cache.DEFAULT_CACHE_DIR / "evtx_checkpoints"
+
+
+class EvtxCheckpointStore:
+    """
+    Artımlı EVTX analizi için log başına kontrol noktası ve birikmiş sonuç.
+
+    Her log için iki dosya tutulur:
+      <anahtar>.json    son işlenen EventRecordID / chunk ve log başlık alanları
+      <anahtar>.parquet o ana kadar bulunan oturum olayları
+    Anahtar genellikle logun Computer/Channel kimliğidir (bkz. registry_parser.
+    parse_security_log_incremental); aynı makineden yeniden toplanan ya da
+    sarılmış log farklı bir yolda olsa da aynı kontrol noktasını bulur.
+    """
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory is not None else DEFAULT_CHECKPOINT_DIR
+
+    def _paths(self, log_key):
+        name = hashlib.sha256(str(log_key).encode("utf-8")).hexdigest()
+        return self.directory / f"{name}.json", self.directory / f"{name}.parquet"
+
+    def load(self, log_key):
+        """ (kontrol noktası sözlüğü, DataFrame) döndürür; yoksa veya bozuksa (None, None). """
+        checkpoint_path, frame_path = self._paths(log_key)
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+            df = pd.read_parquet(frame_path)
+        except Exception:
+            return None, None
+        # Sonuç ile kontrol noktası farklı yazımlardan kalmışsa ikisi de kullanılmaz
+        if checkpoint.get("rows") != len(df):
+            return None, None
+        return checkpoint, df
+
+    def save(self, log_key, checkpoint, df):
+        """
+        Sonucu ve kontrol noktasını yazar. Kontrol noktası satır sayısını da
+        tutar; yazım yarıda kalırsa load() uyuşmazlığı görüp tam taramaya düşürür.
+        """
+        checkpoint = dict(checkpoint, rows=len(df))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        checkpoint_path, frame_path = self._paths(log_key)
+        tmp_frame = frame_path.with_suffix(".parquet.tmp")
+        tmp_checkpoint = checkpoint_path.with_suffix(".json.tmp")
+        df.to_parquet(tmp_frame)
+        with open(tmp_checkpoint, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_frame, frame_path)
+        os.replace(tmp_checkpoint, checkpoint_path)
+
+    def clear(self, log_key):
+        for path in self._paths(log_key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
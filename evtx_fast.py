@@ -0,0 +1,184 @@
+import re
+import struct
+
+import Evtx.Nodes as e_nodes
+
+
+# XML görünümünün (Evtx.Views) değerlerden sildiği karakterler.
+# Hızlı yoldan gelen metnin XML yolundakiyle birebir aynı olması için kullanılır.
+RESTRICTED_CHARS = re.compile("[\x01-\x08\x0b\x0c\x0e-\x1f\x7f-\x84\x86-\x9f]")
+
+# System/Computer değeri istenirse bu ad altında döndürülür (EventData alan adlarıyla çakışmaz)
+COMPUTER_FIELD = "System/Computer"
+
+_SUBSTITUTION_NODES = (e_nodes.NormalSubstitutionNode, e_nodes.ConditionalSubstitutionNode)
+_CLOSE_NODES = (e_nodes.CloseStartElementNode, e_nodes.CloseEmptyElementNode, e_nodes.CloseElementNode)
+
+
+class _TemplateLayout:
+    """
+    Bir şablonun (template) hangi substitution indeksinde EventID'yi ve
+    hangi indekslerde EventData/Data değerlerini taşıdığını tutar.
+    Her şablon chunk başına bir kez çözülür.
+    """
+    def __init__(self):
+        self.event_id_index = None   # substitution indeksi
+        self.event_id_const = None   # şablona gömülü sabit EventID
+        self.fields = {}             # Data Name (ve COMPUTER_FIELD) -> ("sub", indeks) / ("const", metin)
+        self.complete = True         # False ise Data alanları XML yolundan okunur
+
+
+def _element_content(node):
+    """ Bir elemanın öznitelik ve kapanış token'ları dışındaki çocuklarını döndürür. """
+    return [c for c in node.children()
+            if not isinstance(c, e_nodes.AttributeNode) and not isinstance(c, _CLOSE_NODES)]
+
+
+def _scan_template(node, layout, in_event_data=False):
+    for child in node.children():
+        if isinstance(child, e_nodes.TemplateInstanceNode):
+            layout.complete = False
+            continue
+        if not isinstance(child, e_nodes.OpenStartElementNode):
+            continue
+        tag = child.tag_name()
+        content = _element_content(child)
+        if tag == "EventID":
+            if len(content) == 1 and isinstance(content[0], _SUBSTITUTION_NODES):
+                layout.event_id_index = content[0].index()
+            elif len(content) == 1 and isinstance(content[0], e_nodes.ValueNode):
+                layout.event_id_const = int(content[0].children()[0].string())
+        elif tag == "Computer" and not in_event_data:
+            # Bilgisayar adı çoğunlukla şablona gömülü sabit ya da bir substitution'dır
+            if len(content) == 1 and isinstance(content[0], _SUBSTITUTION_NODES):
+                layout.fields[COMPUTER_FIELD] = ("sub", content[0].index())
+            elif len(content) == 1 and isinstance(content[0], e_nodes.ValueNode):
+                layout.fields[COMPUTER_FIELD] = ("const", content[0].children()[0].string() or None)
+        elif tag == "Data" and in_event_data:
+            name = None
+            for attr in child.children():
+                if isinstance(attr, e_nodes.AttributeNode) and attr.attribute_name().string() == "Name":
+                    value = attr.attribute_value()
+                    if not isinstance(value, e_nodes.ValueNode):
+                        layout.complete = False
+                        break
+                    name = value.children()[0].string()
+            if not content:
+                layout.fields[name] = ("const", None)
+            elif len(content) == 1 and isinstance(content[0], _SUBSTITUTION_NODES):
+                layout.fields[name] = ("sub", content[0].index())
+            elif len(content) == 1 and isinstance(content[0], e_nodes.ValueNode):
+                layout.fields[name] = ("const", content[0].children()[0].string() or None)
+            else:
+                layout.complete = False
+        _scan_template(child, layout, in_event_data or tag == "EventData")
+
+
+def _xml_text(text):
+    """ XML'e yazılıp ElementTree ile geri okunan metnin eşdeğerini üretir. """
+    if not text:
+        return None
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = RESTRICTED_CHARS.sub("", text)
+    return text or None
+
+
+class LogonRecordDecoder:
+    """
+    EVTX kayıtlarından EventID'yi ve istenen EventData alanlarını XML
+    üretmeden, doğrudan ikili şablon/substitution verisinden okur.
+
+    decode() dönüş değerleri:
+      None                     -> hızlı yol çözemedi, XML yoluna düşülmeli
+      (event_id, None)         -> olay filtre dışında, atlanabilir
+      (event_id, data_fields)  -> olay filtrede, alanlar hazır
+    """
+    def __init__(self, event_ids, field_names):
+        self.event_ids = frozenset(event_ids)
+        self.field_names = tuple(field_names)
+        self._layouts = {}
+        self._chunk_offset = None
+
+    def _layout(self, record, chunk_offset, template_offset):
+        # Şablon ofsetleri chunk'a özgüdür; kayıtlar chunk chunk geldiği için
+        # yalnızca son chunk'ın şablonları tutulur (bellek chunk sayısıyla büyümez)
+        if chunk_offset != self._chunk_offset:
+            self._layouts.clear()
+            self._chunk_offset = chunk_offset
+        layout = self._layouts.get(template_offset)
+        if layout is None:
+            layout = _TemplateLayout()
+            _scan_template(record.root().template(), layout)
+            self._layouts[template_offset] = layout
+        return layout
+
+    def decode(self, record):
+        try:
+            return self._decode(record)
+        except Exception:
+            return None
+
+    def _decode(self, record):
+        buf = record._buf
+        chunk = record._chunk
+        chunk_offset = chunk._offset
+
+        ofs = record._offset + 0x18
+        if buf[ofs] & 0x0F == e_nodes.SYSTEM_TOKENS.StartOfStreamToken:
+            ofs += 4
+        if buf[ofs] & 0x0F != e_nodes.SYSTEM_TOKENS.TemplateInstanceToken:
+            return None
+        template_offset = struct.unpack_from("<I", buf, ofs + 6)[0]
+        subs_ofs = ofs + 10
+        if template_offset > ofs - chunk_offset:  # şablon kaydın içinde tanımlı
+            subs_ofs += 0x18 + struct.unpack_from("<I", buf, chunk_offset + template_offset + 0x14)[0]
+
+        layout = self._layout(record, chunk_offset, template_offset)
+
+        # Substitution tanımları: (boyut, tür) çiftleri ve değerlerin konumları
+        sub_count = struct.unpack_from("<I", buf, subs_ofs)[0]
+        decl_ofs = subs_ofs + 4
+        value_ofs = decl_ofs + sub_count * 4
+        decls = []
+        for i in range(sub_count):
+            size, type_ = struct.unpack_from("<HB", buf, decl_ofs + i * 4)
+            decls.append((value_ofs, size, type_))
+            value_ofs += size
+
+        if layout.event_id_index is not None:
+            event_id = self._value(buf, chunk, decls[layout.event_id_index])
+            if event_id is None:
+                return None
+            event_id = int(event_id)
+        elif layout.event_id_const is not None:
+            event_id = layout.event_id_const
+        else:
+            return None
+
+        if event_id not in self.event_ids:
+            return event_id, None
+
+        # İç içe BXml değerleri Data elemanı taşıyabilir; bunlar XML yolundan okunur
+        if not layout.complete or any(d[2] == e_nodes.NODE_TYPES.BXML for d in decls):
+            return None
+
+        data_fields = {}
+        for name in self.field_names:
+            source = layout.fields.get(name)
+            if source is None:
+                continue
+            kind, ref = source
+            data_fields[name] = _xml_text(self._value(buf, chunk, decls[ref])) if kind == "sub" else ref
+        return event_id, data_fields
+
+    @staticmethod
+    def _value(buf, chunk, decl):
+        ofs, size, type_ = decl
+        if type_ == e_nodes.NODE_TYPES.NULL:
+            return None
+        if type_ == e_nodes.NODE_TYPES.UNSIGNED_WORD:
+            return str(struct.unpack_from("<H", buf, ofs)[0])
+        if type_ == e_nodes.NODE_TYPES.WSTRING:
+            return bytes(buf[ofs:ofs + size]).decode("utf16").rstrip("\x00")
+        return e_nodes.get_variant_value(buf, ofs, chunk, None, type_, length=size).string()
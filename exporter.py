@@ -0,0 +1,393 @@
+import datetime
+import json
+import os
+import re
+from pathlib import Path
+
+import pandas as pd
+
+import logon_analytics
+import parser_metrics
+import registry_parser
+import result_cache
+
+
+# Biçim -> dosya uzantısı. "arrow": Arrow IPC dosya biçimi (Feather v2)
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv", "jsonl": ".jsonl"}
+FORMAT_LABELS = {
+    "parquet": "Parquet (.parquet)",
+    "arrow": "Arrow IPC (.arrow)",
+    "csv": "CSV (.csv)",
+    "jsonl": "JSON Lines (.jsonl)",
+}
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+CHUNK_ROWS = 50000 # Bellekteki tablolar da bu boyutta parçalar halinde yazılır
+
+
+def file_slug(name):
+    """ Kategori adını dosya adına çevirir: 'Ağ Geçmişi' -> 'Ağ_Geçmişi'. """
+    return re.sub(r"[^\w]+", "_", name).strip("_")
+
+
+def _arrow_table(df, decode_dictionaries):
+    """
+    DataFrame'i Arrow tablosuna çevirir. Kategori sütunlarının indeks türü
+    int32'ye sabitlenir (pandas kategori sayısına göre int8/int16 seçer);
+    böylece parçaların şeması aynı kalır. decode_dictionaries=True ise
+    kategoriler düz metne çevrilir (IPC dosyası sözlük değişimine izin vermez).
+    """
+    import pyarrow as pa
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            target = field.type.value_type if decode_dictionaries else pa.dictionary(pa.int32(), field.type.value_type)
+            table = table.set_column(i, field.name, table.column(i).cast(target))
+    return table
+
+
+class FrameWriter:
+    """
+    Tek bir kategoriyi parça parça (DataFrame batch'leri) dosyaya yazar;
+    tablonun tamamı bellekte tutulmaz. Dosya önce '.part' adıyla yazılır,
+    close() ile asıl adına taşınır; abort() yarım dosyayı siler.
+
+    Tüm parçalar ilk parçayla aynı sütunlara sahip olmalıdır.
+    """
+    def __init__(self, path, output_format):
+        if output_format not in FORMATS:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {output_format}")
+        self.path = Path(path)
+        self.output_format = output_format
+        self.rows = 0
+        self._part_path = self.path.with_name(self.path.name + ".part")
+        self._writer = None  # parquet/arrow yazıcısı
+        self._file = None    # csv/jsonl dosyası
+        self._schema = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, df):
+        if self.output_format in ("parquet", "arrow"):
+            self._write_arrow(df)
+        else:
+            self._write_text(df)
+        self.rows += len(df)
+
+    def _write_arrow(self, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = _arrow_table(df, decode_dictionaries=self.output_format == "arrow")
+        if self._writer is None:
+            self._schema = table.schema
+            if self.output_format == "parquet":
+                self._writer = pq.ParquetWriter(self._part_path, self._schema)
+            else:
+                self._writer = pa.ipc.new_file(self._part_path, self._schema)
+        elif not table.schema.equals(self._schema, check_metadata=False):
+            # ör. ilk parçada tamamı boş (null) olan bir sütun
+            table = table.cast(self._schema)
+        if self.output_format == "parquet":
+            self._writer.write_table(table)
+        elif table.num_rows:
+            self._writer.write_table(table)
+
+    def _write_text(self, df):
+        if self._file is None:
+            self._file = open(self._part_path, "w", encoding="utf-8", newline="")
+            if self.output_format == "csv":
+                self._file.write(df.iloc[:0].to_csv(index=False))
+        if df.empty:
+            return
+        if self.output_format == "csv":
+            df.to_csv(self._file, index=False, header=False)
+        else:
+            self._file.write(df.to_json(orient="records", lines=True, date_format="iso", date_unit="us",
+                                        force_ascii=False))
+
+    def close(self):
+        """ Dosyayı tamamlar ve asıl adına taşır. Dönüş: dosya yolu. """
+        if self._writer is None and self._file is None:
+            raise ValueError(f"'{self.path.name}' için hiç veri yazılmadı.")
+        if self._writer is not None:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+        self._writer = self._file = None
+        os.replace(self._part_path, self.path)
+        return self.path
+
+    def abort(self):
+        try:
+            if self._writer is not None:
+                self._writer.close()
+            if self._file is not None:
+                self._file.close()
+        finally:
+            self._writer = self._file = None
+            self._part_path.unlink(missing_ok=True)
+
+
+def iter_chunks(df, chunk_rows=CHUNK_ROWS):
+    """ Bellekteki tabloyu en fazla chunk_rows satırlık görünümler halinde üretir. """
+    if df.empty:
+        yield df
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def write_batches(batches, path_without_suffix, output_format, empty_frame=None, cancel_event=None):
+    """
+    DataFrame parçalarını tek dosyaya yazar. Hiç parça gelmezse empty_frame
+    (sütun başlıkları için) yazılır. İptal edilirse yarım dosya silinir ve
+    None döner. Dönüş: (dosya yolu, satır sayısı).
+    """
+    path = Path(f"{path_without_suffix}{FORMATS[output_format]}")
+    writer = FrameWriter(path, output_format)
+    try:
+        written = False
+        for df in batches:
+            writer.write(df)
+            written = True
+            if cancel_event is not None and cancel_event.is_set():
+                writer.abort()
+                return None
+        if not written:
+            writer.write(empty_frame if empty_frame is not None else pd.DataFrame())
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return path, writer.rows
+
+
+def write_frame(df, path_without_suffix, output_format, chunk_rows=CHUNK_ROWS):
+    """ Bellekteki tabloyu parçalar halinde yazar ve dosya yolunu döndürür. """
+    path, _ = write_batches(iter_chunks(df, chunk_rows), path_without_suffix, output_format)
+    return path
+
+
+class ExportManifest:
+    """
+    Dışa aktarımın özeti (manifest.json): kaynak dosyaların boyut ve SHA-256
+    özetleri ile her kategorinin dosyası, satır sayısı ve dosya özeti.
+    Çıktıların hangi kanıt dosyalarından üretildiği sonradan doğrulanabilir.
+    """
+    def __init__(self, output_format, case_folder=None):
+        self.output_format = output_format
+        self.case_folder = str(case_folder) if case_folder is not None else None
+        self.sources = {}    # yol -> parmak izi
+        self.categories = []
+
+    def add_sources(self, source_paths):
+        """ Kaynakları ekler (her dosya bir kez özetlenir); manifestteki yollarını döndürür. """
+        names = []
+        for path in source_paths:
+            key = str(path)
+            if key not in self.sources:
+                fingerprint = result_cache.file_fingerprint(path)
+                self.sources[key] = ({"path": key, "size": fingerprint["size"], "sha256": fingerprint["sha256"]}
+                                     if fingerprint is not None else {"path": key, "error": "okunamadı"})
+            names.append(key)
+        return names
+
+    def add_category(self, name, path, rows, source_paths=()):
+        path = Path(path)
+        self.categories.append({
+            "name": name,
+            "file": path.name,
+            "rows": int(rows),
+            "size": path.stat().st_size,
+            "sha256": result_cache.file_sha256(path, remember=False),
+            "sources": self.add_sources(source_paths),
+        })
+
+    def add_failure(self, name, message, source_paths=()):
+        self.categories.append({"name": name, "error": message, "sources": self.add_sources(source_paths)})
+
+    def to_dict(self):
+        return {
+            "manifest_version": MANIFEST_VERSION,
+            "parser_version": registry_parser.PARSER_VERSION,
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "format": self.output_format,
+            "case": self.case_folder,
+            "sources": list(self.sources.values()),
+            "categories": self.categories,
+            "total_rows": sum(c.get("rows", 0) for c in self.categories),
+        }
+
+    def write(self, output_dir):
+        path = Path(output_dir) / MANIFEST_NAME
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+
+def export_frames(data_frames, output_dir, output_format, category_sources=None, case_folder=None,
+                  chunk_rows=CHUNK_ROWS, cancel_event=None, report=None):
+    """
+    Bellekteki {kategori: DataFrame} sözlüğünü (ör. arayüzün data_frames'i)
+    output_dir altına kategori başına bir dosya olarak yazar ve manifest
+    üretir. category_sources: {kategori: [kaynak dosya yolları]}
+    Dönüş: manifest sözlüğü; iptal edilirse None.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    category_sources = category_sources or {}
+    manifest = ExportManifest(output_format, case_folder)
+    for name, df in data_frames.items():
+        sources = category_sources.get(name, ())
+        if df is None:
+            manifest.add_failure(name, "dosya analiz edilemedi", sources)
+            continue
+        if report is not None:
+            report(f"'{name}' dışa aktarılıyor ({len(df)} satır)...")
+        written = write_batches(iter_chunks(df, chunk_rows), output_dir / file_slug(name), output_format,
+                                cancel_event=cancel_event)
+        if written is None:
+            return None
+        manifest.add_category(name, written[0], written[1], sources)
+    manifest.write(output_dir)
+    return manifest.to_dict()
+
+
+def export_case(case_folder, output_dir, output_format, batch_size=CHUNK_ROWS, session=None, metrics=None,
+                cancel_event=None, report=None):
+    """
+    Vaka klasörünü analiz ederken sonuçları doğrudan output_dir'e yazar:
+    Security logları (Security.evtx ve arşivler, zamana göre birleştirilmiş)
+    batch_size satırlık parçalar halinde okunup yazılır, kullanıcı profilleri
+    de profil profil eklenir. Böylece loglar bellekte tutulmadan dışa aktarılır.
+    Eksik kaynak dosyalar ve parser hataları manifestte raporlanır, diğer
+    kategorileri durdurmaz.
+    Dönüş: manifest sözlüğü; iptal edilirse None.
+    """
+    case_folder = Path(case_folder)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = ExportManifest(output_format, case_folder)
+    own_session = session is None
+    session = session or registry_parser.HiveSession()
+
+    def progress(message):
+        if report is not None:
+            report(message)
+
+    try:
+        with parser_metrics.measure(metrics, f"export_case[{output_format}]", case_folder) as run:
+            # Taranan kayıtlar çağrılan parser'ların kendi ölçümlerinde raporlanır;
+            # burada yalnızca yazılan satırlar (records_emitted) sayılır.
+            # --- Oturum logları: parser'dan gelen parçalar doğrudan yazılır
+            evtx_paths = registry_parser.discover_security_logs(case_folder)
+            if evtx_paths:
+                progress("Oturum logları dışa aktarılıyor...")
+                # Özet kategoriler parçalar yazılırken güncellenir; loglar bellekte tutulmaz
+                aggregator = logon_analytics.LogonAggregator()
+                batches = aggregator.observe(registry_parser.iter_logon_event_batches(
+                    evtx_paths, batch_size=batch_size, metrics=metrics))
+                try:
+                    written = write_batches(batches, output_dir / file_slug("Oturum Logları"), output_format,
+                                            empty_frame=registry_parser.logon_column_buffer().to_frame(),
+                                            cancel_event=cancel_event)
+                except Exception as e:
+                    for name in ("Oturum Logları",) + logon_analytics.ANALYTICS_CATEGORIES:
+                        manifest.add_failure(name, str(e), evtx_paths)
+                else:
+                    if written is None:
+                        return None
+                    manifest.add_category("Oturum Logları", written[0], written[1], evtx_paths)
+                    run.records_emitted += written[1]
+                    for name, df in aggregator.frames().items():
+                        path = write_frame(df, output_dir / file_slug(name), output_format, batch_size)
+                        manifest.add_category(name, path, len(df), evtx_paths)
+            else:
+                for name in ("Oturum Logları",) + logon_analytics.ANALYTICS_CATEGORIES:
+                    manifest.add_failure(name, "eksik dosya")
+
+            # --- SYSTEM / SOFTWARE: artefakt tabloları küçüktür, hive başına tek geçiş
+            hive_frames = {}
+            for file_name, artifacts in (("SYSTEM", registry_parser.SYSTEM_ARTIFACTS),
+                                         ("SOFTWARE", registry_parser.SOFTWARE_ARTIFACTS)):
+                hive_path = case_folder / file_name
+                if not hive_path.is_file():
+                    for artifact in artifacts:
+                        manifest.add_failure(artifact.name, "eksik dosya")
+                    continue
+                progress(f"'{file_name}' dışa aktarılıyor...")
+                frames = registry_parser.parse_hive_artifacts(hive_path, artifacts, session=session, metrics=metrics)
+                hive_frames.update(frames)
+                for name, df in frames.items():
+                    if df is None:
+                        manifest.add_failure(name, "dosya analiz edilemedi", [hive_path])
+                        continue
+                    path = write_frame(df, output_dir / file_slug(name), output_format, batch_size)
+                    manifest.add_category(name, path, len(df), [hive_path])
+                    run.records_emitted += len(df)
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+            # USB cihaz geçmişi: iki hive'ın tablolarının seri numarasıyla birleşimi
+            history_sources = [case_folder / "SYSTEM", case_folder / "SOFTWARE"]
+            if hive_frames.get(registry_parser.USBSTOR_ARTIFACT.name) is None:
+                manifest.add_failure(registry_parser.USB_HISTORY_CATEGORY, "SYSTEM tabloları yok")
+            else:
+                history = registry_parser.build_device_history(hive_frames)
+                path = write_frame(history, output_dir / file_slug(registry_parser.USB_HISTORY_CATEGORY),
+                                   output_format, batch_size)
+                manifest.add_category(registry_parser.USB_HISTORY_CATEGORY, path, len(history),
+                                      [p for p in history_sources if p.is_file()])
+                run.records_emitted += len(history)
+
+            # --- Kullanıcı profilleri: her profilin tabloları bittikçe eklenir
+            user_hives = registry_parser.discover_user_hives(case_folder)
+            hive_paths = [hive_path for _, hive_path in user_hives]
+            if not user_hives:
+                for artifact in registry_parser.NTUSER_ARTIFACTS:
+                    manifest.add_failure(artifact.name, "eksik dosya")
+            else:
+                progress(f"{len(user_hives)} kullanıcı profili dışa aktarılıyor...")
+                writers = {artifact.name: FrameWriter(output_dir / (file_slug(artifact.name) + FORMATS[output_format]),
+                                                      output_format)
+                           for artifact in registry_parser.NTUSER_ARTIFACTS}
+                profile_paths = dict(user_hives)
+                failed = {artifact.name: 0 for artifact in registry_parser.NTUSER_ARTIFACTS}
+                try:
+                    for profile, frames in registry_parser.iter_user_profile_frames(user_hives, workers=1,
+                                                                                     metrics=metrics):
+                        for name, df in frames.items():
+                            if df is None: # Taranamayan profil 0 satır değil, hata olarak raporlanır
+                                failed[name] += 1
+                                manifest.add_failure(registry_parser.user_profile_category(name, profile),
+                                                     "dosya analiz edilemedi", [profile_paths[profile]])
+                            elif not df.empty:
+                                writers[name].write(df)
+                        if cancel_event is not None and cancel_event.is_set():
+                            return None
+                    for artifact in registry_parser.NTUSER_ARTIFACTS:
+                        writer = writers.pop(artifact.name)
+                        if failed[artifact.name] == len(user_hives):
+                            writer.abort()
+                            manifest.add_failure(artifact.name, "hiçbir profil analiz edilemedi", hive_paths)
+                            continue
+                        if writer.rows == 0:
+                            writer.write(pd.DataFrame(columns=[registry_parser.USER_PROFILE_COLUMN] + artifact.columns))
+                        manifest.add_category(artifact.name, writer.close(), writer.rows, hive_paths)
+                        run.records_emitted += writer.rows
+                finally:
+                    for writer in writers.values():
+                        writer.abort()
+        manifest.write(output_dir)
+        return manifest.to_dict()
+    finally:
+        if own_session:
+            session.close()
@@ -0,0 +1,243 @@
+import itertools
+import os
+import re
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+from Registry import Registry
+
+import parser_metrics
+import result_cache
+
+
+DEFAULT_INDEX_PATH = result_cache.DEFAULT_CACHE_DIR / "hive_index.sqlite"
+INDEX_VERSION = "1" # Dizin biçimi değişirse artırılır; eski dizinler yeniden kurulur
+SEARCH_COLUMNS = ["Hive", "Anahtar Yolu", "Değer Adı", "Tür", "Veri", "Son Yazma (UTC)"]
+
+BATCH_SIZE = 5000                 # Tek executemany çağrısındaki satır sayısı
+MAX_BINARY_BYTES = 1024 * 1024    # Bundan büyük ikili değerlerde metin aranmaz
+# İkili verideki okunabilir metinler (ör. MountedDevices içindeki USBSTOR yolları)
+_UTF16_TEXT = re.compile(rb"(?:[\x20-\x7e]\x00){4,}")
+_ASCII_TEXT = re.compile(rb"[\x20-\x7e]{6,}")
+
+
+def _hive_id(hive_path):
+    return os.path.normcase(os.path.abspath(str(hive_path)))
+
+
+def _value_text(registry_value):
+    """ Değerin aranabilir metni: dizeler, çoklu dizeler, sayılar ve ikili verideki okunabilir metinler. """
+    try:
+        value_type = registry_value.value_type()
+        if value_type in (Registry.RegSZ, Registry.RegExpandSZ):
+            return str(registry_value.value() or "")
+        if value_type == Registry.RegMultiSZ:
+            return "\n".join(s for s in registry_value.value() if s)
+        if value_type in (Registry.RegDWord, Registry.RegQWord):
+            return str(registry_value.value())
+        data = registry_value.raw_data()
+    except Exception:
+        return ""
+    if not data or len(data) > MAX_BINARY_BYTES:
+        return ""
+    texts = [m.group().decode("utf-16-le") for m in _UTF16_TEXT.finditer(data)]
+    texts += [m.group().decode("ascii") for m in _ASCII_TEXT.finditer(data)]
+    return "\n".join(texts)
+
+
+def _iter_hive_rows(root, counters):
+    """
+    Hive'ı bir kez (derinlik öncelikli) gezer ve dizin satırları üretir:
+    (anahtar yolu, değer adı, tür, veri, son yazma). Her anahtar, değeri
+    olmasa da yolu aranabilsin diye boş değer adlı bir satırla temsil edilir.
+    Yollar kök anahtarın adı olmadan tutulur (ör. ControlSet001\\Enum\\USBSTOR).
+    """
+    stack = [(root, "")]
+    while stack:
+        key, path = stack.pop()
+        counters["keys"] += 1
+        try:
+            last_write = key.timestamp().strftime("%Y-%m-%d %H:%M:%S")
+        except Exception:
+            last_write = None
+        yield path, "", "", "", last_write
+        try:
+            values = key.values()
+        except Exception:
+            values = []
+        for registry_value in values:
+            counters["values"] += 1
+            try:
+                name, type_name = registry_value.name(), registry_value.value_type_str()
+            except Exception:
+                continue
+            yield path, name or "(Varsayılan)", type_name, _value_text(registry_value), last_write
+        try:
+            subkeys = key.subkeys()
+        except Exception:
+            subkeys = []
+        # Alt anahtarlar ada göre sırayla ziyaret edilsin diye ters sırada yığına konur
+        for subkey in reversed(subkeys):
+            stack.append((subkey, f"{path}\\{subkey.name()}" if path else subkey.name()))
+
+
+class HiveIndex:
+    """
+    Hive'ların tamamı üzerinde kalıcı, tam metin arama dizini (SQLite FTS5).
+
+    Her hive bir kez gezilir; anahtar yolları, değer adları, çözülmüş
+    dize/çoklu dize/sayı verileri ve ikili verideki okunabilir metinler
+    anahtarın son yazma zamanıyla birlikte dizine yazılır. Her hive kendi
+    FTS tablosunda tutulur; 'hives' tablosu yol, parmak izi ve tablo adını
+    saklar. Hive değişmediyse (SHA-256 aynıysa) yeniden gezilmez.
+
+    Tablo 'trigram' ayırıcısıyla kurulur: sorgu metni anahtar yolu, değer
+    adı ya da verinin herhangi bir yerinde geçebilir (büyük/küçük harf
+    duyarsız). Her çağrı kendi bağlantısını açar; dizin kurulurken başka bir
+    iş parçacığından arama yapılabilir (WAL).
+    """
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path) if db_path is not None else DEFAULT_INDEX_PATH
+
+    def _connect(self):
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # İşlemler açıkça (BEGIN/COMMIT) yönetilir; tablo oluşturma da geri alınabilir
+        connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("""CREATE TABLE IF NOT EXISTS hives (
+            path TEXT PRIMARY KEY, name TEXT, size INTEGER, sha256 TEXT, version TEXT,
+            table_name TEXT, keys INTEGER, "values" INTEGER, indexed_at REAL)""")
+        return connection
+
+    def _hive_record(self, connection, hive_path):
+        return connection.execute(
+            "SELECT sha256, version, table_name FROM hives WHERE path = ?", (_hive_id(hive_path),)).fetchone()
+
+    def is_current(self, hive_path, fingerprint=None):
+        """ Hive bu içerikle ve bu dizin sürümüyle zaten dizinlenmiş mi? """
+        fingerprint = fingerprint or result_cache.file_fingerprint(hive_path)
+        if fingerprint is None:
+            return False
+        with closing(self._connect()) as connection:
+            record = self._hive_record(connection, hive_path)
+        return record is not None and record[0] == fingerprint["sha256"] and record[1] == INDEX_VERSION
+
+    def index_hive(self, hive_path, session=None, force=False, cancel_event=None, report=None, metrics=None,
+                   label=None):
+        """
+        Hive'ı dizinler ve dizinlenen anahtar sayısını döndürür; hive zaten
+        güncelse 0. Hive açılamazsa None. cancel_event kurulur ise yarıda
+        kalan tablo silinir ve None döner; önceki dizin korunur.
+        session: verilirse (registry_parser.HiveSession) hive oradan açılır.
+        label: sonuçlardaki hive adı (varsayılan: dosya adı; ör. 'NTUSER.DAT (ali)')
+        """
+        hive_path = Path(hive_path)
+        fingerprint = result_cache.file_fingerprint(hive_path)
+        if fingerprint is None:
+            print(f"Hata: '{hive_path}' dosyası okunamadı.")
+            return None
+        if not force and self.is_current(hive_path, fingerprint):
+            return 0
+
+        with parser_metrics.measure(metrics, f"index_hive[{hive_path.name}]", hive_path) as run:
+            run.read_source(hive_path)
+            try:
+                reg = session.hive(hive_path) if session is not None else Registry.Registry(str(hive_path))
+            except Exception as e:
+                print(f"Hata: '{hive_path}' hive dosyası açılamadı: {e}")
+                return None
+
+            table_name = f"fts_{uuid.uuid4().hex}"
+            counters = {"keys": 0, "values": 0}
+            connection = self._connect()
+            committed = False
+            try:
+                connection.execute("BEGIN")
+                connection.execute(
+                    f"CREATE VIRTUAL TABLE {table_name} USING fts5("
+                    "key_path, value_name, value_type UNINDEXED, data, last_write UNINDEXED, tokenize='trigram')")
+                rows = _iter_hive_rows(reg.root(), counters)
+                while True:
+                    with run.phase("decode"):
+                        batch = list(itertools.islice(rows, BATCH_SIZE))
+                    if not batch:
+                        break
+                    with run.phase("index"):
+                        connection.executemany(f"INSERT INTO {table_name} VALUES (?, ?, ?, ?, ?)", batch)
+                    run.records_scanned = counters["keys"]
+                    run.records_emitted += len(batch)
+                    run.update()
+                    if report is not None:
+                        report(f"'{hive_path.name}' dizinleniyor: {counters['keys']} anahtar, "
+                               f"{counters['values']} değer...")
+                    if cancel_event is not None and cancel_event.is_set():
+                        return None
+
+                # Eski tablo ile yenisi aynı işlemde yer değiştirir
+                previous = self._hive_record(connection, hive_path)
+                if previous is not None:
+                    connection.execute(f"DROP TABLE IF EXISTS {previous[2]}")
+                connection.execute(
+                    "INSERT OR REPLACE INTO hives VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (_hive_id(hive_path), label or hive_path.name, fingerprint["size"], fingerprint["sha256"],
+                     INDEX_VERSION, table_name, counters["keys"], counters["values"], time.time()))
+                connection.execute("COMMIT")
+                committed = True
+            finally:
+                if not committed:
+                    connection.execute("ROLLBACK")
+                connection.close()
+            run.counters.update(counters)
+        return counters["keys"]
+
+    def search(self, query, hive_paths=None, limit=1000):
+        """
+        query'nin geçtiği anahtar/değerleri DataFrame (SEARCH_COLUMNS) olarak
+        döndürür; en fazla limit satır, hive ve gezinti sırasıyla.
+        hive_paths verilirse yalnızca o hive'larda aranır.
+        """
+        query = query.strip()
+        if not query:
+            return pd.DataFrame(columns=SEARCH_COLUMNS)
+        with closing(self._connect()) as connection:
+            hives = connection.execute("SELECT path, name, table_name FROM hives ORDER BY name").fetchall()
+            if hive_paths is not None:
+                wanted = {_hive_id(p) for p in hive_paths}
+                hives = [h for h in hives if h[0] in wanted]
+            rows = []
+            for _, name, table_name in hives:
+                remaining = limit - len(rows)
+                if remaining <= 0:
+                    break
+                if len(query) >= 3:
+                    # Sorgu tek bir öbek olarak aranır; FTS sözdizimi karakterleri etkisizdir
+                    condition, params = f"{table_name} MATCH ?", ['"' + query.replace('"', '""') + '"']
+                else:
+                    # Trigram dizini 3 karakterden kısa metinleri eşleyemez; tablo taranır
+                    pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                    condition = " OR ".join(f"{c} LIKE ? ESCAPE '\\'" for c in ("key_path", "value_name", "data"))
+                    params = [pattern] * 3
+                hits = connection.execute(
+                    f"SELECT key_path, value_name, value_type, data, last_write FROM {table_name} "
+                    f"WHERE {condition} ORDER BY rowid LIMIT ?", params + [remaining]).fetchall()
+                rows.extend((name,) + hit for hit in hits)
+        df = pd.DataFrame(rows, columns=SEARCH_COLUMNS)
+        df["Son Yazma (UTC)"] = pd.to_datetime(df["Son Yazma (UTC)"], utc=True)
+        return df
+
+    def indexed_hives(self):
+        """ Dizindeki hive'ların özet tablosu. """
+        with closing(self._connect()) as connection:
+            return pd.read_sql_query(
+                'SELECT path, name, size, sha256, keys, "values", indexed_at FROM hives ORDER BY name', connection)
+
+    def remove(self, hive_path):
+        with closing(self._connect()) as connection:
+            record = self._hive_record(connection, hive_path)
+            if record is not None:
+                connection.execute(f"DROP TABLE IF EXISTS {record[2]}")
+                connection.execute("DELETE FROM hives WHERE path = ?", (_hive_id(hive_path),))
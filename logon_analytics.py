@@ -0,0 +1,344 @@
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+import registry_parser
+
+
+# Oturum loglarından akış sırasında üretilen özet kategoriler
+BUCKET_CATEGORY = "Oturum İstatistikleri"
+BURST_CATEGORY = "Başarısız Oturum Patlamaları"
+SOURCE_IP_CATEGORY = "Kaynak IP İlk Görülme"
+ANALYTICS_CATEGORIES = (BUCKET_CATEGORY, BURST_CATEGORY, SOURCE_IP_CATEGORY)
+
+BUCKET_COLUMNS = ["Zaman Dilimi (UTC)", "Kullanıcı Adı", "Kaynak IP", "Oturum Türü",
+                  "Başarılı Oturum", "Başarısız Deneme", "Oturum Kapatma"]
+BURST_COLUMNS = ["Başlangıç (UTC)", "Bitiş (UTC)", "Kaynak IP", "Başarısız Deneme", "En Yoğun Pencere",
+                 "Hedef Kullanıcı Sayısı", "Hedef Kullanıcılar"]
+SOURCE_IP_COLUMNS = ["İlk Görülme (UTC)", "Son Görülme (UTC)", "Kaynak IP", "İlk Kullanıcı", "İlk Oturum Türü",
+                     "Başarılı Oturum", "Başarısız Deneme", "RDP Oturumu", "İlk RDP Oturumu (UTC)",
+                     "İlk RDP Kullanıcısı"]
+
+BUCKET_SIZE = pd.Timedelta(hours=1)
+# Aynı kaynak IP'den BURST_WINDOW içinde en az BURST_THRESHOLD başarısız deneme
+# bir patlama başlatır; denemeler arasında BURST_WINDOW'dan uzun ara olunca biter.
+BURST_WINDOW = pd.Timedelta(minutes=5)
+BURST_THRESHOLD = 10
+BURST_SAMPLE_USERS = 5 # "Hedef Kullanıcılar" sütununda gösterilen en fazla ad
+# Yerel oturumların "kaynak IP" değerleri; ilk görülme tablosuna alınmaz
+LOCAL_ADDRESSES = frozenset({"-", "N/A", "", "::1", "127.0.0.1"})
+
+# Olay sütunundaki metin -> tür (0: başarılı, 1: başarısız, 2: oturum kapatma)
+SUCCESS, FAILURE, LOGOFF = 0, 1, 2
+_EVENT_KINDS = {
+    registry_parser.EVENT_ID_DESCRIPTIONS[4624]: SUCCESS,
+    registry_parser.EVENT_ID_DESCRIPTIONS[4625]: FAILURE,
+    registry_parser.EVENT_ID_DESCRIPTIONS[4634]: LOGOFF,
+    registry_parser.EVENT_ID_DESCRIPTIONS[4647]: LOGOFF,
+}
+RDP_LOGON_TYPE = registry_parser.LOGON_TYPE_DESCRIPTIONS["10"]
+
+
+def _event_kinds(events):
+    """ Olay sütununu tür kodlarına çevirir (bilinmeyen olaylar -1); kategori başına bir sözlük araması. """
+    events = pd.Categorical(events)
+    lookup = np.array([_EVENT_KINDS.get(c, -1) for c in events.categories] + [-1], dtype=np.int8)
+    return lookup[events.codes]
+
+
+def _micros(values):
+    """ Zaman sütununu UTC mikro saniyeye (int64) çevirir; NaT en küçük int64 olur. """
+    if not isinstance(values.dtype, pd.DatetimeTZDtype): # saat dilimsiz değerler UTC kabul edilir
+        values = pd.to_datetime(values, utc=True)
+    return values.dt.as_unit("us").array.asi8
+
+
+def _utc(micros):
+    return pd.to_datetime(np.asarray(micros, dtype=np.int64), unit="us", utc=True)
+
+
+_NO_TIME = np.iinfo(np.int64).max # "henüz RDP oturumu yok"
+BUCKET_KEYS = ["bucket", "user", "ip", "type"]
+COUNT_COLUMNS = ["success", "failure", "logoff"]
+# Ara toplamlar en az bu kadar satır birikince birleştirilir
+REDUCE_MIN_ROWS = 200000
+
+
+def _reduce_buckets(df):
+    """ (dilim, kullanıcı, IP, tür) başına sayaçları toplar. """
+    return df.groupby(BUCKET_KEYS, sort=False)[COUNT_COLUMNS].sum().reset_index()
+
+
+def _reduce_sources(df):
+    """
+    IP başına ilk görülme özetini birleştirir: ilk olayın zamanı, kullanıcısı
+    ve türü; en son zaman; sayaçların toplamı; en erken RDP oturumu ve kullanıcısı.
+    """
+    firsts = df.sort_values("first", kind="stable").drop_duplicates("ip")[["ip", "first", "user", "type"]]
+    totals = df.groupby("ip", sort=False).agg(last=("last", "max"), success=("success", "sum"),
+                                             failure=("failure", "sum"), rdp=("rdp", "sum"))
+    rdps = (df.sort_values("rdp_first", kind="stable").drop_duplicates("ip")
+            .set_index("ip")[["rdp_first", "rdp_user"]])
+    return firsts.join(totals, on="ip").join(rdps, on="ip").reset_index(drop=True)
+
+
+class _PartialAggregate:
+    """
+    Parça başına ara toplamları biriktirir. Ara toplamlar birleşmiş sonucun
+    iki katını geçince reduce ile tek tabloya indirilir; böylece her olay
+    amorti O(1) kez yeniden işlenir. reduce kendi çıktısına tekrar
+    uygulanabilir olmalıdır.
+    """
+    def __init__(self, reduce):
+        self.reduce = reduce
+        self.parts = []
+        self.pending = 0
+        self.reduced = 0
+
+    def add(self, part):
+        if part.empty:
+            return
+        self.parts.append(part)
+        self.pending += len(part)
+        if self.pending > max(REDUCE_MIN_ROWS, 2 * self.reduced):
+            self.result()
+
+    def result(self):
+        """ Birleşmiş tablo; parça eklenmemişse None. """
+        if not self.parts:
+            return None
+        if len(self.parts) > 1:
+            self.parts = [self.reduce(pd.concat(self.parts, ignore_index=True))]
+            self.reduced, self.pending = len(self.parts[0]), 0
+        return self.parts[0]
+
+
+class _Burst:
+    """ Bir kaynak IP'nin başarısız oturum patlaması; kullanıcılar kod olarak tutulur. """
+    __slots__ = ("ip", "start", "end", "count", "peak", "users")
+
+    def __init__(self, ip, window):
+        self.ip = ip
+        self.start, self.end = window[0][0], window[-1][0]
+        self.count = self.peak = len(window)
+        self.users = {user for _, user in window}
+
+    def row(self, labels):
+        users = sorted((labels[user] for user in self.users), key=str)
+        sample = ", ".join(str(u) for u in users[:BURST_SAMPLE_USERS])
+        if len(users) > BURST_SAMPLE_USERS:
+            sample += f", ... (+{len(users) - BURST_SAMPLE_USERS})"
+        return (self.start, self.end, labels[self.ip], self.count, self.peak, len(users), sample)
+
+
+class LogonAggregator:
+    """
+    Oturum olaylarını parça parça (LOGON_COLUMNS biçiminde DataFrame'ler)
+    alıp özet sayaçları günceller; tüm satırların bellekte tutulması
+    gerekmez. Tutulan durum olay sayısıyla değil; farklı (zaman dilimi,
+    kullanıcı, IP, oturum türü) anahtarları, kaynak IP'ler ve son
+    burst_window içindeki başarısız denemelerle büyür.
+
+    - Zaman dilimleri: bucket_size'lık dilimlerde kullanıcı / IP / oturum
+      türü başına başarılı, başarısız ve kapatma sayıları.
+    - Patlamalar: kaynak IP başına kayan pencerede 4625 sayısı; pencere
+      burst_threshold'a ulaşınca patlama açılır.
+    - İlk görülme: her kaynak IP'nin ilk / son görülmesi, ilk kullanıcısı
+      ve ilk RDP (tür 10) oturumu.
+
+    Metin değerleri tüm parçalarda ortak tamsayı kodlarına çevrilir; dilim
+    ve IP özetleri bu kodlar üzerinde vektörel toplanır, satır satır
+    işlenen yalnızca 4625 olaylarıdır. Olayların kabaca zaman sırasıyla
+    gelmesi beklenir (parser çıktısı öyledir); her parça kendi içinde
+    zamana göre sıralanır.
+    """
+    def __init__(self, bucket_size=BUCKET_SIZE, burst_window=BURST_WINDOW, burst_threshold=BURST_THRESHOLD):
+        self.bucket_size = pd.Timedelta(bucket_size)
+        self.burst_window = pd.Timedelta(burst_window)
+        self.burst_threshold = burst_threshold
+        self._bucket_us = self.bucket_size // pd.Timedelta(microseconds=1)
+        self._window_us = self.burst_window // pd.Timedelta(microseconds=1)
+        self.events = 0
+        self._labels = []         # kod -> değer (kullanıcı, IP, oturum türü)
+        self._codes = {}          # değer -> kod
+        self._buckets = _PartialAggregate(_reduce_buckets)
+        self._sources = _PartialAggregate(_reduce_sources)
+        self._failures = {}       # IP kodu -> deque[(zaman, kullanıcı kodu)] (son burst_window)
+        self._open_bursts = {}    # IP kodu -> _Burst
+        self._closed_bursts = []
+        self._latest = None       # Görülen en yeni 4625 zamanı (µs)
+
+    def _encode(self, values):
+        """ Değerleri ortak kodlara çevirir (eksik değer -1); farklı değer başına bir sözlük araması. """
+        values = pd.Categorical(values)
+        lookup = np.empty(len(values.categories) + 1, dtype=np.int64)
+        for i, value in enumerate(values.categories):
+            code = self._codes.get(value)
+            if code is None:
+                code = self._codes[value] = len(self._labels)
+                self._labels.append(value)
+            lookup[i] = code
+        lookup[-1] = -1
+        return lookup[values.codes]
+
+    def _decode(self, codes):
+        return np.array(self._labels + [None], dtype=object)[np.asarray(codes, dtype=np.int64)]
+
+    def _decode_categorical(self, codes):
+        """ Kodlardan doğrudan, kategorileri alfabetik sıralı 'category' dizisi üretir. """
+        codes = np.asarray(codes, dtype=np.int64)
+        used = np.unique(codes[codes >= 0])
+        categories = [self._labels[i] for i in used]
+        order = sorted(range(len(categories)), key=lambda i: str(categories[i]))
+        rank = np.empty(len(used), dtype=np.int64)
+        rank[order] = np.arange(len(used))
+        new_codes = np.where(codes >= 0, rank[np.searchsorted(used, codes).clip(max=max(len(used) - 1, 0))]
+                             if len(used) else -1, -1)
+        return pd.Categorical.from_codes(new_codes, categories=[categories[i] for i in order])
+
+    def add(self, df):
+        """ Bir olay parçasını (ör. iter_logon_event_batches çıktısı) sayaçlara ekler. """
+        if df is None or df.empty:
+            return
+        times = _micros(df["Timestamp"])
+        kinds = _event_kinds(df["Olay"])
+        order = np.argsort(times, kind="stable")
+        order = order[(times[order] != np.iinfo(np.int64).min) & (kinds[order] >= 0)]
+        if not len(order):
+            return
+        kinds = kinds[order]
+        frame = pd.DataFrame({
+            "time": times[order],
+            "user": self._encode(df["Kullanıcı Adı"])[order],
+            "ip": self._encode(df["Kaynak IP"])[order],
+            "type": self._encode(df["Oturum Türü"])[order],
+            "success": (kinds == SUCCESS).astype(np.int64),
+            "failure": (kinds == FAILURE).astype(np.int64),
+            "logoff": (kinds == LOGOFF).astype(np.int64),
+        })
+        self.events += len(frame)
+        self._buckets.add(_reduce_buckets(frame.assign(bucket=frame["time"] - frame["time"] % self._bucket_us)))
+        self._add_sources(frame)
+        self._add_failures(frame[kinds == FAILURE])
+
+    def observe(self, batches):
+        """ Parçaları olduğu gibi üretirken sayaçlara da ekler (generator). """
+        for batch in batches:
+            self.add(batch)
+            yield batch
+
+    # --- ilk görülme
+    def _add_sources(self, frame):
+        local = [self._codes[address] for address in LOCAL_ADDRESSES if address in self._codes]
+        frame = frame[(frame["ip"] >= 0) & ~frame["ip"].isin(local)]
+        rdp_code = self._codes.get(RDP_LOGON_TYPE, -2)
+        rdp = (frame["success"] == 1) & (frame["type"] == rdp_code)
+        self._sources.add(_reduce_sources(pd.DataFrame({
+            "ip": frame["ip"], "first": frame["time"], "user": frame["user"], "type": frame["type"],
+            "last": frame["time"], "success": frame["success"], "failure": frame["failure"],
+            "rdp": rdp.astype(np.int64),
+            "rdp_first": frame["time"].where(rdp, _NO_TIME), "rdp_user": frame["user"].where(rdp, -1),
+        })))
+
+    # --- 4625 patlamaları
+    def _add_failures(self, failures):
+        window_us = self._window_us
+        for time, ip, user in zip(failures["time"].tolist(), failures["ip"].tolist(), failures["user"].tolist()):
+            window = self._failures.get(ip)
+            if window is None:
+                window = self._failures[ip] = deque()
+            while window and window[0][0] < time - window_us:
+                window.popleft()
+            window.append((time, user))
+            burst = self._open_bursts.get(ip)
+            if burst is not None and time - burst.end > window_us:
+                self._closed_bursts.append(self._open_bursts.pop(ip))
+                burst = None
+            if burst is not None:
+                burst.end = max(burst.end, time)
+                burst.count += 1
+                burst.peak = max(burst.peak, len(window))
+                burst.users.add(user)
+            elif len(window) >= self.burst_threshold:
+                self._open_bursts[ip] = _Burst(ip, window)
+        if len(failures):
+            latest = int(failures["time"].iloc[-1])
+            self._latest = latest if self._latest is None else max(self._latest, latest)
+            self._expire_failures()
+
+    def _expire_failures(self):
+        """ Son burst_window içinde denemesi olmayan IP'lerin durumunu bırakır, açık patlamalarını kapatır. """
+        horizon = self._latest - self._window_us
+        for ip in [ip for ip, window in self._failures.items() if window[-1][0] < horizon]:
+            del self._failures[ip]
+            burst = self._open_bursts.pop(ip, None)
+            if burst is not None:
+                self._closed_bursts.append(burst)
+
+    # --- sonuçlar
+    def frames(self):
+        """
+        Özet tabloları {kategori: DataFrame} olarak döndürür. Akış sürerken
+        ara sonuç almak için de çağrılabilir (süren patlamalar o ana kadarki
+        halleriyle yer alır).
+        """
+        return {
+            BUCKET_CATEGORY: self._bucket_frame(),
+            BURST_CATEGORY: self._burst_frame(),
+            SOURCE_IP_CATEGORY: self._source_frame(),
+        }
+
+    def _bucket_frame(self):
+        buckets = self._buckets.result()
+        if buckets is None:
+            buckets = pd.DataFrame({column: np.empty(0, np.int64) for column in BUCKET_KEYS + COUNT_COLUMNS})
+        df = pd.DataFrame({
+            "Zaman Dilimi (UTC)": _utc(buckets["bucket"]),
+            "Kullanıcı Adı": self._decode_categorical(buckets["user"]),
+            "Kaynak IP": self._decode_categorical(buckets["ip"]),
+            "Oturum Türü": self._decode_categorical(buckets["type"]),
+            "Başarılı Oturum": buckets["success"].to_numpy(),
+            "Başarısız Deneme": buckets["failure"].to_numpy(),
+            "Oturum Kapatma": buckets["logoff"].to_numpy(),
+        }, columns=BUCKET_COLUMNS)
+        return df.sort_values(["Zaman Dilimi (UTC)", "Kullanıcı Adı", "Kaynak IP"], kind="stable",
+                              ignore_index=True)
+
+    def _burst_frame(self):
+        labels = self._labels + [None]
+        rows = [burst.row(labels) for burst in self._closed_bursts + list(self._open_bursts.values())]
+        df = pd.DataFrame(rows, columns=BURST_COLUMNS)
+        df["Başlangıç (UTC)"] = _utc(df["Başlangıç (UTC)"])
+        df["Bitiş (UTC)"] = _utc(df["Bitiş (UTC)"])
+        for column in ("Başarısız Deneme", "En Yoğun Pencere", "Hedef Kullanıcı Sayısı"):
+            df[column] = df[column].astype(np.int64)
+        return df.sort_values("Başlangıç (UTC)", kind="stable", ignore_index=True)
+
+    def _source_frame(self):
+        sources = self._sources.result()
+        if sources is None:
+            sources = pd.DataFrame({column: np.empty(0, np.int64) for column in
+                                    ("ip", "first", "user", "type", "last", "success", "failure", "rdp",
+                                     "rdp_first", "rdp_user")})
+        rdp_first = sources["rdp_first"].to_numpy()
+        df = pd.DataFrame({
+            "İlk Görülme (UTC)": _utc(sources["first"]),
+            "Son Görülme (UTC)": _utc(sources["last"]),
+            "Kaynak IP": self._decode(sources["ip"]),
+            "İlk Kullanıcı": self._decode(sources["user"]),
+            "İlk Oturum Türü": self._decode(sources["type"]),
+            "Başarılı Oturum": sources["success"].to_numpy(),
+            "Başarısız Deneme": sources["failure"].to_numpy(),
+            "RDP Oturumu": sources["rdp"].to_numpy(),
+            "İlk RDP Oturumu (UTC)": _utc(rdp_first).where(rdp_first != _NO_TIME),
+            "İlk RDP Kullanıcısı": self._decode(sources["rdp_user"]),
+        }, columns=SOURCE_IP_COLUMNS)
+        return df.sort_values("İlk Görülme (UTC)", kind="stable", ignore_index=True)
+
+
+def analyze_logon_frame(df, **kwargs):
+    """ Tek bir oturum tablosunun özet kategorileri (LogonAggregator ile aynı çıktı). """
+    aggregator = LogonAggregator(**kwargs)
+    aggregator.add(df)
+    return aggregator.frames()
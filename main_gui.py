@@ -1,16 +1,231 @@
 import sys
 import os
 from pathlib import Path
-import pandas as pd
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QFileDialog,
-                             QListWidget, QTableWidget, QTableWidgetItem,
+                             QListWidget, QTableView, QHeaderView,
                              QHBoxLayout, QWidget, QVBoxLayout, QAbstractItemView,
-                             QStatusBar, QLabel, QMessageBox)
-from PyQt5.QtCore import Qt
-
-# Bizim analiz fonksiyonlarımızı içeren dosyayı import et
+                             QStatusBar, QLabel, QMessageBox, QMenu, QLineEdit, QInputDialog)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+import threading
+import time
+
+import parser_metrics
+from dataframe_model import DataFrameModel
+
+# --- ANALİZ MODÜLLERİ (gecikmeli yükleme) ---
+# registry_parser ve diğerleri pandas, python-evtx ve python-registry'yi
+# yükler; bu birkaç saniye sürebilir. Pencere önce açılır, modüller ardından
+# arka planda (preloadAnalysisModules) ya da ilk kullanımda yüklenir.
 # (main_gui.py ve registry_parser.py aynı klasörde olmalı)
-import registry_parser
+pd = registry_parser = columnar = exporter = hive_index = logon_analytics = result_cache = timeline = None
+_modules_lock = threading.Lock()
+_modules_loaded = False
+
+TIMELINE_CATEGORY = "Zaman Çizelgesi" # timeline.TIMELINE_CATEGORY; kategori listesi modülü beklemez
+USB_HISTORY_CATEGORY = "USB Cihaz Geçmişi" # registry_parser.USB_HISTORY_CATEGORY
+# logon_analytics.ANALYTICS_CATEGORIES; oturum logları okunurken üretilen özetler
+LOGON_ANALYTICS_CATEGORIES = ("Oturum İstatistikleri", "Başarısız Oturum Patlamaları", "Kaynak IP İlk Görülme")
+# registry_parser.CARVED_CATEGORIES; yalnızca kurtarma modu açıkken listelenir
+CARVED_CATEGORIES = ("Oturum Logları (Kurtarılan)", "USB Depolama Aygıtları (Kurtarılan)",
+                     "Tüm USB Aygıtları (Kurtarılan)", "Kurulu Programlar (Kurtarılan)", "Silinmiş Registry Değerleri")
+
+def load_analysis_modules():
+    """
+    Analiz modüllerini import eder ve bu modülün global adlarına bağlar.
+    Herhangi bir iş parçacığından çağrılabilir; yükleme bir kez yapılır,
+    süren bir yükleme varsa bitmesi beklenir.
+    """
+    global pd, registry_parser, columnar, exporter, hive_index, logon_analytics, result_cache, timeline
+    global _modules_loaded
+    with _modules_lock:
+        if _modules_loaded:
+            return
+        import pandas as pd
+        import registry_parser
+        import columnar
+        import exporter
+        import hive_index
+        import logon_analytics
+        import result_cache
+        import timeline
+        _modules_loaded = True
+
+# --- ARKA PLAN İŞLERİ ---
+class JobSignals(QObject):
+    """ Arka plan işinin ana iş parçacığına gönderdiği sinyaller. """
+    progress = pyqtSignal(int, str)       # yükleme no, mesaj
+    result = pyqtSignal(int, dict)        # yükleme no, {kategori: DataFrame}
+    error = pyqtSignal(int, str, str)     # yükleme no, iş adı, hata
+    finished = pyqtSignal(int, str)       # yükleme no, iş adı
+    metrics = pyqtSignal(int, dict)       # yükleme no, ParserRun.to_dict()
+
+class AnalysisJob(QRunnable):
+    """
+    Bir parser'ı QThreadPool üzerinde çalıştırır. fn(report, cancel_event, metrics)
+    {kategori: DataFrame} döndürür; iptal edilirse sonuç gönderilmez.
+    metrics'e kaydedilen parser ölçümleri canlı olarak sinyalle iletilir.
+    """
+    def __init__(self, load_id, name, fn, cancel_event):
+        super().__init__()
+        self.load_id = load_id
+        self.name = name
+        self.fn = fn
+        self.cancel_event = cancel_event
+        self.signals = JobSignals()
+
+    def run(self):
+        try:
+            def report(message, frames=None):
+                # frames: işin o ana kadarki ara sonucu (ör. biten kullanıcı profilleri)
+                self.signals.progress.emit(self.load_id, message)
+                if frames is not None and not self.cancel_event.is_set():
+                    self.signals.result.emit(self.load_id, frames)
+            metrics = parser_metrics.MetricsCollector(
+                on_update=lambda run: self.signals.metrics.emit(self.load_id, run.to_dict()))
+            frames = self.fn(report, self.cancel_event, metrics)
+            if frames is not None and not self.cancel_event.is_set():
+                self.signals.result.emit(self.load_id, frames)
+        except Exception as e:
+            self.signals.error.emit(self.load_id, self.name, str(e))
+        finally:
+            self.signals.finished.emit(self.load_id, self.name)
+
+def security_log_job(sec_log_paths):
+    """
+    Oturum loglarını parça parça okur; her parçada iptal isteğini kontrol eder.
+    Birden fazla log (arşivler, farklı bilgisayarlar) zamana göre birleştirilir.
+    Özet kategoriler (logon_analytics) parçalar geldikçe güncellenir.
+    """
+    def run(report, cancel_event, metrics):
+        stats = {}
+        batches = []
+        row_count = 0
+        aggregator = logon_analytics.LogonAggregator()
+        batch_iter = registry_parser.iter_logon_event_batches(
+            sec_log_paths, batch_size=10000, workers=os.cpu_count(), stats=stats, metrics=metrics)
+        try:
+            for batch in aggregator.observe(batch_iter):
+                if cancel_event.is_set():
+                    return None
+                batches.append(batch)
+                row_count += len(batch)
+                report(f"Oturum logları: {stats.get('records', 0)} kayıt tarandı, {row_count} olay bulundu...")
+        finally:
+            batch_iter.close() # İptalde bekleyen chunk işlerini de iptal eder
+        df = columnar.concat_frames(batches) if batches else registry_parser.logon_column_buffer().to_frame()
+        return {"Oturum Logları": df, **aggregator.frames()}
+    return run
+
+def hive_artifacts_job(hive_path, artifacts, session):
+    def run(report, cancel_event, metrics):
+        if cancel_event.is_set():
+            return None
+        return registry_parser.parse_hive_artifacts(hive_path, artifacts, session=session, metrics=metrics)
+    return run
+
+USER_PROFILES_JOB = "Kullanıcı Profilleri"
+
+def user_profiles_job(user_hives):
+    """
+    Tüm kullanıcı hive'larını paralel tarar; her profil bittiğinde birleşik
+    tablo ara sonuç olarak arayüze gönderilir.
+    """
+    def run(report, cancel_event, metrics):
+        profile_frames = {}
+        frames_iter = registry_parser.iter_user_profile_frames(user_hives, workers=os.cpu_count(), metrics=metrics)
+        try:
+            for profile, frames in frames_iter:
+                if cancel_event.is_set():
+                    return None
+                profile_frames[profile] = frames
+                report(f"Kullanıcı profilleri: {len(profile_frames)}/{len(user_hives)} tamamlandı ({profile})",
+                       registry_parser.combine_user_frames(profile_frames))
+        finally:
+            frames_iter.close() # İptalde bekleyen profil işlerini de iptal eder
+        return registry_parser.combine_user_frames(profile_frames)
+    return run
+
+def device_history_job(data_frames):
+    """ SYSTEM ve SOFTWARE tabloları hazır olduktan sonra USB cihaz geçmişini birleştirir. """
+    def run(report, cancel_event, metrics):
+        if cancel_event.is_set():
+            return None
+        # SYSTEM tabloları yoksa (hive okunamadı) geçmiş boş tablo değil, hata olarak gösterilir
+        if data_frames.get(registry_parser.USBSTOR_ARTIFACT.name) is None:
+            return {registry_parser.USB_HISTORY_CATEGORY: None}
+        return {registry_parser.USB_HISTORY_CATEGORY: registry_parser.build_device_history(data_frames)}
+    return run
+
+def timeline_job(data_frames):
+    """ Tüm kategoriler hazır olduktan sonra zaman çizelgesini arka planda kurar. """
+    def run(report, cancel_event, metrics):
+        if cancel_event.is_set():
+            return None
+        report("Zaman çizelgesi oluşturuluyor...")
+        return {timeline.TIMELINE_CATEGORY: timeline.Timeline.from_frames(data_frames).frame}
+    return run
+
+CARVE_JOB = "Silinmiş Kayıt Kurtarma"
+
+def carve_job(case_folder):
+    """ Kurtarma modu: loglarda ve hive'larda silinmiş kayıt imzalarını tarar (şeritler paralel). """
+    def run(report, cancel_event, metrics):
+        if cancel_event.is_set():
+            return None
+        report("Silinmiş kayıtlar aranıyor (carving)...")
+        return registry_parser.carve_case(case_folder, workers=os.cpu_count(), metrics=metrics)
+    return run
+
+HIVE_INDEX_JOB = "Hive Arama Dizini"
+
+def hive_index_job(index, hives, session, force=False):
+    """
+    Vakanın hive'larını ([(ad, yol), ...]) arama dizinine ekler; değişmemiş
+    hive'lar atlanır. Kategori üretmez.
+    """
+    def run(report, cancel_event, metrics):
+        for label, hive_path in hives:
+            if cancel_event.is_set():
+                return None
+            report(f"'{label}' arama dizini kontrol ediliyor...")
+            index.index_hive(hive_path, session=session, force=force, cancel_event=cancel_event,
+                             report=report, metrics=metrics, label=label)
+        return None
+    return run
+
+EXPORT_JOB = "Dışa Aktarım"
+
+def export_job(data_frames, output_dir, output_format, category_sources, case_folder):
+    """
+    Yüklü kategorileri parça parça output_dir'e yazar ve manifest üretir.
+    Kategori üretmez; iptal edilirse yarım dosyalar silinir.
+    """
+    def run(report, cancel_event, metrics):
+        manifest = exporter.export_frames(data_frames, output_dir, output_format, category_sources=category_sources,
+                                          case_folder=case_folder, cancel_event=cancel_event, report=report)
+        if manifest is not None:
+            report(f"{len(manifest['categories'])} kategori ({manifest['total_rows']} satır) "
+                   f"'{output_dir}' klasörüne aktarıldı.")
+        return None
+    return run
+
+def cached_job(cache, job_name, source_paths, fn, force=False):
+    """
+    İşi sonuç önbelleği üzerinden çalıştırır: kaynak dosyalar değişmediyse
+    kategoriler diskten okunur. force=True önbelleği yok sayar ve yeniler.
+    """
+    def run(report, cancel_event, metrics):
+        key = cache.key(job_name, source_paths)
+        if not force:
+            frames = cache.load(key)
+            if frames is not None:
+                report(f"'{job_name}' sonuçları önbellekten yüklendi.")
+                return frames
+        frames = fn(report, cancel_event, metrics)
+        if frames is not None and not cancel_event.is_set():
+            cache.store(key, frames)
+        return frames
+    return run
 
 class ForensicAnalyzerApp(QMainWindow):
     def __init__(self):
@@ -22,6 +237,24 @@ class ForensicAnalyzerApp(QMainWindow):
         self.data_frames = {}
         self.case_folder_path = None
 
+        # Arka plan yüklemesi: EVTX işi uzun sürer, registry işlerini bekletmemesi için
+        # havuzda her iş kendi iş parçacığını alır. Havuz startInPool ile başlatılan iş
+        # sayısına göre büyür (yeni kaynak işleri de eklense); iş sıraya girmez.
+        self.thread_pool = QThreadPool()
+        self.load_id = 0
+        self.cancel_event = None
+        self.pending_jobs = set()
+        self.session = None
+        self.result_cache = None # Analiz modülleri yüklenince oluşturulur (ensureAnalysisModules)
+        self.timeline = None
+        self.timeline_started = False
+        self.history_started = False
+        self.hive_index = None
+        self.case_hive_paths = []
+        self.showing_search = False # Tabloda bir kategori yerine arama sonuçları var
+        self.category_sources = {} # Kategori -> kaynak dosyalar (dışa aktarım manifesti için)
+        self.export_cancel_event = None
+
         self.initUI()
 
     def initUI(self):
@@ -33,6 +266,24 @@ class ForensicAnalyzerApp(QMainWindow):
         loadAction.triggered.connect(self.loadCaseFolder)
         fileMenu.addAction(loadAction)
 
+        reloadAction = QAction('Vakayı &Yeniden Analiz Et (Önbelleği Yok Say)', self)
+        reloadAction.triggered.connect(self.reanalyzeCaseFolder)
+        fileMenu.addAction(reloadAction)
+
+        self.exportAction = QAction('Sonuçları &Dışa Aktar...', self)
+        self.exportAction.triggered.connect(self.exportResults)
+        fileMenu.addAction(self.exportAction)
+
+        # Açıkken sonraki yüklemelerde silinmiş kayıtlar da aranır
+        self.carveAction = QAction('Silinmiş Kayıtları &Kurtar (Carving)', self)
+        self.carveAction.setCheckable(True)
+        fileMenu.addAction(self.carveAction)
+
+        self.cancelAction = QAction('Yüklemeyi &İptal Et', self)
+        self.cancelAction.triggered.connect(self.cancelLoad)
+        self.cancelAction.setEnabled(False)
+        fileMenu.addAction(self.cancelAction)
+
         exitAction = QAction('&Çıkış', self)
         exitAction.triggered.connect(self.close)
         fileMenu.addAction(exitAction)
@@ -49,13 +300,19 @@ class ForensicAnalyzerApp(QMainWindow):
         # --- GÜNCELLEME: Liste güncellendi (RecentDocs kaldırıldı) ---
         self.category_list.addItems([
             "Oturum Logları",
+            *LOGON_ANALYTICS_CATEGORIES,
             "USB Depolama Aygıtları",
             "Tüm USB Aygıtları",
+            USB_HISTORY_CATEGORY, # USBSTOR, Enum\USB, MountedDevices ve WPD'nin seri numarasıyla birleşimi
+            "Bağlı Birimler (MountedDevices)",
+            "Kontrol Setleri",
             "Kurulu Programlar",
+            "Taşınabilir Aygıtlar (WPD)",
             "Çalıştırılan Programlar (UserAssist)",
             # "Son Erişilen Dosyalar (OpenSave)", # KALDIRILDI
             # "Son Erişilen Dosyalar (Explorer)", # KALDIRILDI
-            "Ağ Geçmişi"
+            "Ağ Geçmişi",
+            TIMELINE_CATEGORY # Tüm kategorilerin zamana göre birleşimi
         ])
         # ---------------------------------------------
 
@@ -64,47 +321,97 @@ class ForensicAnalyzerApp(QMainWindow):
         main_layout.addWidget(self.category_list)
 
         # --- Sağ Panel (Veri Tablosu) ---
-        self.data_table = QTableWidget()
+        # Tablo DataFrame'i doğrudan gösteren bir model üzerinden çalışır;
+        # hücreler yalnızca ekranda göründüklerinde biçimlendirilir.
+        self.table_model = DataFrameModel()
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
         self.data_table.setEditTriggers(QAbstractItemView.NoEditTriggers) # Düzenlemeyi engelle
         self.data_table.setAlternatingRowColors(True) # Satır renklerini farklı yap
-        self.data_table.setSortingEnabled(True) # Başlığa tıklayarak sıralamayı etkinleştir
-        main_layout.addWidget(self.data_table)
+        self.data_table.setSortingEnabled(True) # Başlığa tıklayarak sıralamayı etkinleştir (pandas ile)
+        # Satır yükseklikleri sabit; sütun genişlikleri en fazla 200 satırlık örnekten hesaplanır
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.data_table.horizontalHeader().setResizeContentsPrecision(200)
+        # Sağ tık: seçilen olayın zaman çizelgesindeki çevresi
+        self.data_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.data_table.customContextMenuRequested.connect(self.showTableMenu)
+
+        # Arama kutusu: vakanın hive'larının tamamında (anahtar, değer adı, veri) arar
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Tüm hive'larda ara (anahtar yolu, değer adı, veri) ve Enter'a basın...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.returnPressed.connect(self.searchHives)
+        right_layout = QVBoxLayout()
+        right_layout.addWidget(self.search_box)
+        right_layout.addWidget(self.data_table)
+        main_layout.addLayout(right_layout)
 
         # --- Durum Çubuğu ---
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
+        # Son parser ölçümünün canlı özeti (kayıt/sn, çözme ve tablo süreleri)
+        self.metricsLabel = QLabel()
+        self.statusBar.addPermanentWidget(self.metricsLabel)
         self.statusBar.showMessage("Hazır. Lütfen 'Dosya -> Vaka Klasörü Yükle...' seçeneği ile bir klasör seçin.")
 
+    def preloadAnalysisModules(self):
+        """ Pencere açıldıktan sonra analiz modüllerini arka planda yükler. """
+        threading.Thread(target=load_analysis_modules, name="analiz-modulleri", daemon=True).start()
+
+    def ensureAnalysisModules(self):
+        """ Analiz modüllerinin yüklenmesini bekler ve modüllere bağlı nesneleri oluşturur. """
+        if not _modules_loaded:
+            self.statusBar.showMessage("Analiz modülleri yükleniyor...")
+            QApplication.processEvents()
+        load_analysis_modules()
+        if self.result_cache is None:
+            self.result_cache = result_cache.ResultCache()
+            self.hive_index = hive_index.HiveIndex()
+
     def loadCaseFolder(self):
         """ Vaka klasörünü seçtirir ve analiz fonksiyonlarını çalıştırır. """
         folder_path = QFileDialog.getExistingDirectory(self, "Vaka Klasörünü Seç")
 
         if not folder_path: # Kullanıcı iptal ettiyse
             return
+        self.startCaseLoad(folder_path)
 
+    def reanalyzeCaseFolder(self):
+        """ Yüklü vakayı önbelleği kullanmadan baştan analiz eder. """
+        if self.case_folder_path is None:
+            self.loadCaseFolder()
+            return
+        self.startCaseLoad(self.case_folder_path, force=True)
+
+    def startCaseLoad(self, folder_path, force=False):
+        """ Klasördeki kanıt dosyalarını kontrol eder ve analiz işlerini başlatır. """
         # --- ÖNCEKİ VERİLERİ TEMİZLE ---
         self.data_frames = {}
-        self.data_table.setRowCount(0)
-        self.data_table.setColumnCount(0)
+        self.table_model.setDataFrame(None)
+        self.showing_search = False
         # -----------------------------
 
         self.case_folder_path = Path(folder_path)
         self.statusBar.showMessage(f"Vaka klasörü yükleniyor: {self.case_folder_path}")
         QApplication.processEvents() # Arayüzün güncellenmesini sağla
+        self.ensureAnalysisModules()
 
         # Gerekli dosyaların yollarını oluştur
-        sec_log_path = self.case_folder_path / "Security.evtx"
+        # Security.evtx, Archive-Security-*.evtx ve alt klasörlerdeki (ör. DC başına) loglar
+        sec_log_paths = registry_parser.discover_security_logs(self.case_folder_path)
         system_hive_path = self.case_folder_path / "SYSTEM"
         software_hive_path = self.case_folder_path / "SOFTWARE"
-        ntuser_hive_path = self.case_folder_path / "NTUSER.DAT"
+        # Kökteki NTUSER.DAT ve Users\*\NTUSER.DAT profilleri
+        user_hives = registry_parser.discover_user_hives(self.case_folder_path)
+        user_hive_paths = [hive_path for _, hive_path in user_hives]
 
         # Dosyaların var olup olmadığını kontrol et
         missing_files = []
-        if not sec_log_path.exists(): missing_files.append(f"- Oturum Logları (Security.evtx)")
+        if not sec_log_paths: missing_files.append(f"- Oturum Logları (Security.evtx veya Archive-Security-*.evtx)")
         if not system_hive_path.exists(): missing_files.append(f"- USB Cihazları (SYSTEM)")
         if not software_hive_path.exists(): missing_files.append(f"- Programlar/Ağ (SOFTWARE)")
         # NTUSER.DAT sadece UserAssist için gerekli artık
-        if not ntuser_hive_path.exists(): missing_files.append(f"- Çalıştırılan Programlar (NTUSER.DAT)") 
+        if not user_hives: missing_files.append(f"- Çalıştırılan Programlar (NTUSER.DAT veya Users\\*\\NTUSER.DAT)")
 
         if missing_files:
             QMessageBox.warning(self, "Eksik Dosyalar",
@@ -113,41 +420,200 @@ class ForensicAnalyzerApp(QMainWindow):
             self.statusBar.showMessage("Yükleme başarısız: Eksik dosyalar.")
             return
 
-        # --- Analiz Fonksiyonlarını Çağır ---
-        try:
-            self.statusBar.showMessage("Oturum logları analiz ediliyor...")
-            QApplication.processEvents()
-            self.data_frames["Oturum Logları"] = registry_parser.parse_security_log(sec_log_path)
-
-            self.statusBar.showMessage("USB cihazları analiz ediliyor...")
-            QApplication.processEvents()
-            usb_storage_df, usb_all_df = registry_parser.parse_usb_devices(system_hive_path)
-            self.data_frames["USB Depolama Aygıtları"] = usb_storage_df
-            self.data_frames["Tüm USB Aygıtları"] = usb_all_df
-
-            self.statusBar.showMessage("Kurulu programlar analiz ediliyor...")
-            QApplication.processEvents()
-            self.data_frames["Kurulu Programlar"] = registry_parser.parse_installed_programs(software_hive_path)
-
-            self.statusBar.showMessage("Çalıştırılan programlar (UserAssist) analiz ediliyor...")
-            QApplication.processEvents()
-            self.data_frames["Çalıştırılan Programlar (UserAssist)"] = registry_parser.parse_user_assist(ntuser_hive_path)
-
-            # --- KALDIRILDI: Recent Files MRU çağrıları ---
-
-            self.statusBar.showMessage("Ağ geçmişi analiz ediliyor...")
-            QApplication.processEvents()
-            self.data_frames["Ağ Geçmişi"] = registry_parser.parse_network_list(software_hive_path)
-
-            # --- KALDIRILDI: Zaman Çizelgesi oluşturma ---
-
+        # --- Analiz Fonksiyonlarını Arka Planda Başlat ---
+        self.cancelLoad()
+        self.load_id += 1
+        self.cancel_event = threading.Event()
+        # Her hive bu vaka için yalnızca bir kez açılır; her iş farklı bir hive kullanır
+        session = self.session = registry_parser.HiveSession()
+        # Her hive kendi artefakt listesiyle tek geçişte taranır;
+        # artefakt adları soldaki kategori adlarıyla aynıdır.
+        # Kullanıcı hive'ları bir süreç havuzunda paralel taranır ve tek tabloda birleşir.
+        jobs = [
+            ("Oturum Logları", sec_log_paths, security_log_job(sec_log_paths)),
+            ("SYSTEM", [system_hive_path], hive_artifacts_job(system_hive_path, registry_parser.SYSTEM_ARTIFACTS, session)),
+            ("SOFTWARE", [software_hive_path], hive_artifacts_job(software_hive_path, registry_parser.SOFTWARE_ARTIFACTS, session)),
+            (USER_PROFILES_JOB, user_hive_paths, user_profiles_job(user_hives)),
+        ]
+        # --- KALDIRILDI: Recent Files MRU çağrıları ---
+        # Zaman çizelgesi kategori işleri bittikten sonra onJobFinished'da kurulur
+        self.timeline = None
+        self.timeline_started = False
+        self.history_started = False
+        self.pending_jobs = set()
+        for name, source_paths, fn in jobs:
+            self.startJob(name, cached_job(self.result_cache, name, source_paths, fn, force=force))
+        # Arama dizini: ilk yüklemede hive başına bir gezinti, sonrakilerde yalnızca parmak izi kontrolü
+        index_hives = [("SYSTEM", system_hive_path), ("SOFTWARE", software_hive_path)]
+        index_hives += [(f"NTUSER.DAT ({profile})", hive_path) for profile, hive_path in user_hives]
+        self.case_hive_paths = [hive_path for _, hive_path in index_hives]
+        self.category_sources = {name: sec_log_paths for name in ("Oturum Logları",) + LOGON_ANALYTICS_CATEGORIES}
+        for source_paths, artifacts in (([system_hive_path], registry_parser.SYSTEM_ARTIFACTS),
+                                        ([software_hive_path], registry_parser.SOFTWARE_ARTIFACTS),
+                                        (user_hive_paths, registry_parser.NTUSER_ARTIFACTS)):
+            self.category_sources.update({artifact.name: source_paths for artifact in artifacts})
+        self.category_sources[registry_parser.USB_HISTORY_CATEGORY] = [system_hive_path, software_hive_path]
+        self.category_sources[timeline.TIMELINE_CATEGORY] = sec_log_paths + [system_hive_path, software_hive_path] + user_hive_paths
+        self.startJob(HIVE_INDEX_JOB, hive_index_job(self.hive_index, index_hives, session, force=force))
+        carve = self.carveAction.isChecked()
+        self.showCarvedCategories(carve)
+        if carve:
+            carve_sources = sec_log_paths + [system_hive_path, software_hive_path]
+            self.startJob(CARVE_JOB, cached_job(self.result_cache, CARVE_JOB, carve_sources,
+                                                carve_job(self.case_folder_path), force=force))
+            self.category_sources.update({name: carve_sources for name in CARVED_CATEGORIES})
+        self.cancelAction.setEnabled(True)
+        self.statusBar.showMessage(f"Analiz ediliyor: {', '.join(sorted(self.pending_jobs))}")
+
+    def showCarvedCategories(self, show):
+        """ Kurtarılan kayıt kategorilerini zaman çizelgesinin önüne ekler ya da listeden kaldırır. """
+        for name in CARVED_CATEGORIES:
+            items = self.category_list.findItems(name, Qt.MatchExactly)
+            if show and not items:
+                timeline_row = self.category_list.row(self.category_list.findItems(TIMELINE_CATEGORY, Qt.MatchExactly)[0])
+                self.category_list.insertItem(timeline_row, name)
+            elif not show:
+                for item in items:
+                    self.category_list.takeItem(self.category_list.row(item))
+
+    def startJob(self, name, fn):
+        """ fn'i bu yüklemenin işi olarak havuzda başlatır. """
+        self.pending_jobs.add(name)
+        job = AnalysisJob(self.load_id, name, fn, self.cancel_event)
+        job.signals.progress.connect(self.onJobProgress)
+        job.signals.metrics.connect(self.onJobMetrics)
+        job.signals.result.connect(self.onJobResult)
+        job.signals.error.connect(self.onJobError)
+        job.signals.finished.connect(self.onJobFinished)
+        self.startInPool(job)
+
+    def startInPool(self, job):
+        """
+        İşi havuzda hemen başlatır: tüm iş parçacıkları doluysa (ör. iptal edilen
+        yüklemenin işleri hâlâ sürüyorsa) havuz bir iş parçacığı büyütülür.
+        Boşta kalan iş parçacıkları QThreadPool'un süre aşımıyla kapanır.
+        """
+        needed = self.thread_pool.activeThreadCount() + 1
+        if needed > self.thread_pool.maxThreadCount():
+            self.thread_pool.setMaxThreadCount(needed)
+        self.thread_pool.start(job)
+
+    def cancelLoad(self):
+        """ Süren yüklemeyi iptal eder; işlerin geç gelen sonuçları yok sayılır. """
+        if self.cancel_event is not None and self.pending_jobs:
+            self.cancel_event.set()
+            self.pending_jobs = set()
+            self.load_id += 1
+            self.session = None # Süren işler bitince serbest kalır
+            self.cancelAction.setEnabled(False)
+            self.statusBar.showMessage("Yükleme iptal edildi.")
+
+    def onJobMetrics(self, load_id, run):
+        """ Parser ölçümlerini durum çubuğunun sağında gösterir. """
+        if load_id != self.load_id:
+            return
+        phases = run["phases"]
+        self.metricsLabel.setText(
+            f"{run['parser']}: {run['records_scanned']} taranan / {run['records_emitted']} satır · "
+            f"{run['records_per_sec']:.0f} kayıt/sn · çözme {phases.get('decode', 0):.1f} sn · "
+            f"tablo {phases.get('frame', 0):.1f} sn")
+        self.metricsLabel.setToolTip(f"{run['source']}\n{run['bytes_read'] / (1024 * 1024):.1f} MB okundu, "
+                                     f"{run['wall_seconds']:.2f} sn")
+
+    def onJobProgress(self, load_id, message):
+        if load_id == self.load_id:
+            self.statusBar.showMessage(message)
+
+    def onJobResult(self, load_id, frames):
+        """ Bir işin kategorileri hazır olur olmaz gösterilir. """
+        if load_id != self.load_id:
+            return
+        self.data_frames.update(frames)
+        if timeline.TIMELINE_CATEGORY in frames:
+            self.timeline = timeline.Timeline(frames[timeline.TIMELINE_CATEGORY])
+        current_item = self.category_list.currentItem()
+        if current_item is None:
+            if not self.showing_search:
+                self.category_list.setCurrentRow(0) # İlk kategoriyi otomatik seç
+        elif current_item.text() in frames:
+            self.displayData(current_item)
+
+    def onJobError(self, load_id, name, message):
+        if load_id == self.load_id:
+            QMessageBox.critical(self, "Analiz Hatası", f"'{name}' analizi sırasında bir hata oluştu:\n{message}")
+
+    def onJobFinished(self, load_id, name):
+        if load_id != self.load_id:
+            return
+        self.pending_jobs.discard(name)
+        # USB cihaz geçmişi iki hive'ın tablolarını birleştirir; zaman çizelgesinden önce tamamlanır
+        if not self.history_started and not self.pending_jobs & {"SYSTEM", "SOFTWARE"}:
+            self.history_started = True
+            self.startJob(USB_HISTORY_CATEGORY, device_history_job(dict(self.data_frames)))
+        # Zaman çizelgesi arama dizinini beklemez; yalnızca kategori işlerinin bitmesini bekler
+        if not self.timeline_started and self.pending_jobs <= {HIVE_INDEX_JOB}:
+            self.timeline_started = True
+            # Kategorilerin anlık kopyası: iş sırasında data_frames değişebilir
+            self.startJob(timeline.TIMELINE_CATEGORY, timeline_job(dict(self.data_frames)))
+        if self.pending_jobs:
+            self.statusBar.showMessage(f"'{name}' tamamlandı. Devam eden: {', '.join(sorted(self.pending_jobs))}")
+            return
+        self.cancelAction.setEnabled(False)
+        self.session.close()
+        self.session = None
+        failed = sorted(category for category, df in self.data_frames.items() if df is None)
+        if failed: # Taranamayan kaynaklar 0 satırlık kategori gibi görünmemeli
+            self.statusBar.showMessage(f"Analiz tamamlandı. Analiz edilemeyen: {', '.join(failed)}")
+        else:
             self.statusBar.showMessage("Analiz tamamlandı. Soldaki listeden bir kategori seçin.")
-            self.category_list.setCurrentRow(0) # İlk kategoriyi (Oturum Logları) otomatik seç
-            self.displayData(self.category_list.currentItem())
+        if self.category_list.currentItem() is None and not self.showing_search:
+            self.category_list.setCurrentRow(0)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Analiz Hatası", f"Analiz sırasında bir hata oluştu:\n{e}")
-            self.statusBar.showMessage("Analiz başarısız.")
+    def exportResults(self):
+        """ Yüklü kategorileri seçilen biçimde bir klasöre aktarır (arka planda). """
+        if not self.data_frames:
+            QMessageBox.information(self, "Dışa Aktarım", "Dışa aktarılacak sonuç yok. Önce bir vaka yükleyin.")
+            return
+        if self.export_cancel_event is not None:
+            QMessageBox.information(self, "Dışa Aktarım", "Süren bir dışa aktarım var.")
+            return
+        if self.pending_jobs:
+            answer = QMessageBox.question(self, "Dışa Aktarım",
+                                          "Analiz henüz tamamlanmadı; yalnızca hazır kategoriler aktarılacak. Devam edilsin mi?")
+            if answer != QMessageBox.Yes:
+                return
+        labels = list(exporter.FORMAT_LABELS.values())
+        label, ok = QInputDialog.getItem(self, "Dışa Aktarım", "Çıktı biçimi:", labels, 0, False)
+        if not ok:
+            return
+        output_format = list(exporter.FORMAT_LABELS)[labels.index(label)]
+        output_dir = QFileDialog.getExistingDirectory(self, "Dışa Aktarım Klasörünü Seç")
+        if not output_dir:
+            return
+        self.startExport(Path(output_dir), output_format)
+
+    def startExport(self, output_dir, output_format):
+        # Kategorilerin anlık kopyası: aktarım sırasında yeni sonuçlar gelebilir
+        fn = export_job(dict(self.data_frames), output_dir, output_format, self.category_sources,
+                        self.case_folder_path)
+        self.export_cancel_event = threading.Event()
+        job = AnalysisJob(self.load_id, EXPORT_JOB, fn, self.export_cancel_event)
+        job.signals.progress.connect(self.onJobProgress)
+        job.signals.error.connect(self.onJobError)
+        job.signals.finished.connect(self.onExportFinished)
+        self.exportAction.setEnabled(False)
+        self.statusBar.showMessage(f"Sonuçlar '{output_dir}' klasörüne aktarılıyor...")
+        self.startInPool(job)
+
+    def onExportFinished(self, load_id, name):
+        self.export_cancel_event = None
+        self.exportAction.setEnabled(True)
+
+    def closeEvent(self, event):
+        self.cancelLoad()
+        if self.export_cancel_event is not None:
+            self.export_cancel_event.set()
+        super().closeEvent(event)
 
 
     # displayData fonksiyonu aynı kalabilir
@@ -155,29 +621,85 @@ class ForensicAnalyzerApp(QMainWindow):
         """ Seçilen kategoriye ait DataFrame'i sağdaki tabloya yükler. """
         if current_item is None or not self.data_frames:
             return
+        self.showing_search = False
         category_name = current_item.text()
         df = self.data_frames.get(category_name)
+        failed_profiles = registry_parser.failed_user_profiles(self.data_frames, category_name)
+        failed_note = f" Taranamayan profiller: {', '.join(failed_profiles)}" if failed_profiles else ""
         if df is None or df.empty:
-            self.data_table.setRowCount(0)
-            self.data_table.setColumnCount(0)
-            if df is None: self.statusBar.showMessage(f"'{category_name}' için veri bulunamadı.")
-            else: self.statusBar.showMessage(f"'{category_name}' için kayıt bulunamadı.")
-            return
-        self.statusBar.showMessage(f"'{category_name}' verisi yükleniyor ({len(df)} satır)...")
-        QApplication.processEvents()
-        self.data_table.setRowCount(df.shape[0])
-        self.data_table.setColumnCount(df.shape[1])
-        self.data_table.setHorizontalHeaderLabels(df.columns)
-        for row_idx, row in enumerate(df.values):
-            for col_idx, value in enumerate(row):
-                if isinstance(value, pd.Timestamp):
-                    display_value = value.strftime('%Y-%m-%d %H:%M:%S') if pd.notna(value) else ""
-                else:
-                    display_value = str(value) if pd.notna(value) else ""
-                item = QTableWidgetItem(display_value)
-                self.data_table.setItem(row_idx, col_idx, item)
+            self.table_model.setDataFrame(None)
+            if df is None: self.statusBar.showMessage(f"'{category_name}' için veri bulunamadı.{failed_note}")
+            else: self.statusBar.showMessage(f"'{category_name}' için kayıt bulunamadı.{failed_note}")
+            return
+        # Önceki kategorinin sıralama göstergesi yeni tabloya taşınmaz
+        self.data_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table_model.setDataFrame(df)
+        self.data_table.resizeColumnsToContents()
+        self.statusBar.showMessage(f"'{category_name}' verisi yüklendi ({len(df)} satır).{failed_note}")
+
+    def searchHives(self):
+        """ Arama kutusundaki metni vakanın hive'larında arar ve sonuçları tabloda gösterir. """
+        query = self.search_box.text().strip()
+        if not query or not self.case_hive_paths:
+            return
+        started = time.perf_counter()
+        try:
+            results = self.hive_index.search(query, hive_paths=self.case_hive_paths)
+        except Exception as e:
+            QMessageBox.critical(self, "Arama Hatası", f"Arama yapılamadı:\n{e}")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.showing_search = True
+        self.category_list.blockSignals(True) # Sonuçlar bir kategoriye ait değil
+        self.category_list.setCurrentItem(None)
+        self.category_list.blockSignals(False)
+        self.data_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table_model.setDataFrame(results)
+        self.data_table.resizeColumnsToContents()
+        message = f"'{query}' için {len(results)} sonuç ({elapsed_ms:.0f} ms)."
+        if HIVE_INDEX_JOB in self.pending_jobs:
+            message += " Arama dizini henüz tamamlanmadı; sonuçlar eksik olabilir."
+        self.statusBar.showMessage(message)
+
+    def _selectedEventTime(self):
+        """ Tabloda seçili satırın olay zamanını döndürür; zamanı olmayan kategorilerde None. """
+        index = self.data_table.currentIndex()
+        current_item = self.category_list.currentItem()
+        if not index.isValid() or current_item is None:
+            return None
+        if current_item.text() == timeline.TIMELINE_CATEGORY:
+            time_column = "Zaman (UTC)"
+        else:
+            time_column = next((source.time_column for source in timeline.TIMELINE_SOURCES
+                                if source.category == current_item.text()), None)
+        if time_column is None or time_column not in self.table_model.dataFrame().columns:
+            return None
+        value = pd.to_datetime(self.table_model.value(index.row(), time_column), utc=True, errors="coerce")
+        return None if pd.isna(value) else value
+
+    def showTableMenu(self, position):
+        moment = self._selectedEventTime()
+        if moment is None or self.timeline is None:
+            return
+        menu = QMenu(self)
+        for minutes in (10, 60):
+            action = menu.addAction(f"Zaman çizelgesinde çevresini göster (±{minutes} dk)")
+            action.triggered.connect(lambda _, m=minutes: self.showTimelineAround(moment, m))
+        menu.exec_(self.data_table.viewport().mapToGlobal(position))
+
+    def showTimelineAround(self, moment, minutes):
+        """ Zaman çizelgesini seçilen olayın ±minutes dakikalık çevresiyle gösterir. """
+        events = self.timeline.around(moment, pd.Timedelta(minutes=minutes))
+        timeline_item = self.category_list.findItems(timeline.TIMELINE_CATEGORY, Qt.MatchExactly)[0]
+        self.showing_search = False
+        self.category_list.blockSignals(True) # Tam zaman çizelgesini yüklemesin
+        self.category_list.setCurrentItem(timeline_item)
+        self.category_list.blockSignals(False)
+        self.data_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table_model.setDataFrame(events)
         self.data_table.resizeColumnsToContents()
-        self.statusBar.showMessage(f"'{category_name}' verisi yüklendi.")
+        self.statusBar.showMessage(
+            f"{moment:%Y-%m-%d %H:%M:%S} çevresinde (±{minutes} dk) {len(events)} olay gösteriliyor.")
 
 
 # --- Uygulamayı Başlat ---
@@ -185,4 +707,6 @@ if __name__ == '__main__':
     app = QApplication(sys.argv)
     mainWin = ForensicAnalyzerApp()
     mainWin.show()
+    # Ağır modüller olay döngüsü başlayıp pencere çizildikten sonra yüklenir
+    QTimer.singleShot(0, mainWin.preloadAnalysisModules)
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,217 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource # Yalnızca Unix; Windows'ta süreç tepe belleği raporlanmaz
+except ImportError:
+    resource = None
+
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else None
+
+
+def _process_peak_rss_bytes():
+    """ Sürecin ömrü boyunca ulaştığı tepe bellek (Unix); önceki çalıştırmaları da kapsar. """
+    if resource is None:
+        return None
+    # Linux'ta ru_maxrss KB cinsindendir
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _current_rss_bytes():
+    """ Sürecin şu anki yerleşik belleği (Linux /proc); okunamazsa None. """
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class ParserRun:
+    """
+    Tek bir parser çalıştırmasının ölçümleri.
+
+    records_scanned: incelenen kayıt/anahtar sayısı (EVTX kaydı, hive anahtarı)
+    records_emitted: üretilen satır sayısı
+    bytes_read:      okunan kaynak dosya boyutu
+    phases:          {"decode": sn, "frame": sn, ...}; decode = kayıt/değer
+                     çözme, frame = DataFrame oluşturma süresi
+    counters:        parser'a özgü sayaçlar (ör. XML yoluna düşen kayıtlar)
+    peak_rss_bytes:  çalıştırma içinde örneklenen en yüksek yerleşik bellek
+                     (başlangıçta, her update() ve faz sonunda ve bitişte; Linux)
+    rss_delta_bytes: peak_rss_bytes'ın başlangıçtaki yerleşik bellekten farkı;
+                     aynı anda çalışan işlerin belleği de buna dahildir
+    process_peak_rss_bytes: sürecin ömrü boyunca tepe belleği (ru_maxrss, Unix);
+                     bu çalıştırmaya özgü değildir
+    traced_peak_bytes: trace_memory açıkken tracemalloc ile ölçülen tepe
+    profile:         profile açıkken en pahalı fonksiyonların pstats özeti
+    """
+    def __init__(self, parser, source, collector=None):
+        self.parser = parser
+        self.source = str(source)
+        self.started_at = time.time()
+        self.wall_seconds = 0.0
+        self.records_scanned = 0
+        self.records_emitted = 0
+        self.bytes_read = 0
+        self.phases = {}
+        self.counters = {}
+        self.start_rss_bytes = _current_rss_bytes()
+        self.peak_rss_bytes = self.start_rss_bytes
+        self.process_peak_rss_bytes = None
+        self.traced_peak_bytes = None
+        self.profile = None
+        self.finished = False
+        self._collector = collector
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        """ Bloğun süresini phases[name] üzerine ekler. """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - started)
+            self.sample_rss()
+
+    def add_phase(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def read_source(self, path):
+        """ Kaynak dosyanın boyutunu bytes_read'e ekler. """
+        try:
+            self.bytes_read += os.path.getsize(path)
+        except OSError:
+            pass
+
+    def sample_rss(self):
+        """ Şu anki yerleşik belleği okur ve çalıştırmanın tepesini günceller. """
+        rss = _current_rss_bytes()
+        if rss is not None and (self.peak_rss_bytes is None or rss > self.peak_rss_bytes):
+            self.peak_rss_bytes = rss
+
+    @property
+    def rss_delta_bytes(self):
+        if self.peak_rss_bytes is None or self.start_rss_bytes is None:
+            return None
+        return self.peak_rss_bytes - self.start_rss_bytes
+
+    def update(self):
+        """ Süren bir çalıştırmanın ara değerlerini dinleyiciye iletir (canlı gösterim). """
+        self.wall_seconds = time.perf_counter() - self._started
+        self.sample_rss()
+        if self._collector is not None:
+            self._collector._notify(self)
+
+    @property
+    def records_per_sec(self):
+        return self.records_scanned / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self):
+        return {
+            "parser": self.parser,
+            "source": self.source,
+            "started_at": self.started_at,
+            "finished": self.finished,
+            "wall_seconds": self.wall_seconds,
+            "records_scanned": self.records_scanned,
+            "records_emitted": self.records_emitted,
+            "records_per_sec": self.records_per_sec,
+            "bytes_read": self.bytes_read,
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "process_peak_rss_bytes": self.process_peak_rss_bytes,
+            "traced_peak_bytes": self.traced_peak_bytes,
+            "profile": self.profile,
+        }
+
+    def summary(self):
+        """ Durum çubuğu için tek satırlık özet. """
+        phases = ", ".join(f"{name} {seconds:.2f} sn" for name, seconds in self.phases.items())
+        text = (f"{self.parser}: {self.records_scanned} taranan / {self.records_emitted} satır, "
+                f"{self.wall_seconds:.2f} sn ({self.records_per_sec:.0f} kayıt/sn)")
+        return f"{text}, {phases}" if phases else text
+
+
+class MetricsCollector:
+    """
+    Parser çalıştırmalarının ölçümlerini toplar. Parser'lara metrics=...
+    ile verilir; verilmezse ölçüm yapılmaz.
+
+    profile=True:      her çalıştırma cProfile ile profillenir
+    trace_memory=True: her çalıştırmanın Python tepe belleği tracemalloc ile
+                       ölçülür (yavaştır; aynı anda çalışan çalıştırmaları
+                       birbirinden ayıramaz)
+    on_update:         çalıştırma ilerledikçe ve bittiğinde ParserRun ile çağrılır
+    """
+    def __init__(self, profile=False, trace_memory=False, on_update=None):
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.on_update = on_update
+        self.runs = []
+        self._lock = threading.Lock()
+
+    def _notify(self, run):
+        if self.on_update is not None:
+            self.on_update(run)
+
+    @contextmanager
+    def run(self, parser, source):
+        """ Bloğu bir parser çalıştırması olarak ölçer ve ParserRun verir. """
+        parser_run = ParserRun(parser, source, self)
+        with self._lock:
+            self.runs.append(parser_run)
+        profiler = cProfile.Profile() if self.profile else None
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield parser_run
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                out = io.StringIO()
+                pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(25)
+                parser_run.profile = out.getvalue()
+            if tracing:
+                parser_run.traced_peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            parser_run.process_peak_rss_bytes = _process_peak_rss_bytes()
+            parser_run.finished = True
+            parser_run.update()
+
+    def to_dict(self):
+        with self._lock:
+            return {"runs": [run.to_dict() for run in self.runs]}
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+@contextmanager
+def measure(metrics, parser, source):
+    """
+    metrics bir MetricsCollector ise çalıştırmayı ona kaydeder; None ise
+    ölçümler hiçbir yere yazılmayan geçici bir ParserRun'a gider.
+    Parser'lar böylece ölçüm kodunu koşulsuz yazabilir.
+    """
+    if metrics is None:
+        yield ParserRun(parser, source)
+        return
+    with metrics.run(parser, source) as parser_run:
+        yield parser_run
@@ -2,351 +2,1571 @@ import Evtx.Evtx as evtx
 import pandas as pd
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from Registry import Registry
+from Registry import Registry, RegistryParse
+import os
+import fnmatch
+import hashlib
+import heapq
+import itertools
+import re
 import struct
-import codecs
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta, UTC
 
+import artifact_engine
+import columnar
+import binary_decode
+import carver
+import evtx_fast
+import parser_metrics
+
+
+# Parser çıktısını etkileyen her değişiklikte artırılır; sonuç önbelleği
+# (result_cache) eski sürümle üretilmiş kayıtları kullanmaz.
+PARSER_VERSION = "4"
+# Kullanıcı profillerinin kök klasörleri (NTUSER.DAT bunların altında aranır)
+USER_PROFILE_DIRS = ("users", "documents and settings")
+
+# --- OTURUM LOGLARI İÇİN ORTAK TANIMLAR
+LOGON_EVENT_IDS = (4624, 4625, 4634, 4647)
+LOGON_DATA_FIELDS = ("LogonType", "TargetUserName", "SubjectUserName", "IpAddress")
+LOGON_COLUMNS = ["Timestamp", "Olay", "Kullanıcı Adı", "Oturum Türü", "Kaynak IP"]
+# Az sayıda farklı değer alan sütunlar 'category' dtype'ında tutulur
+LOGON_CATEGORICAL = ("Olay", "Kullanıcı Adı", "Oturum Türü", "Kaynak IP")
+EVTX_NS = {'e': 'http://schemas.microsoft.com/win/2004/08/events/event'}
+EVENT_ID_DESCRIPTIONS = {
+    4624: "(4624) Başarılı Oturum Açma", 4625: "(4625) Başarısız Oturum Denemesi",
+    4634: "(4634) Oturum Kapatıldı", 4647: "(4647) Oturum Kullanıcı Tarafından Kapatıldı"
+}
+# Çok dosyalı birleştirmede aynı kayıt (Computer, EventRecordID) bu süre içinde
+# tekrar gelirse atılır; yalnızca bu penceredeki anahtarlar bellekte tutulur.
+MERGE_DEDUP_WINDOW = timedelta(minutes=10)
+MERGE_DEDUP_MAX_KEYS = 1000000
+MERGE_CHUNK_STEP = 8 # Çok dosyalı paralel okumada bir işin chunk sayısı
+# Vaka klasöründe aranan Security logları (canlı log ve rollover arşivleri)
+SECURITY_LOG_PATTERNS = ("security.evtx", "archive-security-*.evtx")
+LOGON_TYPE_DESCRIPTIONS = {
+    '0': '(0) Sistem', '2': '(2) İnteraktif', '3': '(3) Ağ', '4': '(4) Batch', '5': '(5) Hizmet',
+    '7': '(7) Kilit Açma', '8': '(8) Ağ Açık Metin', '9': '(9) Yeni Kimlik Bilgisi',
+    '10': '(10) Uzak İnteraktif (RDP)', '11': '(11) Önbellekli İnteraktif'
+}
+
+def _xml_event_fields(record):
+    """
+    Yavaş (yedek) yol: kaydı XML'e çevirip EventID ve EventData alanlarını okur.
+    EventID bulunamazsa (None, None) döndürür.
+    """
+    root = ET.fromstring(record.xml())
+    event_id_element = root.find('./e:System/e:EventID', namespaces=EVTX_NS)
+    if event_id_element is None: return None, None
+    event_id = int(event_id_element.text)
+    data_fields = {}
+    if event_id in LOGON_EVENT_IDS:
+        computer_element = root.find('./e:System/e:Computer', namespaces=EVTX_NS)
+        if computer_element is not None:
+            data_fields[evtx_fast.COMPUTER_FIELD] = computer_element.text
+        event_data_element = root.find('.//e:EventData', namespaces=EVTX_NS)
+        if event_data_element is not None:
+            for data in event_data_element.findall('./e:Data', namespaces=EVTX_NS):
+                data_fields[data.get('Name')] = data.text
+    return event_id, data_fields
+
+def _build_logon_row(event_id, timestamp, data_fields):
+    """ EventID ve EventData alanlarından tek bir oturum satırı (LOGON_COLUMNS sırasında tuple) üretir. """
+    event_desc = EVENT_ID_DESCRIPTIONS.get(event_id, f"Olay {event_id}")
+    logon_type_code = data_fields.get("LogonType", "")
+    logon_desc = LOGON_TYPE_DESCRIPTIONS.get(logon_type_code, f"({logon_type_code})") if logon_type_code else "N/A"
+    user = data_fields.get("TargetUserName") or data_fields.get("SubjectUserName", "N/A")
+    ip = data_fields.get("IpAddress", "N/A")
+    return (timestamp, event_desc, user, logon_desc, ip)
+
+def logon_column_buffer():
+    """ Oturum satırları için sütun tamponu: zaman datetime64, metinler kategorik. """
+    return columnar.ColumnBuffer(LOGON_COLUMNS, categorical=LOGON_CATEGORICAL, datetime=("Timestamp",))
+
+def _decode_logon_record(record, decoder, counters, keyed=False):
+    """
+    Tek bir kaydı çözer; ilgili bir oturum olayıysa satırı, değilse None döndürür.
+    Hızlı yolun çözemediği kayıtlar XML yolundan işlenir ve counters["xml"] artırılır.
+    keyed=True ise (Computer, EventRecordID, satır) döndürür; decoder
+    COMPUTER_FIELD alanını da istemelidir.
+    """
+    decoded = decoder.decode(record)
+    if decoded is None: # Hızlı yol çözemedi, XML'e düş
+        counters["xml"] += 1
+        try:
+            event_id, data_fields = _xml_event_fields(record)
+        except Exception: return None
+        if event_id is None: return None
+    else:
+        event_id, data_fields = decoded
+    if event_id in decoder.event_ids and data_fields is not None:
+        row = _build_logon_row(event_id, record.timestamp(), data_fields)
+        if keyed:
+            return data_fields.get(evtx_fast.COMPUTER_FIELD), record.record_num(), row
+        return row
+    return None
+
+def _as_utc(value):
+    """ Saat dilimi olmayan zamanları UTC kabul eder (kayıt zamanları UTC'dir). """
+    if value is None: return None
+    value = pd.Timestamp(value).to_pydatetime()
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+def _scan_logon_records(records, decoder, counters, start_time=None, end_time=None, limit=None, keyed=False):
+    """
+    Kayıtlar üzerinde gezip filtreye uyan oturum satırlarını üretir (generator).
+    Zaman penceresi kayıt başlığındaki zamana göre, çözümlemeden ÖNCE uygulanır.
+    keyed: bkz. _decode_logon_record
+    """
+    emitted = 0
+    if limit is not None and limit <= 0: return
+    for record in records:
+        counters["records"] += 1
+        if start_time is not None or end_time is not None:
+            timestamp = record.timestamp()
+            if start_time is not None and timestamp < start_time: continue
+            if end_time is not None and timestamp > end_time: continue
+        row = _decode_logon_record(record, decoder, counters, keyed)
+        if row is None: continue
+        yield row
+        emitted += 1
+        if limit is not None and emitted >= limit: return
+
+def _chunk_count(log):
+    """ Log.chunks() ile aynı sayı: başlıktaki chunk sayısı, dosya boyutuyla sınırlı. """
+    header = log.get_file_header()
+    available = (len(log._buf) - header.header_chunk_size()) // 0x10000
+    return max(0, min(header.chunk_count(), available))
+
+def _chunk_range_records(log, start, stop):
+    """ [start, stop) chunk'larının kayıtları; chunk'lara baştan gezinmeden ofsetle erişilir. """
+    first_chunk = log.get_file_header().header_chunk_size()
+    for index in range(start, min(stop, _chunk_count(log))):
+        yield from evtx.ChunkHeader(log._buf, first_chunk + index * 0x10000).records()
+
+def _logon_decoder(event_ids, keyed=False):
+    fields = LOGON_DATA_FIELDS + (evtx_fast.COMPUTER_FIELD,) if keyed else LOGON_DATA_FIELDS
+    return evtx_fast.LogonRecordDecoder(event_ids, fields)
+
+def _parse_security_chunk_range(evtx_file_path, start, stop, event_ids, start_time, end_time, limit, keyed=False):
+    """
+    İşçi süreç fonksiyonu: [start, stop) aralığındaki chunk'ları bağımsız olarak
+    ayrıştırır. Her chunk kendi string/şablon tablosunu taşıdığı için başka
+    chunk'lara ihtiyaç duymaz.
+    """
+    decoder = _logon_decoder(event_ids, keyed)
+    counters = {"records": 0, "xml": 0}
+    with evtx.Evtx(str(evtx_file_path)) as log:
+        rows = list(_scan_logon_records(_chunk_range_records(log, start, stop), decoder, counters,
+                                        start_time, end_time, limit, keyed))
+    return rows, counters
+
+def _iter_security_log_parallel(evtx_file_path, workers, event_ids, start_time, end_time, limit, counters):
+    """
+    Chunk aralıklarını bir süreç havuzuna dağıtır ve sonuçları chunk sırasına
+    göre üretir. Chunk sırası seri yoldaki kayıt sırasıyla aynıdır
+    (sarılmamış bir logda EventRecordID sırası). Bellekte en fazla
+    2 x workers aralığın sonucu tutulur; limit dolunca kalan işler iptal edilir.
+    """
+    with evtx.Evtx(str(evtx_file_path)) as log:
+        chunk_count = _chunk_count(log)
+    # Yük dengesi için çekirdek başına birkaç aralık
+    step = max(1, -(-chunk_count // (workers * 4)))
+    ranges = [(start, min(start + step, chunk_count)) for start in range(0, chunk_count, step)]
+    print(f"{chunk_count} chunk, {len(ranges)} parça halinde {workers} çekirdeğe dağıtılıyor...")
+
+    emitted = 0
+    pending = deque()
+    next_range = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            while next_range < len(ranges) or pending:
+                while next_range < len(ranges) and len(pending) < workers * 2:
+                    start, stop = ranges[next_range]
+                    pending.append(pool.submit(_parse_security_chunk_range, str(evtx_file_path), start, stop,
+                                               event_ids, start_time, end_time, limit))
+                    next_range += 1
+                rows, range_counters = pending.popleft().result()
+                counters["records"] += range_counters["records"]
+                counters["xml"] += range_counters["xml"]
+                print(f"... {counters['records']} kayıt işlendi...")
+                for row in rows:
+                    yield row
+                    emitted += 1
+                    if limit is not None and emitted >= limit: return
+        finally:
+            for future in pending:
+                future.cancel()
+
+def _progress_records(records, counters):
+    for record in records:
+        if (counters["records"] + 1) % 10000 == 0:
+            print(f"... {counters['records'] + 1} kayıt işlendi...")
+        yield record
+
+def evtx_paths(evtx_file_path):
+    """ Tek bir yolu ya da yol listesini/kümesini sıralı, tekrarsız Path listesine çevirir. """
+    if isinstance(evtx_file_path, (str, os.PathLike)):
+        return [Path(evtx_file_path)]
+    return sorted(dict.fromkeys(Path(p) for p in evtx_file_path))
+
+def discover_security_logs(case_folder):
+    """
+    Vaka klasöründeki Security loglarını bulur: Security.evtx ve
+    Archive-Security-*.evtx; kökte ve bir alt klasör derinliğinde (ör. her
+    etki alanı denetleyicisi için DC01\\Security.evtx). Kullanıcı profili
+    klasörleri taranmaz. Dönüş: sıralı Path listesi.
+    """
+    case_folder = Path(case_folder)
+    folders = [case_folder]
+    try:
+        folders += sorted(p for p in case_folder.iterdir() if p.is_dir() and p.name.lower() not in USER_PROFILE_DIRS)
+    except OSError:
+        pass
+    logs = []
+    for folder in folders:
+        try:
+            files = sorted(p for p in folder.iterdir() if p.is_file())
+        except OSError:
+            continue
+        logs += [p for p in files if any(fnmatch.fnmatch(p.name.lower(), pattern) for pattern in SECURITY_LOG_PATTERNS)]
+    return logs
+
+def _evtx_source(paths):
+    """ Ölçümlerde ve mesajlarda kaynak olarak gösterilecek metin. """
+    return str(paths[0]) if len(paths) == 1 else "; ".join(str(p) for p in paths)
+
+def _iter_keyed_file_rows(evtx_file_path, event_ids, start_time, end_time, counters, pool=None, depth=1):
+    """
+    Tek bir dosyanın oturum satırlarını (Computer, EventRecordID, satır)
+    olarak dosya sırasıyla üretir. pool verilirse chunk aralıkları havuza
+    gönderilir; dosya başına en fazla depth aralık beklemede tutulur.
+    """
+    if pool is None:
+        decoder = _logon_decoder(event_ids, keyed=True)
+        with evtx.Evtx(str(evtx_file_path)) as log:
+            yield from _scan_logon_records(log.records(), decoder, counters, start_time, end_time, keyed=True)
+        return
+    with evtx.Evtx(str(evtx_file_path)) as log:
+        chunk_count = _chunk_count(log)
+    pending = deque()
+    next_chunk = 0
+    try:
+        while next_chunk < chunk_count or pending:
+            while next_chunk < chunk_count and len(pending) < depth:
+                stop = min(next_chunk + MERGE_CHUNK_STEP, chunk_count)
+                pending.append(pool.submit(_parse_security_chunk_range, str(evtx_file_path), next_chunk, stop,
+                                           event_ids, start_time, end_time, None, True))
+                next_chunk = stop
+            rows, range_counters = pending.popleft().result()
+            counters["records"] += range_counters["records"]
+            counters["xml"] += range_counters["xml"]
+            yield from rows
+    finally:
+        for future in pending:
+            future.cancel()
+
+def _iter_merged_logon_rows(paths, event_ids, start_time, end_time, limit, workers, counters):
+    """
+    Birden fazla EVTX dosyasını (ör. Security.evtx, Archive-Security-*.evtx,
+    farklı etki alanı denetleyicilerinin logları) aynı anda okur ve
+    satırları zamana göre birleştirir: her dosya kendi sırasıyla okunur,
+    akışlar heapq.merge ile k-yollu birleştirilir. Aynı (Computer,
+    EventRecordID) kaydı birden fazla dosyada varsa (ör. arşiv ile canlı
+    logun örtüşen kısmı) ilk görülen tutulur, diğerleri counters["duplicates"]
+    ile sayılır.
+
+    Bellek: dosya başına bekleyen chunk aralıkları ve MERGE_DEDUP_WINDOW
+    içindeki tekilleştirme anahtarları; dosyaların toplam boyutundan bağımsızdır.
+    Bir dosya içindeki küçük zaman geri sıçramaları dosya sırasında kalır.
+    """
+    counters.setdefault("duplicates", 0)
+    counters["files"] = len(paths)
+    print(f"{len(paths)} EVTX dosyası zamana göre birleştiriliyor...")
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    # Dosya sayısı arttıkça dosya başına bekleyen iş azalır; toplam en az 2 x workers
+    depth = max(1, -(-2 * workers // len(paths)))
+    streams = [_iter_keyed_file_rows(path, event_ids, start_time, end_time, counters, pool, depth)
+               for path in paths]
+    seen = set()
+    recent = deque() # (zaman, anahtar), çıkış sırasıyla
+    newest = None
+    emitted = 0
+    try:
+        for computer, record_id, row in heapq.merge(*streams, key=lambda entry: entry[2][0]):
+            timestamp = row[0]
+            newest = timestamp if newest is None or timestamp > newest else newest
+            while recent and (recent[0][0] < newest - MERGE_DEDUP_WINDOW or len(recent) > MERGE_DEDUP_MAX_KEYS):
+                seen.discard(recent.popleft()[1])
+            key = (computer, record_id)
+            if key in seen:
+                counters["duplicates"] += 1
+                continue
+            seen.add(key)
+            recent.append((timestamp, key))
+            if (emitted + 1) % 10000 == 0:
+                print(f"... {counters['records']} kayıt işlendi...")
+            yield row
+            emitted += 1
+            if limit is not None and emitted >= limit: return
+    finally:
+        for stream in streams:
+            stream.close()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+def _iter_logon_rows(evtx_file_path, event_ids=None, start_time=None, end_time=None, limit=None,
+                     workers=1, stats=None):
+    """ iter_logon_events ile aynı; satırları LOGON_COLUMNS sırasında tuple olarak üretir. """
+    event_ids = LOGON_EVENT_IDS if event_ids is None else tuple(e for e in event_ids if e in LOGON_EVENT_IDS)
+    start_time, end_time = _as_utc(start_time), _as_utc(end_time)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    counters = stats if stats is not None else {}
+    counters.setdefault("records", 0)
+    counters.setdefault("xml", 0)
+    paths = evtx_paths(evtx_file_path)
+    if len(paths) > 1:
+        yield from _iter_merged_logon_rows(paths, event_ids, start_time, end_time, limit, workers, counters)
+        return
+    evtx_file_path = paths[0]
+    if workers > 1:
+        yield from _iter_security_log_parallel(evtx_file_path, workers, event_ids, start_time, end_time,
+                                               limit, counters)
+        return
+    decoder = evtx_fast.LogonRecordDecoder(event_ids, LOGON_DATA_FIELDS)
+    with evtx.Evtx(str(evtx_file_path)) as log:
+        for row in _scan_logon_records(_progress_records(log.records(), counters), decoder, counters,
+                                       start_time, end_time, limit):
+            yield row
+
+def iter_logon_events(evtx_file_path, event_ids=None, start_time=None, end_time=None, limit=None,
+                      workers=1, stats=None):
+    """
+    Security.evtx içindeki oturum olaylarını çözüldükçe tek tek üretir
+    (generator); her olay {sütun: değer} sözlüğüdür.
+    evtx_file_path: tek bir dosya ya da dosya listesi; birden fazla dosya
+                    zamana göre birleştirilir ve tekrarlanan kayıtlar atılır
+                    (bkz. _iter_merged_logon_rows; stats["duplicates"])
+    event_ids: yalnızca bu EventID'ler (varsayılan: 4624, 4625, 4634, 4647)
+    start_time / end_time: zaman penceresi (dahil); saat dilimsiz değerler UTC kabul edilir
+    limit: bu kadar olay üretildikten sonra tarama durur
+    workers: > 1 (veya None = tüm çekirdekler) ise chunk'lar (çok dosyada tüm
+             dosyalarınkiler) paralel ayrıştırılır
+    stats: verilirse "records" (taranan) ve "xml" (XML yoluna düşen) sayaçları yazılır
+    Bellek kullanımı logların boyutundan bağımsızdır.
+    """
+    for row in _iter_logon_rows(evtx_file_path, event_ids, start_time, end_time, limit, workers, stats):
+        yield dict(zip(LOGON_COLUMNS, row))
+
+def iter_logon_event_batches(evtx_file_path, batch_size=50000, metrics=None, **kwargs):
+    """
+    iter_logon_events ile aynı parametreleri alır; olayları en fazla
+    batch_size satırlık DataFrame parçaları halinde üretir.
+    metrics: verilirse (parser_metrics.MetricsCollector) ölçümler her parçada güncellenir.
+    """
+    if kwargs.get("stats") is None:
+        kwargs["stats"] = {}
+    stats = kwargs["stats"]
+    paths = evtx_paths(evtx_file_path)
+    with parser_metrics.measure(metrics, "iter_logon_event_batches", _evtx_source(paths)) as run:
+        for path in paths:
+            run.read_source(path)
+        rows = _iter_logon_rows(evtx_file_path, **kwargs)
+        while True:
+            buffer = logon_column_buffer()
+            with run.phase("decode"):
+                buffer.extend(itertools.islice(rows, batch_size))
+            if not len(buffer): break
+            with run.phase("frame"):
+                df = buffer.to_frame()
+            run.records_scanned = stats["records"]
+            run.records_emitted += len(df)
+            run.counters["xml"] = stats["xml"]
+            if "duplicates" in stats:
+                run.counters["duplicates"] = stats["duplicates"]
+            run.update()
+            yield df
 
 # --- FONKSİYON 1: OTURUM LOGLARI 
-def parse_security_log(evtx_file_path):
+def parse_security_log(evtx_file_path, workers=1, event_ids=None, start_time=None, end_time=None, limit=None,
+                       metrics=None):
     """
-    Bir Security.evtx dosyasını analiz eder ve
+    Bir Security.evtx dosyasını (ya da arşivler ve farklı bilgisayarların
+    logları gibi birden fazla EVTX dosyasını) analiz eder ve
     oturum loglarını (4624, 4625, 4634, 4647) çeker.
     EventID ve Oturum Türünü metne çevirir.
+    iter_logon_events üzerinde ince bir sarmalayıcıdır; parametreler oradaki
+    gibidir. Eski 1000 satır sınırı yerine isteğe bağlı limit kullanılır.
+    metrics: verilirse (parser_metrics.MetricsCollector) çalıştırma ölçülür.
     """
-    events = []
-    logon_filter = [4624, 4625, 4634, 4647]
-    ns = {'e': 'http://schemas.microsoft.com/win/2004/08/events/event'}
-    event_id_descriptions = {
-        4624: "(4624) Başarılı Oturum Açma", 4625: "(4625) Başarısız Oturum Denemesi",
-        4634: "(4634) Oturum Kapatıldı", 4647: "(4647) Oturum Kullanıcı Tarafından Kapatıldı"
-    }
-    logon_type_descriptions = {
-        '0': '(0) Sistem', '2': '(2) İnteraktif', '3': '(3) Ağ', '4': '(4) Batch', '5': '(5) Hizmet',
-        '7': '(7) Kilit Açma', '8': '(8) Ağ Açık Metin', '9': '(9) Yeni Kimlik Bilgisi',
-        '10': '(10) Uzak İnteraktif (RDP)', '11': '(11) Önbellekli İnteraktif'
-    }
-    print(f"'{evtx_file_path}' dosyası açılıyor...")
-    try:
-        with evtx.Evtx(evtx_file_path) as log:
-            print("Log kayıtları analiz ediliyor... (Bu işlem yavaş olabilir)")
-            record_count = 0
-            for record in log.records():
-                record_count += 1
-                if record_count % 10000 == 0:
-                    print(f"... {record_count} kayıt işlendi...")
-                try:
-                    if len(events) > 1000: continue # Limit
-                    xml_data = record.xml()
-                    root = ET.fromstring(xml_data)
-                    event_id_element = root.find('./e:System/e:EventID', namespaces=ns)
-                    if event_id_element is None: continue
-                    event_id = int(event_id_element.text)
-                except Exception: continue
-
-                if event_id in logon_filter:
-                    timestamp = record.timestamp()
-                    event_data_element = root.find('.//e:EventData', namespaces=ns)
-                    data_fields = {}
-                    if event_data_element is not None:
-                        for data in event_data_element.findall('./e:Data', namespaces=ns):
-                            name = data.get('Name')
-                            value = data.text
-                            data_fields[name] = value
-
-                    event_desc = event_id_descriptions.get(event_id, f"Olay {event_id}")
-                    logon_type_code = data_fields.get("LogonType", "")
-                    logon_desc = logon_type_descriptions.get(logon_type_code, f"({logon_type_code})") if logon_type_code else "N/A"
-                    user = data_fields.get("TargetUserName") or data_fields.get("SubjectUserName", "N/A")
-                    ip = data_fields.get("IpAddress", "N/A")
-
-                    events.append({
-                        "Olay": event_desc,
-                        "Timestamp": timestamp,
-                        "Kullanıcı Adı": user,
-                        "Oturum Türü": logon_desc,
-                        "Kaynak IP": ip
-                    })
-            print(f"\nAnaliz tamamlandı. Toplam {record_count} kayıt tarandı.")
-            print(f"Toplam {len(events)} adet ilgili log bulundu.")
-            df = pd.DataFrame(events)
-            if not df.empty:
-                 df = df[["Timestamp", "Olay", "Kullanıcı Adı", "Oturum Türü", "Kaynak IP"]] # Sıralama
+    paths = evtx_paths(evtx_file_path)
+    print(f"'{_evtx_source(paths)}' dosyası açılıyor...")
+    stats = {}
+    with parser_metrics.measure(metrics, "parse_security_log", _evtx_source(paths)) as run:
+        for path in paths:
+            run.read_source(path)
+        try:
+            if workers is None or workers > 1:
+                print("Log kayıtları paralel analiz ediliyor...")
+            else:
+                print("Log kayıtları analiz ediliyor... (Bu işlem yavaş olabilir)")
+            # Satırlar sözlük listesi yerine doğrudan sütun tamponunda birikir
+            buffer = logon_column_buffer()
+            with run.phase("decode"):
+                buffer.extend(_iter_logon_rows(evtx_file_path, event_ids=event_ids, start_time=start_time,
+                                               end_time=end_time, limit=limit, workers=workers, stats=stats))
+            print(f"\nAnaliz tamamlandı. Toplam {stats['records']} kayıt tarandı.")
+            if stats["xml"]:
+                print(f"{stats['xml']} kayıt XML yolu ile işlendi.")
+            if stats.get("duplicates"):
+                print(f"{stats['duplicates']} tekrarlanan kayıt (aynı bilgisayar ve EventRecordID) atıldı.")
+            print(f"Toplam {len(buffer)} adet ilgili log bulundu.")
+            with run.phase("frame"):
+                df = buffer.to_frame()
+            run.records_scanned = stats["records"]
+            run.records_emitted = len(df)
+            run.counters["xml"] = stats["xml"]
+            if "duplicates" in stats:
+                run.counters["duplicates"] = stats["duplicates"]
             return df
-    except Exception as e:
-        print(f"Dosya okunurken hata oluştu: {e}")
+        except Exception as e:
+            print(f"Dosya okunurken hata oluştu: {e}")
+            run.records_scanned = stats.get("records", 0)
+            return None
+
+# --- ARTIMLI OTURUM LOGU ANALİZİ (kontrol noktalı)
+def _evtx_header_fields(log):
+    header = log.get_file_header()
+    return {
+        "oldest_chunk": header.oldest_chunk(),
+        "current_chunk": header.current_chunk_number(),
+        "next_record_number": header.next_record_number(),
+        "chunk_count": header.chunk_count(),
+        "dirty": bool(header.is_dirty()),
+        "full": bool(header.is_full()),
+    }
+
+def _evtx_log_identity(log):
+    """
+    Logun kimliği: ilk kaydın Computer (ve varsa Channel) değeri. Log
+    sarıldığında ilk kayıt değişir ama bu alanlar değişmez; yeniden toplanan
+    kopya da aynı kimliği taşır. Aynı makinenin başka bir logu aynı kimliği
+    alabilir; kontrol noktası yine de son işlenen kaydın özetiyle doğrulanır.
+    """
+    root = ET.fromstring(log.get_file_header().first_chunk().first_record().xml())
+    parts = [root.findtext(f'./e:System/e:{name}', default="", namespaces=EVTX_NS) for name in ("Computer", "Channel")]
+    return "evtx:" + "/".join(part for part in parts if part)
+
+def _record_digest(record):
+    return hashlib.sha256(bytes(record.data())).hexdigest()
+
+def _chunks_by_record_number(log):
+    """ Chunk'ları ilk kayıt numarasına göre (mantıksal sırada) döndürür; sarılmış loglarda fiziksel sıra farklıdır. """
+    return sorted(((chunk.log_first_record_number(), index, chunk) for index, chunk in enumerate(log.chunks())),
+                  key=lambda entry: entry[:2])
+
+def _checkpoint_chunk_start(chunks, record_id):
+    """ record_id'yi içerebilecek chunk'ın ilk kayıt numarası; tüm chunk'lar sonra başlıyorsa None. """
+    return max((first for first, _, _ in chunks if first <= record_id), default=None)
+
+def _checkpoint_mismatch(log, header, checkpoint):
+    """
+    Kontrol noktası bu log için geçersizse nedenini, geçerliyse None döndürür.
+    Sarılma tek başına geçersiz kılmaz: son işlenen kaydı kapsayan chunk
+    bulunur ve kaydın özeti karşılaştırılır. Kayıt sarılmada üzerine
+    yazılmışsa aradaki olaylar kaybolmuştur; tam taramaya düşülür.
+    """
+    if header["chunk_count"] < checkpoint["chunk_count"]:
+        return "log küçülmüş veya temizlenmiş"
+    # Kirli (açık) loglarda başlıktaki sayaç güncel olmayabilir
+    if not header["dirty"] and header["next_record_number"] <= checkpoint["last_record_id"]:
+        return "log temizlenmiş (kayıt sayacı geriye gitmiş)"
+    if checkpoint["last_record_id"] == 0:
         return None
+    if "last_record_digest" not in checkpoint:
+        return "eski sürüm kontrol noktası"
+    chunks = _chunks_by_record_number(log)
+    start = _checkpoint_chunk_start(chunks, checkpoint["last_record_id"])
+    if start is None:
+        return "son işlenen kaydın üzerine yazılmış (log sarılmış)"
+    for first, _, chunk in chunks:
+        if first != start: continue
+        for record in chunk.records():
+            if record.record_num() == checkpoint["last_record_id"]:
+                if _record_digest(record) != checkpoint["last_record_digest"]:
+                    return "son işlenen kayıt farklı (başka bir log)"
+                return None
+    return "son işlenen kayıt bulunamadı"
+
+def _records_after(log, after_record_id, position):
+    """
+    EventRecordID'si after_record_id'den büyük kayıtları kayıt numarası
+    sırasıyla üretir; görülen en son kaydın yerini position'a yazar.
+    after_record_id'yi içeren chunk'tan önce başlayan chunk'lar okunmaz.
+    """
+    chunks = _chunks_by_record_number(log)
+    start = _checkpoint_chunk_start(chunks, after_record_id) or 0
+    last_record = None
+    for first, index, chunk in chunks:
+        if first < start: continue
+        for record in chunk.records():
+            record_id = record.record_num()
+            if record_id <= after_record_id: continue
+            if record_id > position["last_record_id"]:
+                position.update(last_record_id=record_id, last_chunk_index=index)
+                last_record = record
+            yield record
+    if last_record is not None:
+        position["last_record_digest"] = _record_digest(last_record)
+
+def parse_security_log_incremental(evtx_file_path, store, log_key=None, metrics=None):
+    """
+    Security.evtx'i kontrol noktasıyla artımlı analiz eder. İlk çalıştırmada
+    tüm log taranır; sonrakilerde yalnızca son işlenen EventRecordID'den
+    sonraki kayıtlar okunur ve önceki sonuca eklenir. Sarılmış loglar da
+    kaldığı yerden devam eder; son işlenen kaydın üzerine yazılmışsa, log
+    temizlenmiş ya da başka bir logla değiştirilmişse tam taramaya düşülür.
+    Sarılmamış bir log için sonuç parse_security_log çıktısıyla aynıdır;
+    sarılmış logda önceki çalıştırmalarda bulunup üzerine yazılan olaylar da
+    sonuçta kalır.
+
+    store:   evtx_checkpoint.EvtxCheckpointStore
+    log_key: kontrol noktası anahtarı (varsayılan: logun Computer/Channel kimliği)
+    """
+    print(f"'{evtx_file_path}' dosyası artımlı olarak açılıyor...")
+    with parser_metrics.measure(metrics, "parse_security_log_incremental", evtx_file_path) as run:
+        try:
+            with evtx.Evtx(str(evtx_file_path)) as log:
+                header = _evtx_header_fields(log)
+                if log_key is None:
+                    log_key = _evtx_log_identity(log)
+                checkpoint, previous = store.load(log_key)
+                reason = "kontrol noktası yok" if checkpoint is None else _checkpoint_mismatch(log, header, checkpoint)
+                if reason is None:
+                    after_record_id = checkpoint["last_record_id"]
+                    print(f"Kontrol noktası bulundu: EventRecordID {after_record_id} sonrası okunacak.")
+                else:
+                    print(f"Tam tarama yapılıyor: {reason}.")
+                    after_record_id, previous = 0, None
+                    checkpoint = {"last_record_id": 0, "last_chunk_index": 0, "last_record_digest": None}
+
+                position = {key: checkpoint.get(key) for key in
+                            ("last_record_id", "last_chunk_index", "last_record_digest")}
+                decoder = evtx_fast.LogonRecordDecoder(LOGON_EVENT_IDS, LOGON_DATA_FIELDS)
+                counters = {"records": 0, "xml": 0}
+                buffer = logon_column_buffer()
+                with run.phase("decode"):
+                    records = _records_after(log, after_record_id, position)
+                    buffer.extend(_scan_logon_records(_progress_records(records, counters), decoder, counters))
+            print(f"Analiz tamamlandı. {counters['records']} yeni kayıt tarandı, {len(buffer)} yeni olay bulundu.")
+            with run.phase("frame"):
+                df = buffer.to_frame()
+                if previous is not None and not previous.empty:
+                    df = columnar.concat_frames([previous, df]) if not df.empty else previous
+                    # Eski sürümün kontrol noktasındaki metin sütunları da kategorik olur
+                    df = columnar.categorize(df, LOGON_CATEGORICAL)
+            store.save(log_key, dict(position, **header, full_scan=reason is not None), df)
+            run.records_scanned = counters["records"]
+            run.records_emitted = len(buffer)
+            run.counters.update(xml=counters["xml"], full_scan=int(reason is not None))
+            return df
+        except Exception as e:
+            print(f"Dosya okunurken hata oluştu: {e}")
+            return None
+
+# --- HIVE OTURUMU (her hive vaka başına bir kez açılır)
+class HiveSession:
+    """
+    Bir vaka için hive dosyalarını yalnızca bir kez açar ve çözülmüş anahtar
+    yollarını (ör. Microsoft\\Windows\\CurrentVersion\\Uninstall) önbellekte tutar.
+    Aynı SOFTWARE hive'ını kullanan parser'lar dosyayı yeniden okumaz.
+    Parser'lara session=... ile verilir; verilmezse her çağrı kendi geçici
+    oturumunu açar (eski, yol tabanlı kullanım).
+    """
+    def __init__(self):
+        self._hives = {}
+        self._keys = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _hive_id(hive_path):
+        return os.path.normcase(os.path.abspath(str(hive_path)))
+
+    def hive(self, hive_path):
+        """ Hive'ı ilk istekte açar; açılamadıysa aynı hatayı yeniden fırlatır. """
+        hive_id = self._hive_id(hive_path)
+        reg = self._hives.get(hive_id)
+        if reg is None:
+            try:
+                reg = Registry.Registry(hive_id)
+            except Exception as e:
+                reg = e
+            self._hives[hive_id] = reg
+        if isinstance(reg, Exception):
+            raise reg
+        return reg
+
+    def open_key(self, hive_path, key_path):
+        """
+        reg.open(key_path) eşdeğeri. Bulunan anahtar da, bulunamama durumu
+        (RegistryKeyNotFoundException) da önbelleğe alınır.
+        """
+        key_path = key_path.strip("\\")
+        cache_key = (self._hive_id(hive_path), key_path.lower())
+        key = self._keys.get(cache_key)
+        if key is None:
+            # Üst anahtar da önbellekten çözülür; ortak önekler bir kez yürünür
+            parent_path, _, name = key_path.rpartition("\\")
+            try:
+                if not name:
+                    key = self.hive(hive_path).root()
+                else:
+                    key = self.open_key(hive_path, parent_path).subkey(name)
+            except Registry.RegistryKeyNotFoundException as e:
+                key = e
+            self._keys[cache_key] = key
+        if isinstance(key, Exception):
+            raise key
+        return key
+
+    def close(self):
+        """ Açık hive tamponlarını ve anahtar önbelleğini bırakır. """
+        self._hives.clear()
+        self._keys.clear()
+
+# --- ORTAK ZAMAN DÖNÜŞÜMLERİ: FILETIME/SYSTEMTIME toplu çözümü binary_decode modülündedir
+
+# --- HIVE ARTEFAKT MOTORU (hive başına tek geçiş)
+def parse_hive_artifacts(hive_path, artifacts, session=None, metrics=None):
+    """
+    Verilen artefaktların hepsini hive üzerinde TEK geçişte çalıştırır ve
+    {artefakt adı: DataFrame} döndürür. Hive açılamazsa her artefakt için None;
+    desenlerinin uzandığı bir dal (ör. kök) okunamayan artefakt da None'dır.
+    Yeni bir artefakt eklemek hive'ı bir kez daha gezmeyi gerektirmez;
+    ilgili *_ARTIFACTS listesine eklemek yeterlidir.
+    metrics: verilirse (parser_metrics.MetricsCollector) çalıştırma ölçülür;
+    taranan kayıt sayısı ziyaret edilen anahtar sayısıdır.
+    """
+    session = session or HiveSession()
+    print(f"\n'{hive_path}' dosyası taranıyor: {', '.join(a.name for a in artifacts)}")
+    with parser_metrics.measure(metrics, f"parse_hive_artifacts[{Path(hive_path).name}]", hive_path) as run:
+        run.read_source(hive_path)
+        try:
+            with run.phase("open"):
+                reg = session.hive(hive_path)
+        except Exception as e:
+            print(f"Hata: {Path(hive_path).name} dosyası açılamadı: {e}")
+            return {artifact.name: None for artifact in artifacts}
+        counters = {}
+        with run.phase("decode"):
+            rows, missing, failed = artifact_engine.scan_hive(
+                reg.root(), artifacts, counters=counters,
+                open_key=lambda key_path: session.open_key(hive_path, key_path))
+        for key_path in dict.fromkeys(missing.values()):
+            print(f"BULGU: {key_path} yolu bulunamadı.")
+        with run.phase("frame"):
+            frames = artifact_engine.build_frames(artifacts, rows)
+        # Okunamayan dallardaki artefaktlar 0 satır değil, hata olarak raporlanır
+        for artifact_index in dict.fromkeys(target[0] for target in failed):
+            print(f"Hata: {artifacts[artifact_index].name} analiz edilemedi.")
+            frames[artifacts[artifact_index].name] = None
+        run.records_scanned = counters["keys"]
+        run.records_emitted = sum(len(df) for df in frames.values() if df is not None)
+        run.counters["matches"] = counters["matches"]
+        return frames
 
 # --- FONKSİYON 2: USB ANALİZİ 
-def parse_usb_devices(system_hive_path): 
+# Aygıt anahtarları her ControlSet00N altında tekrarlanır (Select\Current hangisinin
+# kullanıldığını söyler); desenler kökteki tüm anahtarları '*' ile eşler.
+def _is_control_set(name):
+    # CurrentControlSet canlı sistemdeki bir bağlantıdır; çevrimdışı hive'da yalnızca ControlSet00N bulunur
+    return name.lower().startswith("controlset") and name[10:].isdigit()
+
+def _usbstor_rows(match):
+    # <ControlSet00N>\Enum\USBSTOR\<Cihaz Türü>\<Seri No>: anahtar zamanı = ilk takılma zamanı
+    control_set, device_name, serial_number = match.captures
+    if not _is_control_set(control_set): return
+    yield {
+        "Cihaz Adı": device_name,
+        "Seri Numarası": serial_number,
+        "İlk Takılma Zamanı": pd.Timestamp(match.key.timestamp()), # Timestamp'e çevir
+        "Kontrol Seti": control_set
+    }
+
+def _usb_enum_rows(match):
+    control_set, vid_pid, instance_id = match.captures
+    if not _is_control_set(control_set): return
+    yield {
+        "VID_PID": vid_pid,
+        "Instance ID / Seri No": instance_id,
+        "Açıklama": match.value("DeviceDesc", "N/A"),
+        "Kolay Ad": match.value("FriendlyName", "N/A"),
+        "Konum": match.value("LocationInformation", "N/A"),
+        "Son Güncelleme": pd.Timestamp(match.key.timestamp()), # Timestamp'e çevir
+        "Kontrol Seti": control_set
+    }
+
+def _sort_newest(column):
+    def finalize(df):
+        df = df.dropna(subset=[column])
+        return df.sort_values(by=column, ascending=False)
+    return finalize
+
+def _objects(values):
+    """ Sütunun değerleri (kategorik/metin fark etmeksizin), eksikler None. """
+    return values.to_numpy(dtype=object, na_value=None)
+
+def _join_by_key(keys, values):
+    """
+    Anahtar başına farklı değerleri sıralı, virgülle ayrılmış tek metinde
+    toplar (sözlükle tek geçiş; grup başına DataFrame dilimi oluşturulmaz).
+    Dönüş: {anahtar: metin}; değeri olmayan anahtarlar None.
+    """
+    groups = {}
+    for key, value in zip(keys, values):
+        group = groups.setdefault(key, set())
+        if value is not None:
+            group.add(str(value))
+    return {key: ", ".join(sorted(group)) or None for key, group in groups.items()}
+
+def _merge_control_sets(keys, column):
+    """
+    Aynı aygıt birden fazla kontrol setinde bulunur. Her aygıt en yeni
+    zamanlı kaydıyla bir kez kalır; "Kontrol Seti" aygıtın görüldüğü tüm
+    setleri listeler. Sonuç yeniden eskiye sıralıdır.
+    """
+    def finalize(df):
+        df = _sort_newest(column)(df)
+        device_keys = list(zip(*(_objects(df[key]) for key in keys)))
+        control_sets = _join_by_key(device_keys, _objects(df["Kontrol Seti"]))
+        df = df.assign(**{"Kontrol Seti": [control_sets[key] for key in device_keys]})
+        return columnar.categorize(df.drop_duplicates(subset=keys), ("Kontrol Seti",))
+    return finalize
+
+USBSTOR_ARTIFACT = artifact_engine.Artifact(
+    "USB Depolama Aygıtları", r"*\Enum\USBSTOR\*\*", _usbstor_rows,
+    ["Cihaz Adı", "Seri Numarası", "İlk Takılma Zamanı", "Kontrol Seti"], categorical=("Cihaz Adı",),
+    finalize=_merge_control_sets(["Cihaz Adı", "Seri Numarası"], "İlk Takılma Zamanı"))
+USB_ENUM_ARTIFACT = artifact_engine.Artifact(
+    "Tüm USB Aygıtları", r"*\Enum\USB\*\*", _usb_enum_rows,
+    ["VID_PID", "Instance ID / Seri No", "Açıklama", "Kolay Ad", "Konum", "Son Güncelleme", "Kontrol Seti"],
+    values=("DeviceDesc", "FriendlyName", "LocationInformation"), categorical=("VID_PID", "Açıklama"),
+    finalize=_merge_control_sets(["VID_PID", "Instance ID / Seri No"], "Son Güncelleme"))
+
+# Select değerleri: hangi ControlSet00N'in hangi amaçla kullanıldığı (0: yok)
+CONTROL_SET_ROLES = (("Current", "Geçerli"), ("Default", "Varsayılan"), ("LastKnownGood", "Son Bilinen İyi"),
+                     ("Failed", "Başarısız"))
+
+def _select_rows(match):
+    for value_name, role in CONTROL_SET_ROLES:
+        number = match.value(value_name)
+        if isinstance(number, int) and number > 0:
+            yield {"Rol": role, "Kontrol Seti": "ControlSet%03d" % number}
+
+CONTROL_SET_ARTIFACT = artifact_engine.Artifact(
+    "Kontrol Setleri", "Select", _select_rows, ["Rol", "Kontrol Seti"],
+    values=tuple(value_name for value_name, _ in CONTROL_SET_ROLES))
+
+# Aygıt örnek yollarındaki veri yolu, aygıt ve seri numarası:
+# ...USBSTOR#Disk&Ven_X&Prod_Y&Rev_1.00#<Seri>&0#{GUID} ya da ...USB#VID_0951&PID_1666#<Seri>#{GUID}
+DEVICE_INSTANCE_PATTERN = re.compile(r"(USBSTOR|USB)#([^#]+)#([^#]+)", re.IGNORECASE)
+
+def _device_instance(path):
+    """ Aygıt yolundan (cihaz adı, seri numarası); USB aygıt yolu değilse (None, None). """
+    found = DEVICE_INSTANCE_PATTERN.search(path or "")
+    return (found.group(2), found.group(3)) if found else (None, None)
+
+def _decode_mounted_device(data):
+    """ MountedDevices verisi: MBR disk imzası + ofset (12 bayt), GPT bölüm GUID'i ya da aygıt yolu (UTF-16). """
+    if not isinstance(data, bytes):
+        return "Bilinmiyor", str(data)
+    if len(data) == 12:
+        signature, offset = struct.unpack("<IQ", data)
+        return "MBR", f"Disk imzası {signature:08X}, ofset {offset}"
+    if len(data) == 24 and data.startswith(b"DMIO:ID:"):
+        return "GPT", "{" + str(uuid.UUID(bytes_le=data[8:])).upper() + "}"
+    try:
+        return "Aygıt Yolu", data.decode("utf-16le").rstrip("\x00")
+    except UnicodeDecodeError:
+        return "Bilinmiyor", data.hex()
+
+def _mounted_device_rows(match):
+    # \DosDevices\E: (sürücü harfi) ve \??\Volume{GUID} (birim) -> son bağlanan aygıt
+    for registry_value in match.all_values or []:
+        try:
+            kind, device = _decode_mounted_device(registry_value.value())
+        except Exception:
+            continue
+        device_name, serial_number = _device_instance(device)
+        yield {
+            "Bağlama Noktası": registry_value.name(), "Tür": kind, "Aygıt": device,
+            "Cihaz Adı": device_name, "Seri Numarası": serial_number
+        }
+
+MOUNTED_DEVICES_ARTIFACT = artifact_engine.Artifact(
+    "Bağlı Birimler (MountedDevices)", "MountedDevices", _mounted_device_rows,
+    ["Bağlama Noktası", "Tür", "Aygıt", "Cihaz Adı", "Seri Numarası"], values=("*",),
+    categorical=("Tür", "Cihaz Adı"), finalize=lambda df: df.sort_values(by="Bağlama Noktası"))
+
+def _wpd_rows(match):
+    # SOFTWARE\Microsoft\Windows Portable Devices\Devices\<aygıt yolu>: FriendlyName birim etiketi/sürücü harfidir
+    (device_key,) = match.captures
+    device_name, serial_number = _device_instance(device_key)
+    yield {
+        "Kolay Ad": match.value("FriendlyName", "N/A"), "Cihaz Adı": device_name, "Seri Numarası": serial_number,
+        "Aygıt Anahtarı": device_key, "Son Güncelleme": pd.Timestamp(match.key.timestamp())
+    }
+
+WPD_ARTIFACT = artifact_engine.Artifact(
+    "Taşınabilir Aygıtlar (WPD)", r"Microsoft\Windows Portable Devices\Devices\*", _wpd_rows,
+    ["Kolay Ad", "Cihaz Adı", "Seri Numarası", "Aygıt Anahtarı", "Son Güncelleme"], values=("FriendlyName",),
+    categorical=("Cihaz Adı",), finalize=_sort_newest("Son Güncelleme"))
+
+# --- USB CİHAZ GEÇMİŞİ (kaynaklar arası birleştirme)
+USB_HISTORY_CATEGORY = "USB Cihaz Geçmişi"
+USB_HISTORY_COLUMNS = ["Seri Numarası", "Cihaz Adı", "VID_PID", "Kolay Ad", "Sürücü Harfleri", "Birimler", "WPD Adı",
+                       "İlk Takılma Zamanı", "Son Güncelleme", "Kontrol Setleri", "Geçerli Kontrol Setinde"]
+
+def device_serial_key(serials):
+    """
+    Kaynakları birleştirme anahtarı: büyük harfli seri numarası, USBSTOR'un
+    eklediği '&<n>' örnek eki olmadan (Enum\\USB aynı aygıtı eksiz kaydeder).
+    """
+    return serials.astype("string").str.upper().str.replace(r"&\d+$", "", regex=True)
+
+def _serial_source(df, serial_column, columns):
+    """ Seri numarası olan satırlar: {_key, sütunlar...}; kategorik sütunlar metne çevrilir. """
+    df = df[df[serial_column].notna()]
+    part = pd.DataFrame({"_key": device_serial_key(df[serial_column]).to_numpy()})
+    for target, column in columns.items():
+        values = df[column]
+        part[target] = (values.astype(object) if isinstance(values.dtype, pd.CategoricalDtype) else values).to_numpy()
+    return part
+
+def build_device_history(frames):
+    """
+    USB depolama aygıtlarının geçmişi: USBSTOR, MountedDevices ve (varsa)
+    WPD kayıtları seri numarası anahtarıyla dış birleştirme, Enum\\USB ayrıntıları
+    sol birleştirme ile tek tabloda toplanır. Birleştirmeler anahtar
+    üzerinde hash join'dir (pd.merge); aygıt sayısıyla doğrusal büyür.
+    frames: {kategori: DataFrame}; eksik (None) kaynaklar atlanır.
+    "Geçerli Kontrol Setinde": aygıt Select\\Current'ın gösterdiği sette var mı
+    (Kontrol Setleri tablosu yoksa boş).
+    """
+    def source(artifact):
+        df = frames.get(artifact.name)
+        return df if df is not None and len(df) else None
+
+    parts = []
+    storage = source(USBSTOR_ARTIFACT)
+    if storage is not None:
+        # Tablo yeniden eskiye sıralı; aynı seri için en yeni kayıt kalır
+        parts.append(_serial_source(storage, "Seri Numarası", {
+            "Seri Numarası": "Seri Numarası", "Cihaz Adı": "Cihaz Adı", "İlk Takılma Zamanı": "İlk Takılma Zamanı",
+            "Kontrol Setleri": "Kontrol Seti"}).drop_duplicates(subset="_key"))
+    mounted = source(MOUNTED_DEVICES_ARTIFACT)
+    if mounted is not None:
+        part = _serial_source(mounted, "Seri Numarası", {
+            "_serial_mounted": "Seri Numarası", "_device_mounted": "Cihaz Adı", "_mount": "Bağlama Noktası"})
+        keys = _objects(part["_key"])
+        letters = part["_mount"].where(part["_mount"].str.startswith("\\DosDevices\\")).str[len("\\DosDevices\\"):]
+        volumes = part["_mount"].where(part["_mount"].str.contains("Volume{", regex=False)).str.extract(
+            r"(\{[^}]+\})", expand=False)
+        letters, volumes = _join_by_key(keys, _objects(letters)), _join_by_key(keys, _objects(volumes))
+        part = part.drop_duplicates(subset="_key").drop(columns="_mount")
+        parts.append(part.assign(**{"Sürücü Harfleri": part["_key"].map(letters), "Birimler": part["_key"].map(volumes)}))
+    wpd = source(WPD_ARTIFACT)
+    if wpd is not None:
+        part = _serial_source(wpd, "Seri Numarası", {
+            "_serial_wpd": "Seri Numarası", "_device_wpd": "Cihaz Adı", "WPD Adı": "Kolay Ad"})
+        names = _join_by_key(_objects(part["_key"]), _objects(part["WPD Adı"]))
+        part = part.drop_duplicates(subset="_key")
+        parts.append(part.assign(**{"WPD Adı": part["_key"].map(names)}))
+    if not parts:
+        return pd.DataFrame(columns=USB_HISTORY_COLUMNS)
+
+    history = parts[0]
+    for part in parts[1:]:
+        history = history.merge(part, on="_key", how="outer", sort=False)
+    usb = source(USB_ENUM_ARTIFACT)
+    if usb is not None:
+        usb = _serial_source(usb, "Instance ID / Seri No", {
+            "VID_PID": "VID_PID", "Kolay Ad": "Kolay Ad", "Son Güncelleme": "Son Güncelleme"})
+        history = history.merge(usb.drop_duplicates(subset="_key"), on="_key", how="left", sort=False)
+
+    # Bir sütun hangi kaynakta varsa oradan: USBSTOR > MountedDevices > WPD
+    for column, fallbacks in (("Seri Numarası", ("_serial_mounted", "_serial_wpd")),
+                              ("Cihaz Adı", ("_device_mounted", "_device_wpd"))):
+        values = history[column] if column in history.columns else pd.Series(None, index=history.index, dtype=object)
+        for fallback in fallbacks:
+            if fallback in history.columns:
+                values = values.where(values.notna(), history[fallback])
+        history[column] = values
+
+    current = None
+    control_sets = frames.get(CONTROL_SET_ARTIFACT.name)
+    if control_sets is not None:
+        current = next(iter(control_sets.loc[control_sets["Rol"] == "Geçerli", "Kontrol Seti"]), None)
+    history = history.reindex(columns=USB_HISTORY_COLUMNS)
+    if current is not None:
+        history["Geçerli Kontrol Setinde"] = pd.array(
+            [current in (sets or "").split(", ") for sets in _objects(history["Kontrol Setleri"])], dtype="boolean")
+    for column in ("İlk Takılma Zamanı", "Son Güncelleme"):
+        history[column] = pd.to_datetime(history[column], utc=True)
+    history = history.sort_values(by="İlk Takılma Zamanı", ascending=False, na_position="last", ignore_index=True)
+    return columnar.categorize(history, ("Cihaz Adı", "VID_PID", "Kontrol Setleri"))
+
+def parse_usb_devices(system_hive_path, session=None, metrics=None): 
     
     # SYSTEM hive dosyasını analiz eder.
     # 1. USBSTOR'dan depolama aygıtlarının Seri Numarası ve İlk Takılma Zamanını alır.
     # 2. Enum\USB'den TÜM USB cihazlarının Detaylı Bilgilerini (Açıklama, Kolay Ad, Son Güncelleme) alır.
+    # Tüm ControlSet00N anahtarları tek geçişte okunur; aynı aygıt bir kez listelenir.
+    # Okunamayan tablo (hive ya da dalı) None döner, boş tabloyla değiştirilmez.
     
-    storage_devices = []
-    all_usb_devices = []
-    usbstor_path = r"ControlSet001\Enum\USBSTOR"
-    usb_enum_path = r"ControlSet001\Enum\USB"
-
-    print(f"\n'{system_hive_path}' dosyası açılıyor (Gelişmiş USB analizi için)...")
-    try:
-        reg = Registry.Registry(str(system_hive_path))
-    except Exception as e:
-        print(f"Hata: SYSTEM dosyası açılamadı: {e}")
-        return pd.DataFrame(columns=["Cihaz Adı", "Seri Numarası", "İlk Takılma Zamanı"]), \
-               pd.DataFrame(columns=["VID_PID", "Instance ID / Seri No", "Açıklama", "Kolay Ad", "Konum", "Son Güncelleme"])
-    # 1. USBSTOR Analizi
-    try:
-        usbstor_key = reg.open(usbstor_path)
-        print(f"Analiz ediliyor: {usbstor_path}")
-        for device_type in usbstor_key.subkeys():
-            device_name = device_type.name()
-            for serial_key in device_type.subkeys():
-                serial_number = serial_key.name()
-                first_installed_date = serial_key.timestamp()
-                storage_devices.append({
-                    "Cihaz Adı": device_name,
-                    "Seri Numarası": serial_number,
-                    "İlk Takılma Zamanı": pd.Timestamp(first_installed_date) # Timestamp'e çevir
-                })
-        print(f"USBSTOR analizi tamamlandı. {len(storage_devices)} depolama kaydı bulundu.")
-    except Registry.RegistryKeyNotFoundException:
-        print(f"BULGU: {usbstor_path} yolu bulunamadı.")
-    except Exception as e:
-        print(f"USBSTOR okunurken hata oluştu: {e}")
-    # 2. Enum\USB Analizi
-    try:
-        usb_enum_key = reg.open(usb_enum_path)
-        print(f"Analiz ediliyor: {usb_enum_path}")
-        for vid_pid_key in usb_enum_key.subkeys():
-            vid_pid = vid_pid_key.name()
-            for instance_key in vid_pid_key.subkeys():
-                instance_id = instance_key.name()
-                last_update_time = instance_key.timestamp()
-                device_desc = "N/A"
-                friendly_name = "N/A"
-                location = "N/A"
-                try: device_desc = instance_key.value("DeviceDesc").value()
-                except (Registry.RegistryValueNotFoundException, Exception): pass
-                try: friendly_name = instance_key.value("FriendlyName").value()
-                except (Registry.RegistryValueNotFoundException, Exception): pass
-                try: location = instance_key.value("LocationInformation").value()
-                except (Registry.RegistryValueNotFoundException, Exception): pass
-                all_usb_devices.append({
-                    "VID_PID": vid_pid,
-                    "Instance ID / Seri No": instance_id,
-                    "Açıklama": device_desc,
-                    "Kolay Ad": friendly_name,
-                    "Konum": location,
-                    "Son Güncelleme": pd.Timestamp(last_update_time) # Timestamp'e çevir
-                })
-        print(f"Enum\\USB analizi tamamlandı. {len(all_usb_devices)} genel USB kaydı bulundu.")
-    except Registry.RegistryKeyNotFoundException:
-        print(f"HATA: {usb_enum_path} yolu bulunamadı.")
-    except Exception as e:
-        print(f"Enum\\USB okunurken hata oluştu: {e}")
-
-    df_storage = pd.DataFrame(storage_devices)
-    df_all_usb = pd.DataFrame(all_usb_devices)
-    if not df_storage.empty:
-      df_storage = df_storage.dropna(subset=['İlk Takılma Zamanı'])
-      df_storage = df_storage.sort_values(by="İlk Takılma Zamanı", ascending=False)
-    if not df_all_usb.empty:
-       df_all_usb = df_all_usb.dropna(subset=['Son Güncelleme'])
-       df_all_usb = df_all_usb.sort_values(by="Son Güncelleme", ascending=False)
+    frames = parse_hive_artifacts(system_hive_path, [USBSTOR_ARTIFACT, USB_ENUM_ARTIFACT], session, metrics)
+    df_storage = frames[USBSTOR_ARTIFACT.name]
+    df_all_usb = frames[USB_ENUM_ARTIFACT.name]
+    if df_storage is not None:
+        print(f"USBSTOR analizi tamamlandı. {len(df_storage)} depolama kaydı bulundu.")
+    if df_all_usb is not None:
+        print(f"Enum\\USB analizi tamamlandı. {len(df_all_usb)} genel USB kaydı bulundu.")
     return df_storage, df_all_usb
 
+def parse_usb_history(system_hive_path, software_hive_path=None, session=None, metrics=None):
+    """
+    SYSTEM hive'ından (ve verilirse SOFTWARE'deki WPD kayıtlarından) USB cihaz
+    geçmişi tablosunu üretir; bkz. build_device_history. Her hive tek geçişte okunur.
+    """
+    session = session or HiveSession()
+    frames = parse_hive_artifacts(system_hive_path, SYSTEM_ARTIFACTS, session, metrics)
+    if software_hive_path is not None and Path(software_hive_path).is_file():
+        frames.update(parse_hive_artifacts(software_hive_path, [WPD_ARTIFACT], session, metrics))
+    history = build_device_history(frames)
+    print(f"USB cihaz geçmişi: {len(history)} depolama aygıtı.")
+    return history
+
 # --- FONKSİYON 3: KURULU PROGRAMLAR 
-def parse_installed_programs(software_hive_path):
+def _uninstall_rows(match):
+    display_name = match.value("DisplayName")
+    if not display_name: return
+    install_date_formatted = "N/A"
+    if "installdate" in match.values:
+        install_date_str = match.values["installdate"].value()
+        try:
+            install_date_obj = datetime.strptime(install_date_str, '%Y%m%d')
+            install_date_formatted = install_date_obj.strftime('%Y-%m-%d')
+        except (ValueError, TypeError):
+            install_date_formatted = install_date_str if install_date_str else "N/A"
+    yield {
+        "Program Adı": display_name, "Yayıncı": match.value("Publisher", "N/A"),
+        "Sürüm": match.value("DisplayVersion", "N/A"), "Kurulum Tarihi": install_date_formatted
+    }
+
+# 64-bit ve WOW64 Uninstall anahtarları aynı artefaktın iki desenidir
+UNINSTALL_ARTIFACT = artifact_engine.Artifact(
+    "Kurulu Programlar",
+    [r"Microsoft\Windows\CurrentVersion\Uninstall\*", r"Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall\*"],
+    _uninstall_rows, ["Program Adı", "Yayıncı", "Sürüm", "Kurulum Tarihi"],
+    values=("DisplayName", "InstallDate", "Publisher", "DisplayVersion"), categorical=("Yayıncı",),
+    finalize=lambda df: df.sort_values(by="Program Adı"))
+
+def parse_installed_programs(software_hive_path, session=None, metrics=None):
     """
     SOFTWARE hive dosyasını analiz eder ve kurulu programları listeler.
     Kurulum tarihini YYYY-MM-DD formatında gösterir.
     """
-    programs = []
-    uninstall_path_wow64 = r"Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
-    uninstall_path_64 = r"Microsoft\Windows\CurrentVersion\Uninstall"
-    print(f"\n'{software_hive_path}' dosyası açılıyor (Kurulu Program analizi için)...")
-    try:
-        reg = Registry.Registry(str(software_hive_path))
-    except Exception as e:
-        print(f"Hata: SOFTWARE dosyası açılamadı: {e}")
-        return None
-    paths_to_check = [uninstall_path_64, uninstall_path_wow64]
-    for uninstall_path in paths_to_check:
-        try:
-            uninstall_key = reg.open(uninstall_path)
-            print(f"Analiz ediliyor: {uninstall_path}")
-        except Registry.RegistryKeyNotFoundException:
-            print(f"Bilgi: {uninstall_path} yolu bulunamadı, atlanıyor.")
-            continue
-        for prog_key in uninstall_key.subkeys():
-            display_name = None
-            publisher = None
-            display_version = None
-            install_date_formatted = "N/A"
-            try:
-                display_name = prog_key.value("DisplayName").value()
-            except Registry.RegistryValueNotFoundException: continue
-            except Exception: continue
-            if not display_name: continue
-            try:
-                install_date_str = prog_key.value("InstallDate").value()
-                try:
-                    install_date_obj = datetime.strptime(install_date_str, '%Y%m%d')
-                    install_date_formatted = install_date_obj.strftime('%Y-%m-%d')
-                except (ValueError, TypeError):
-                    install_date_formatted = install_date_str if install_date_str else "N/A"
-            except Registry.RegistryValueNotFoundException:
-                install_date_formatted = "N/A"
-            try: publisher = prog_key.value("Publisher").value()
-            except Registry.RegistryValueNotFoundException: publisher = "N/A"
-            try: display_version = prog_key.value("DisplayVersion").value()
-            except Registry.RegistryValueNotFoundException: display_version = "N/A"
-            programs.append({
-                "Program Adı": display_name, "Yayıncı": publisher,
-                "Sürüm": display_version, "Kurulum Tarihi": install_date_formatted
-            })
-    print(f"Kurulu program analizi tamamlandı. Toplam {len(programs)} adet program bulundu.")
-    df = pd.DataFrame(programs)
-    df_sorted = df.sort_values(by="Program Adı")
-    return df_sorted
+    df = parse_hive_artifacts(software_hive_path, [UNINSTALL_ARTIFACT], session, metrics)[UNINSTALL_ARTIFACT.name]
+    if df is None: return None
+    print(f"Kurulu program analizi tamamlandı. Toplam {len(df)} adet program bulundu.")
+    return df
 
 # --- FONKSİYON 4: ÇALIŞTIRILAN PROGRAMLAR 
-def parse_user_assist(ntuser_dat_path):
+def _user_assist_rows(match):
+    # UserAssist\<GUID>\Count altındaki her değer bir program kaydıdır.
+    # Burada yalnızca ham veri toplanır; çözme _user_assist_frame'de topluca yapılır.
+    for value in match.all_values:
+        try:
+            encoded_name = value.name()
+            if encoded_name == "(Default)": continue
+            binary_data = value.value()
+        except Exception: continue
+        if isinstance(binary_data, bytes): # İkili olmayan değerler UserAssist kaydı değildir
+            yield encoded_name, binary_data
+
+def _user_assist_frame(rows):
+    # Modern (72 bayt) ve eski (16 bayt) biçimler tek tamponda çözülür
+    if not rows: return pd.DataFrame(columns=USER_ASSIST_ARTIFACT.columns)
+    keep, run_count, focus_count, last_run = binary_decode.decode_user_assist([data for _, data in rows])
+    return pd.DataFrame({
+        "Program Adı (Deşifre Edilmiş)": binary_decode.rot13_many([name for (name, _), kept in zip(rows, keep) if kept]),
+        "Çalıştırma Sayısı": run_count,
+        "Odaklanma Sayısı": focus_count,
+        "Son Çalıştırma (UTC)": binary_decode.utc_column(last_run)
+    }, columns=USER_ASSIST_ARTIFACT.columns)
+
+USER_ASSIST_ARTIFACT = artifact_engine.Artifact(
+    "Çalıştırılan Programlar (UserAssist)",
+    r"Software\Microsoft\Windows\CurrentVersion\Explorer\UserAssist\*\Count", _user_assist_rows,
+    ["Program Adı (Deşifre Edilmiş)", "Çalıştırma Sayısı", "Odaklanma Sayısı", "Son Çalıştırma (UTC)"],
+    values=("*",), build_frame=_user_assist_frame,
+    finalize=lambda df: df.sort_values(by="Son Çalıştırma (UTC)", ascending=False, na_position='last'))
+
+def parse_user_assist(ntuser_dat_path, session=None, metrics=None):
     """
     NTUSER.DAT hive dosyasını analiz eder, UserAssist kayıtlarını
     (çalıştırılan programlar) bulur ve ROT13 şifresini çözer.
     Modern (72-byte) ve Eski (16-byte) formatları DOĞRU okur.
     TÜM KAYITLARI (Run Count 0 dahil) gösterir.
     """
-    def filetime_to_datetime(ft):
-        try:
-            if ft == 0: return pd.NaT
-            EPOCH_AS_FILETIME = 116444736000000000
-            HUNDREDS_OF_NANOSECONDS = 10000000
-            timestamp = (ft - EPOCH_AS_FILETIME) / HUNDREDS_OF_NANOSECONDS
-            return datetime.fromtimestamp(timestamp, UTC)
-        except Exception: return pd.NaT
-
-    programs = []
-    user_assist_path = r"Software\Microsoft\Windows\CurrentVersion\Explorer\UserAssist"
-    print(f"\n'{ntuser_dat_path}' dosyası açılıyor (UserAssist analizi için)...")
-    try:
-        reg = Registry.Registry(str(ntuser_dat_path))
-    except Exception as e:
-        print(f"Hata: NTUSER.DAT dosyası açılamadı: {e}")
-        return None # None döndür GUI'de kontrol edilecek
+    df = parse_hive_artifacts(ntuser_dat_path, [USER_ASSIST_ARTIFACT], session, metrics)[USER_ASSIST_ARTIFACT.name]
+    if df is None: return None # None döndür GUI'de kontrol edilecek
+    print(f"UserAssist analizi tamamlandı. Toplam {len(df)} adet çalıştırılan program kaydı bulundu.")
+    return df
+
+# --- FONKSİYON 5: AĞ (WIFI) BİLGİLERİ 
+def _network_profile_rows(match):
+    # DateCreated: 16 byte SYSTEMTIME veya 8 byte FILETIME
     try:
-        ua_key = reg.open(user_assist_path)
-    except Registry.RegistryKeyNotFoundException:
-        print(f"BULGU: {user_assist_path} yolu bulunamadı.")
-        return pd.DataFrame(columns=["Program Adı (Deşifre Edilmiş)", "Çalıştırma Sayısı", "Odaklanma Sayısı", "Son Çalıştırma (UTC)"]) # Boş DF
-    for guid_key in ua_key.subkeys():
+        profile_name = match.values["profilename"].value()
+    except Exception: return
+    date_created_raw = None # Ham veri; _network_profile_frame'de topluca çözülür
+    date_created_value_obj = match.values.get("datecreated")
+    if date_created_value_obj is not None:
         try:
-            count_key = guid_key.subkey("Count")
-        except Registry.RegistryKeyNotFoundException: continue
-        for value in count_key.values():
-            decoded_name = ""
-            try:
-                encoded_name = value.name()
-                if encoded_name == "(Default)": continue
-                decoded_name = codecs.decode(encoded_name, 'rot_13')
-                binary_data = value.value()
-                run_count = 0
-                focus_count = 0
-                filetime_raw = 0
-                data_len = len(binary_data)
-                if data_len >= 68: # Modern
-                    run_count = struct.unpack('<I', binary_data[4:8])[0]
-                    focus_count = struct.unpack('<I', binary_data[8:12])[0]
-                    filetime_raw = struct.unpack('<Q', binary_data[60:68])[0]
-                elif data_len >= 16: # Eski
-                    run_count_raw = struct.unpack('<I', binary_data[4:8])[0]
-                    run_count = run_count_raw - 5 if run_count_raw > 4 else 0
-                    filetime_raw = struct.unpack('<Q', binary_data[-8:])[0]
-                else: continue
-                last_run_time = filetime_to_datetime(filetime_raw)
-                programs.append({
-                    "Program Adı (Deşifre Edilmiş)": decoded_name,
-                    "Çalıştırma Sayısı": run_count,
-                    "Odaklanma Sayısı": focus_count,
-                    "Son Çalıştırma (UTC)": last_run_time
-                })
-            except Exception as e: continue
-    print(f"UserAssist analizi tamamlandı. Toplam {len(programs)} adet çalıştırılan program kaydı bulundu.")
-    df = pd.DataFrame(programs)
-    if not programs: return df
-    df_sorted = df.sort_values(by="Son Çalıştırma (UTC)", ascending=False, na_position='last')
-    return df_sorted
+            if date_created_value_obj.value_type() == Registry.RegBin:
+                date_created_raw = date_created_value_obj.value()
+        except Exception: pass
+    yield profile_name, date_created_raw, match.key.name()
 
-# --- FONKSİYON 5: AĞ (WIFI) BİLGİLERİ 
-def parse_network_list(software_hive_path):
+def _network_profile_frame(rows):
+    if not rows: return pd.DataFrame(columns=NETWORK_LIST_ARTIFACT.columns)
+    profile_names, date_created_raw, profile_keys = zip(*rows)
+    return pd.DataFrame({
+        "Ağ Adı (SSID)": profile_names,
+        "İlk Bağlantı (UTC)": binary_decode.utc_column(binary_decode.decode_date_created(date_created_raw)),
+        "Profil Yolu (GUID)": profile_keys
+    }, columns=NETWORK_LIST_ARTIFACT.columns)
+
+NETWORK_LIST_ARTIFACT = artifact_engine.Artifact(
+    "Ağ Geçmişi", r"Microsoft\Windows NT\CurrentVersion\NetworkList\Profiles\*", _network_profile_rows,
+    ["Ağ Adı (SSID)", "İlk Bağlantı (UTC)", "Profil Yolu (GUID)"],
+    values=("ProfileName", "DateCreated"), build_frame=_network_profile_frame,
+    finalize=lambda df: df.sort_values(by="İlk Bağlantı (UTC)", ascending=False, na_position='last'))
+
+def parse_network_list(software_hive_path, session=None, metrics=None):
     """
     SOFTWARE hive dosyasını analiz eder ve 'NetworkList' (geçmiş ağlar)
     bilgilerini çeker. DateCreated için SYSTEMTIME formatını okur.
     """
-    def filetime_to_datetime(ft):
+    df = parse_hive_artifacts(software_hive_path, [NETWORK_LIST_ARTIFACT], session, metrics)[NETWORK_LIST_ARTIFACT.name]
+    if df is None: return None # None döndür
+    print(f"Ağ analizi tamamlandı. Toplam {len(df)} adet ağ profili bulundu.")
+    return df
+
+# Hive başına artefakt listeleri: GUI her hive'ı bu listelerle tek geçişte tarar
+SYSTEM_ARTIFACTS = [USBSTOR_ARTIFACT, USB_ENUM_ARTIFACT, CONTROL_SET_ARTIFACT, MOUNTED_DEVICES_ARTIFACT]
+SOFTWARE_ARTIFACTS = [UNINSTALL_ARTIFACT, NETWORK_LIST_ARTIFACT, WPD_ARTIFACT]
+NTUSER_ARTIFACTS = [USER_ASSIST_ARTIFACT]
+# Kurtarma modunda silinmiş anahtarları aranan artefaktlar (satır üreticileri sözlük döndürenler)
+CARVE_ARTIFACTS = [USBSTOR_ARTIFACT, USB_ENUM_ARTIFACT, UNINSTALL_ARTIFACT]
+
+# --- ÇOK KULLANICILI NTUSER.DAT ANALİZİ
+USER_PROFILE_COLUMN = "Kullanıcı Profili"
+ROOT_PROFILE_NAME = "(vaka kökü)" # Vaka klasörünün kökündeki NTUSER.DAT
+
+def _find_file(folder, file_name):
+    """ folder içinde file_name'i büyük/küçük harf duyarsız arar. """
+    try:
+        return next((p for p in folder.iterdir() if p.name.lower() == file_name.lower() and p.is_file()), None)
+    except OSError:
+        return None
+
+def discover_user_hives(case_folder):
+    """
+    Vaka klasöründeki kullanıcı hive'larını bulur: kökteki NTUSER.DAT ve
+    Users\\*\\NTUSER.DAT (XP: Documents and Settings\\*\\NTUSER.DAT).
+    Dönüş: [(profil adı, yol), ...] profil adına göre sıralı.
+    """
+    case_folder = Path(case_folder)
+    hives = []
+    root_hive = _find_file(case_folder, "NTUSER.DAT")
+    if root_hive is not None:
+        hives.append((ROOT_PROFILE_NAME, root_hive))
+    try:
+        profile_roots = [p for p in case_folder.iterdir() if p.is_dir() and p.name.lower() in USER_PROFILE_DIRS]
+    except OSError:
+        profile_roots = []
+    for profile_root in sorted(profile_roots):
+        for profile_dir in sorted(p for p in profile_root.iterdir() if p.is_dir()):
+            hive_path = _find_file(profile_dir, "NTUSER.DAT")
+            if hive_path is None:
+                continue
+            # Aynı ad iki kökte de varsa (Users ve Documents and Settings) kök adıyla ayrılır
+            name = profile_dir.name
+            if any(existing == name for existing, _ in hives):
+                name = f"{profile_root.name}\\{profile_dir.name}"
+            hives.append((name, hive_path))
+    return sorted(hives, key=lambda hive: hive[0].lower())
+
+def user_profile_category(name, profile):
+    """ Taranamayan bir profilin hata kaydının adı (ör. 'Çalıştırılan Programlar (UserAssist) [ali]'). """
+    return f"{name} [{profile}]"
+
+def failed_user_profiles(frames, name):
+    """ combine_user_frames sonucunda 'name' kategorisi taranamayan profillerin adları. """
+    prefix = f"{name} ["
+    return [key[len(prefix):-1] for key, df in frames.items()
+            if df is None and key.startswith(prefix) and key.endswith("]")]
+
+def _failed_profile(profile, error):
+    print(f"Hata: '{profile}' profili taranamadı: {error}")
+    return {artifact.name: None for artifact in NTUSER_ARTIFACTS}
+
+def _parse_user_profile(profile, hive_path):
+    """
+    İşçi süreç fonksiyonu: tek bir kullanıcının hive'ını NTUSER_ARTIFACTS ile
+    tarar ve kategorilere profil sütununu ekler. (profil, {ad: df}, taranan anahtar)
+    Hive açılamazsa kategoriler None'dır (parse_hive_artifacts).
+    """
+    collector = parser_metrics.MetricsCollector()
+    frames = parse_hive_artifacts(hive_path, NTUSER_ARTIFACTS, metrics=collector)
+    for df in frames.values():
+        if df is not None:
+            df.insert(0, USER_PROFILE_COLUMN, profile)
+    return profile, frames, collector.runs[0].records_scanned
+
+def iter_user_profile_frames(user_hives, workers=1, metrics=None):
+    """
+    Kullanıcı hive'larını (discover_user_hives çıktısı) bir süreç havuzunda
+    paralel tarar ve her profil bittikçe (profil, {kategori: DataFrame})
+    üretir; sıra tamamlanma sırasıdır. workers=None tüm çekirdekleri kullanır,
+    1 ise hive'lar bu süreçte sırayla taranır.
+    Taranamayan (açılamayan ya da işçisi çöken) profiller diğerlerini
+    durdurmaz; kategorileri None olarak üretilir.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with parser_metrics.measure(metrics, "iter_user_profile_frames", f"{len(user_hives)} profil") as run:
+        for _, hive_path in user_hives:
+            run.read_source(hive_path)
+        run.counters["profiles"] = 0
+        run.counters["failed_profiles"] = 0
+
+        def record(frames, keys):
+            run.counters["profiles"] += 1
+            if any(df is None for df in frames.values()):
+                run.counters["failed_profiles"] += 1
+            run.records_scanned += keys
+            run.records_emitted += sum(len(df) for df in frames.values() if df is not None)
+            run.update()
+
+        if workers <= 1 or len(user_hives) <= 1:
+            for profile, hive_path in user_hives:
+                try:
+                    profile, frames, keys = _parse_user_profile(profile, hive_path)
+                except Exception as e:
+                    frames, keys = _failed_profile(profile, e), 0
+                record(frames, keys)
+                yield profile, frames
+            return
+        with ProcessPoolExecutor(max_workers=min(workers, len(user_hives))) as pool:
+            futures = {pool.submit(_parse_user_profile, profile, str(hive_path)): profile
+                       for profile, hive_path in user_hives}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        profile, frames, keys = future.result()
+                    except Exception as e: # İşçi çöktü: yalnızca bu profil başarısız sayılır
+                        profile = futures[future]
+                        frames, keys = _failed_profile(profile, e), 0
+                    record(frames, keys)
+                    yield profile, frames
+            finally:
+                for future in futures:
+                    future.cancel()
+
+def combine_user_frames(profile_frames, artifacts=NTUSER_ARTIFACTS):
+    """
+    {profil: {kategori: DataFrame}} sözlüğünü kategori başına tek DataFrame'e
+    birleştirir. Profiller ada göre sırayla eklenir, ardından artefaktın
+    finalize adımı (ör. zamana göre sıralama) birleşik tabloya uygulanır;
+    sonuç tamamlanma sırasından bağımsızdır.
+    Taranamayan her profil user_profile_category(kategori, profil): None
+    olarak eklenir (0 satır gibi görünmez, hata olarak raporlanır); hiçbir
+    profil taranamadıysa kategorinin kendisi de None'dır.
+    """
+    combined = {}
+    profiles = sorted(profile_frames, key=str.lower)
+    for artifact in artifacts:
+        failed = [profile for profile in profiles if profile_frames[profile].get(artifact.name) is None]
+        for profile in failed:
+            combined[user_profile_category(artifact.name, profile)] = None
+        if failed and len(failed) == len(profiles):
+            combined[artifact.name] = None
+            continue
+        parts = [profile_frames[profile][artifact.name] for profile in profiles if profile not in failed]
+        parts = [df for df in parts if not df.empty]
+        if not parts:
+            combined[artifact.name] = pd.DataFrame(columns=[USER_PROFILE_COLUMN] + artifact.columns)
+            continue
+        df = columnar.categorize(columnar.concat_frames(parts), [USER_PROFILE_COLUMN])
+        combined[artifact.name] = artifact.finalize(df) if artifact.finalize is not None else df
+    return combined
+
+def parse_user_profiles(case_folder, workers=None, metrics=None):
+    """
+    Vaka klasöründeki tüm kullanıcı hive'larını paralel tarar ve kategori
+    başına profil sütunlu birleşik DataFrame döndürür; ör. tüm kullanıcıların
+    UserAssist kayıtları tek tabloda. Hive bulunamazsa boş sözlük.
+    """
+    user_hives = discover_user_hives(case_folder)
+    print(f"{len(user_hives)} kullanıcı profili bulundu.")
+    if not user_hives:
+        return {}
+    profile_frames = dict(iter_user_profile_frames(user_hives, workers=workers, metrics=metrics))
+    return combine_user_frames(profile_frames)
+
+
+# --- SİLİNMİŞ KAYIT KURTARMA (carving)
+# Canlı parser'lar yalnızca logun/hive'ın işaret ettiği kayıtları görür.
+# Kurtarma modu dosyayı belleğe eşler ve kayıt imzalarını doğrudan arar:
+# EVTX kayıtları ('**\0\0') chunk boşluklarında ve kullanılmayan chunk'larda,
+# hive anahtar/değer hücreleri ('nk'/'vk') serbest bırakılmış hücrelerde kalır.
+EVTX_FILE_SIGNATURE = b"ElfFile\x00"
+EVTX_CHUNK_SIGNATURE = b"ElfChnk\x00"
+EVTX_RECORD_SIGNATURE = b"**\x00\x00"
+EVTX_CHUNK_SIZE = 0x10000
+EVTX_CHUNK_HEADER_SIZE = 0x200
+HIVE_FILE_SIGNATURE = b"regf"
+HIVE_FIRST_HBIN = 0x1000
+# Geçerli sayılan kayıt zamanları (FILETIME); aralık dışı imzalar rastlantısaldır
+CARVE_MIN_FILETIME = 125911584000000000 # 2000-01-01
+CARVE_MAX_FILETIME = 157469184000000000 # 2100-01-01
+CARVED_FLAG_COLUMN = "Kurtarıldı"
+CARVED_COLUMNS = [CARVED_FLAG_COLUMN, "Kaynak Dosya", "Ofset"]
+CARVED_LOGON_COLUMNS = LOGON_COLUMNS + ["EventRecordID"] + CARVED_COLUMNS
+CARVED_VALUES_CATEGORY = "Silinmiş Registry Değerleri"
+CARVED_VALUE_COLUMNS = ["Değer Adı", "Tür", "Veri"] + CARVED_COLUMNS
+CARVED_VALUE_PREVIEW = 256 # "Veri" sütununda gösterilen en fazla karakter
+
+def carved_category(name):
+    """ Kurtarılan kayıtların kategori adı (ör. 'Kurulu Programlar (Kurtarılan)'). """
+    return f"{name} (Kurtarılan)"
+
+CARVED_LOGON_CATEGORY = carved_category("Oturum Logları")
+# Kurtarma modunun ürettiği tüm kategoriler (GUI/CLI kategori listeleri)
+CARVED_CATEGORIES = ([CARVED_LOGON_CATEGORY] + [carved_category(artifact.name) for artifact in CARVE_ARTIFACTS]
+                     + [CARVED_VALUES_CATEGORY])
+
+def _evtx_live_end(buf, chunk_offset):
+    """
+    chunk_offset'teki chunk canlı logun parçasıysa canlı kayıtlarının bittiği
+    ofseti, değilse chunk_offset'i döndürür. Bu ofsetten sonraki kayıtlar
+    boşluktadır (silinmiş / üzerine yazılmış kayıtların kalıntıları).
+    Disk imajı gibi EVTX olmayan dosyalarda tüm kayıtlar kurtarılmış sayılır.
+    """
+    if buf[:8] != EVTX_FILE_SIGNATURE:
+        return chunk_offset
+    header_size, chunk_count = struct.unpack_from("<HH", buf, 0x28)
+    index, remainder = divmod(chunk_offset - header_size, EVTX_CHUNK_SIZE)
+    if remainder or not 0 <= index < chunk_count:
+        return chunk_offset
+    return chunk_offset + struct.unpack_from("<I", buf, chunk_offset + 0x30)[0]
+
+def _carved_record_size(buf, offset):
+    """ offset'teki imza geçerli bir kayıt başlığıysa kaydın boyutu, değilse 0. """
+    if offset + 0x28 > len(buf):
+        return 0
+    size, _, filetime = struct.unpack_from("<IQQ", buf, offset + 4)
+    if not 0x30 <= size <= EVTX_CHUNK_SIZE - EVTX_CHUNK_HEADER_SIZE or offset + size > len(buf):
+        return 0
+    if struct.unpack_from("<I", buf, offset + size - 4)[0] != size: # boyut kaydın sonunda tekrarlanır
+        return 0
+    if not CARVE_MIN_FILETIME <= filetime <= CARVE_MAX_FILETIME:
+        return 0
+    return size
+
+def _carve_evtx_stripe(evtx_file_path, start, stop, event_ids):
+    """
+    İşçi süreç fonksiyonu: dosyanın [start, stop) şeridinde başlayan kayıt
+    imzalarını bulur, canlı logda olmayanları kendi chunk'ının şablonlarıyla
+    çözer. Kayıt chunk'ı bulunamazsa (başlık ezilmiş) çözülemez.
+    Dönüş: (satırlar, sayaçlar); satırlar CARVED_LOGON_COLUMNS sırasında.
+    """
+    decoder = _logon_decoder(event_ids)
+    counters = {"candidates": 0, "live": 0, "invalid": 0, "orphan": 0, "records": 0, "xml": 0}
+    rows = []
+    source = Path(evtx_file_path).name
+    buf = carver.open_map(evtx_file_path)
+    if buf is None:
+        return rows, counters
+    try:
+        carver.advise_sequential(buf, start, stop)
+        chunk = None
+        for offset in carver.find_all(buf, EVTX_RECORD_SIGNATURE, start, stop):
+            counters["candidates"] += 1
+            size = _carved_record_size(buf, offset)
+            if not size:
+                counters["invalid"] += 1
+                continue
+            # Kaydı içeren chunk en fazla 64 KB geridedir; son bulunan chunk'ın içindeyse yeniden aranmaz
+            if chunk is None or offset >= chunk[0] + EVTX_CHUNK_SIZE:
+                chunk_offset = buf.rfind(EVTX_CHUNK_SIGNATURE, max(0, offset - EVTX_CHUNK_SIZE + 1), offset)
+                if chunk_offset != -1:
+                    chunk = (chunk_offset, evtx.ChunkHeader(buf, chunk_offset), _evtx_live_end(buf, chunk_offset))
+            if (chunk is None or offset < chunk[0] + EVTX_CHUNK_HEADER_SIZE
+                    or offset + size > chunk[0] + EVTX_CHUNK_SIZE):
+                counters["orphan"] += 1
+                continue
+            if offset < chunk[2]:
+                counters["live"] += 1
+                continue
+            counters["records"] += 1
+            record = evtx.Record(buf, offset, chunk[1])
+            row = _decode_logon_record(record, decoder, counters)
+            if row is not None:
+                rows.append(row + (record.record_num(), True, source, offset))
+    finally:
+        decoder = chunk = None # Kayıt nesneleri eşlemeyi tutmasın
+        buf.close()
+    return rows, counters
+
+def carve_security_log(evtx_file_path, workers=1, event_ids=None, stripe_size=carver.DEFAULT_STRIPE_SIZE,
+                       metrics=None):
+    """
+    Security.evtx dosyalarında (veya EVTX chunk'ları içeren bir disk
+    imajında) canlı logda görünmeyen oturum olaylarını kurtarır: chunk'ların
+    boş alanındaki eski kayıtlar ve sayılmayan chunk'lar. Olaylar canlı
+    parser'la aynı çözücü ve satır üreticisinden geçer; "Kurtarıldı",
+    "Kaynak Dosya", "Ofset" ve EventRecordID sütunları eklenir. Aynı kayıt
+    birden fazla kopyada bulunursa bir kez alınır.
+    workers > 1 (veya None) ise dosya şeritlere bölünüp paralel taranır.
+    Dönüş: DataFrame (CARVED_LOGON_COLUMNS), hata olursa None.
+    """
+    event_ids = LOGON_EVENT_IDS if event_ids is None else tuple(e for e in event_ids if e in LOGON_EVENT_IDS)
+    paths = evtx_paths(evtx_file_path)
+    print(f"'{_evtx_source(paths)}' içinde silinmiş oturum kayıtları aranıyor...")
+    with parser_metrics.measure(metrics, "carve_security_log", _evtx_source(paths)) as run:
+        totals = {}
+        buffer = columnar.ColumnBuffer(CARVED_LOGON_COLUMNS, categorical=LOGON_CATEGORICAL + ("Kaynak Dosya",),
+                                       datetime=("Timestamp",))
         try:
-            if ft == 0: return pd.NaT
-            EPOCH_AS_FILETIME = 116444736000000000
-            HUNDREDS_OF_NANOSECONDS = 10000000
-            timestamp = (ft - EPOCH_AS_FILETIME) / HUNDREDS_OF_NANOSECONDS
-            return datetime.fromtimestamp(timestamp, UTC)
-        except Exception: return pd.NaT
-    def systemtime_to_datetime(st_bytes):
+            with run.phase("decode"):
+                for path in paths:
+                    run.read_source(path)
+                    for rows, counters in carver.scan_stripes(path, _carve_evtx_stripe, (event_ids,), workers,
+                                                              stripe_size):
+                        buffer.extend(rows)
+                        for name, count in counters.items():
+                            totals[name] = totals.get(name, 0) + count
+                        run.records_scanned = totals["candidates"]
+                        run.update()
+            with run.phase("frame"):
+                df = buffer.to_frame()
+                df = (df.drop_duplicates(subset=LOGON_COLUMNS + ["EventRecordID"])
+                      .sort_values("Timestamp", kind="stable", ignore_index=True))
+        except Exception as e:
+            print(f"Dosya taranırken hata oluştu: {e}")
+            return None
+        print(f"{totals.get('candidates', 0)} imza, {totals.get('live', 0)} canlı kayıt, "
+              f"{totals.get('records', 0)} kurtarılan kayıt; {len(df)} oturum olayı kurtarıldı.")
+        run.records_emitted = len(df)
+        run.counters.update(totals)
+        return df
+
+def _carved_key_path(nk):
+    """
+    Serbest bırakılmış anahtarın yolunu (kök adı olmadan) üst anahtar
+    zinciriyle kurar; zincir köke ulaşmazsa (üst anahtar da ezilmişse) None.
+    """
+    names = []
+    seen = set()
+    while not nk.is_root():
+        names.append(nk.name())
+        if nk.offset() in seen or len(names) > 512:
+            return None
+        seen.add(nk.offset())
         try:
-            year, month, _, day, hour, minute, second, millisecond = struct.unpack('<HHHHHHHH', st_bytes)
-            if year == 0: return pd.NaT
-            return datetime(year, month, day, hour, minute, second, millisecond * 1000, tzinfo=UTC)
-        except Exception: return pd.NaT
-
-    networks = []
-    network_list_path = r"Microsoft\Windows NT\CurrentVersion\NetworkList\Profiles"
-    print(f"\n'{software_hive_path}' dosyası açılıyor (Ağ analizi için)...")
+            nk = nk.parent_key()
+        except (RegistryParse.RegistryException, struct.error):
+            return None
+    return "\\".join(reversed(names))
+
+def _free_cell(buf, offset, min_size):
+    """ offset'teki imza serbest bir hücrenin başındaysa True (boyut > 0, 8 bayt hizalı). """
+    if offset < HIVE_FIRST_HBIN + 4 or (offset - 4) % 8:
+        return False
+    size = struct.unpack_from("<i", buf, offset - 4)[0]
+    return min_size <= size and offset - 4 + size <= len(buf)
+
+def _carved_value_row(buf, offset, first_hbin, source):
+    """ Serbest bir 'vk' hücresinden değer satırı; tutarsız hücrede None. """
+    name_length, data_length, _, data_type = struct.unpack_from("<HIII", buf, offset + 2)
+    if data_type > 11 or (data_length & 0x7FFFFFFF) > 1024 * 1024 or offset + 0x14 + name_length > len(buf):
+        return None
+    value = Registry.RegistryValue(RegistryParse.VKRecord(buf, offset, RegistryParse.HBINCell(buf, offset - 4,
+                                                                                              first_hbin)))
     try:
-        reg = Registry.Registry(str(software_hive_path))
-    except Exception as e:
-        print(f"Hata: SOFTWARE dosyası açılamadı: {e}")
-        return None # None döndür
+        name = value.name() or "(Varsayılan)"
+        data = value.value()
+        type_name = value.value_type_str()
+    except Exception:
+        return None
+    if isinstance(data, bytes):
+        data = data[:CARVED_VALUE_PREVIEW // 2].hex()
+    return (name, type_name, str(data)[:CARVED_VALUE_PREVIEW], True, source, offset)
+
+def _carve_hive_stripe(hive_path, start, stop, artifact_names, include_values):
+    """
+    İşçi süreç fonksiyonu: hive'ın [start, stop) şeridindeki serbest 'nk'
+    hücrelerini artefakt desenleriyle eşleyip aynı satır üreticileriyle,
+    include_values ise serbest 'vk' hücrelerini de değer olarak çözer.
+    Dönüş: ({artefakt adı: [satır, ...]}, [değer satırı, ...], sayaçlar)
+    """
+    artifacts = [artifact for artifact in CARVE_ARTIFACTS if artifact.name in artifact_names]
+    matcher = artifact_engine.KeyPathMatcher(artifacts)
+    rows = {artifact.name: [] for artifact in artifacts}
+    value_rows = []
+    counters = {"candidates": 0, "keys": 0, "orphan": 0, "matches": 0, "values": 0}
+    source = Path(hive_path).name
+    buf = carver.open_map(hive_path)
+    if buf is None or buf[:4] != HIVE_FILE_SIGNATURE:
+        if buf is not None:
+            buf.close()
+        return rows, value_rows, counters
     try:
-        profiles_key = reg.open(network_list_path)
-        print(f"Analiz ediliyor: {network_list_path}")
-    except Registry.RegistryKeyNotFoundException:
-        print(f"BULGU: {network_list_path} yolu bulunamadı.")
-        return pd.DataFrame(columns=["Ağ Adı (SSID)", "İlk Bağlantı (UTC)", "Profil Yolu (GUID)"]) # Boş DF
-    for profile in profiles_key.subkeys():
-        profile_name = "N/A"
-        date_created = pd.NaT
-        try:
-            profile_name_value = profile.value("ProfileName")
-            profile_name = profile_name_value.value()
+        carver.advise_sequential(buf, start, stop)
+        regf = RegistryParse.REGFBlock(buf, 0, False)
+        first_hbin = RegistryParse.HBINBlock(buf, HIVE_FIRST_HBIN, regf)
+        for offset in carver.find_all(buf, b"nk", start, stop):
+            if not _free_cell(buf, offset, 0x50):
+                continue
+            counters["candidates"] += 1
             try:
-                date_created_value_obj = profile.value("DateCreated")
-                value_type = date_created_value_obj.value_type()
-                raw_value = date_created_value_obj.value()
-                if value_type == Registry.RegBin and len(raw_value) == 16:
-                    date_created = systemtime_to_datetime(raw_value)
-                elif value_type == Registry.RegBin and len(raw_value) == 8:
-                    filetime_int = struct.unpack('<Q', raw_value)[0]
-                    date_created = filetime_to_datetime(filetime_int)
-            except Registry.RegistryValueNotFoundException: pass
-            except Exception: pass
-        except Registry.RegistryValueNotFoundException: continue
-        except Exception: continue
-        networks.append({
-            "Ağ Adı (SSID)": profile_name,
-            "İlk Bağlantı (UTC)": date_created,
-            "Profil Yolu (GUID)": profile.name()
-        })
-    print(f"Ağ analizi tamamlandı. Toplam {len(networks)} adet ağ profili bulundu.")
-    df = pd.DataFrame(networks)
-    if not networks: return df
-    df_sorted = df.sort_values(by="İlk Bağlantı (UTC)", ascending=False, na_position='last')
-    return df_sorted
+                nk = RegistryParse.NKRecord(buf, offset, RegistryParse.HBINCell(buf, offset - 4, first_hbin))
+                name_length = nk.unpack_word(0x48)
+                if not 0 < name_length <= 512 or not CARVE_MIN_FILETIME <= nk.unpack_qword(0x04) <= CARVE_MAX_FILETIME:
+                    continue
+                key_path = _carved_key_path(nk)
+            except Exception:
+                continue
+            counters["keys"] += 1
+            if key_path is None:
+                counters["orphan"] += 1
+                continue
+            key = Registry.RegistryKey(nk)
+            for (artifact_index, _), target_rows in matcher.build_rows(key, key_path).items():
+                counters["matches"] += 1
+                for row in target_rows:
+                    rows[artifacts[artifact_index].name].append(
+                        dict(row, **{CARVED_FLAG_COLUMN: True, "Kaynak Dosya": source, "Ofset": offset}))
+        if include_values:
+            for offset in carver.find_all(buf, b"vk", start, stop):
+                if not _free_cell(buf, offset, 0x18):
+                    continue
+                counters["candidates"] += 1
+                try:
+                    row = _carved_value_row(buf, offset, first_hbin, source)
+                except Exception:
+                    continue
+                if row is not None:
+                    counters["values"] += 1
+                    value_rows.append(row)
+    finally:
+        regf = first_hbin = nk = key = matcher = None
+        buf.close()
+    return rows, value_rows, counters
 
+def carved_value_frame(value_rows=()):
+    """ Serbest 'vk' hücrelerinden kurtarılan değerlerin tablosu. """
+    df = pd.DataFrame(list(value_rows), columns=CARVED_VALUE_COLUMNS)
+    return columnar.categorize(df, ("Tür", "Kaynak Dosya"))
 
+def carve_hive_artifacts(hive_path, artifacts=None, workers=1, include_values=True,
+                         stripe_size=carver.DEFAULT_STRIPE_SIZE, metrics=None):
+    """
+    Hive dosyasındaki serbest bırakılmış (silinmiş) anahtar hücrelerini
+    kurtarır. Üst anahtar zinciri sağlam kalan anahtarlar artefakt
+    desenleriyle eşlenir ve canlı parser'ın satır üreticilerinden geçer;
+    "Kurtarıldı", "Kaynak Dosya" ve "Ofset" sütunları eklenir.
+    artifacts: CARVE_ARTIFACTS içinden seçilenler (varsayılan: hepsi)
+    include_values: serbest 'vk' hücreleri de CARVED_VALUES_CATEGORY olarak döndürülür
+    Dönüş: {carved_category(artefakt adı): DataFrame, ...}; hive açılamazsa her kategori için None.
+    """
+    artifacts = CARVE_ARTIFACTS if artifacts is None else list(artifacts)
+    names = tuple(artifact.name for artifact in artifacts)
+    categories = [carved_category(name) for name in names] + ([CARVED_VALUES_CATEGORY] if include_values else [])
+    print(f"'{hive_path}' içinde silinmiş anahtarlar aranıyor...")
+    with parser_metrics.measure(metrics, f"carve_hive_artifacts[{Path(hive_path).name}]", hive_path) as run:
+        run.read_source(hive_path)
+        try:
+            with open(hive_path, "rb") as f:
+                if f.read(4) != HIVE_FILE_SIGNATURE:
+                    raise ValueError("geçerli bir hive dosyası değil (regf imzası yok)")
+            rows = {name: [] for name in names}
+            value_rows = []
+            totals = {}
+            with run.phase("decode"):
+                for stripe_rows, stripe_values, counters in carver.scan_stripes(
+                        hive_path, _carve_hive_stripe, (names, include_values), workers, stripe_size):
+                    for name, artifact_rows in stripe_rows.items():
+                        rows[name].extend(artifact_rows)
+                    value_rows.extend(stripe_values)
+                    for name, count in counters.items():
+                        totals[name] = totals.get(name, 0) + count
+                    run.records_scanned = totals["candidates"]
+                    run.update()
+        except Exception as e:
+            print(f"Hata: {Path(hive_path).name} taranamadı: {e}")
+            return {category: None for category in categories}
+        frames = {}
+        with run.phase("frame"):
+            for artifact in artifacts:
+                df = pd.DataFrame(rows[artifact.name], columns=artifact.columns + CARVED_COLUMNS)
+                df = columnar.categorize(df, artifact.categorical)
+                frames[carved_category(artifact.name)] = artifact.finalize(df) if artifact.finalize else df
+            if include_values:
+                frames[CARVED_VALUES_CATEGORY] = carved_value_frame(value_rows)
+        print(f"{totals.get('keys', 0)} silinmiş anahtar ({totals.get('orphan', 0)} yolu kurulamadı), "
+              f"{totals.get('matches', 0)} artefakt eşleşmesi, {totals.get('values', 0)} silinmiş değer bulundu.")
+        run.records_emitted = sum(len(df) for df in frames.values())
+        run.counters.update(totals)
+        return frames
+
+def carve_case(case_folder, workers=None, metrics=None):
+    """
+    Vaka klasöründe kurtarma modunu çalıştırır: Security logları, SYSTEM ve
+    SOFTWARE. Silinmiş değerler tek tabloda birleşir. Bulunamayan kaynaklar
+    atlanır; dönüş {kategori: DataFrame}.
+    """
+    case_folder = Path(case_folder)
+    frames = {}
+    sec_log_paths = discover_security_logs(case_folder)
+    if sec_log_paths:
+        frames[CARVED_LOGON_CATEGORY] = carve_security_log(sec_log_paths, workers=workers, metrics=metrics)
+    value_frames = []
+    for file_name, artifacts in (("SYSTEM", SYSTEM_ARTIFACTS), ("SOFTWARE", SOFTWARE_ARTIFACTS)):
+        hive_path = case_folder / file_name
+        carve = [artifact for artifact in CARVE_ARTIFACTS if artifact in artifacts]
+        if not hive_path.is_file():
+            continue
+        hive_frames = carve_hive_artifacts(hive_path, carve, workers=workers, metrics=metrics)
+        value_frames.append(hive_frames.pop(CARVED_VALUES_CATEGORY))
+        frames.update(hive_frames)
+    value_frames = [df for df in value_frames if df is not None]
+    if value_frames:
+        frames[CARVED_VALUES_CATEGORY] = columnar.concat_frames(value_frames)
+    return frames
 
 
 # --- if __name__ == '__main__': 
@@ -359,6 +1579,7 @@ if __name__ == '__main__':
     system_file = script_dir / "CASE_FILES" / "SYSTEM"
     software_file = script_dir / "CASE_FILES" / "SOFTWARE"
     ntuser_file = script_dir / "CASE_FILES" / "NTUSER.DAT"
+    session = HiveSession()
 
     print("-" * 50)
     logon_df = parse_security_log(evtx_file)
@@ -367,7 +1588,7 @@ if __name__ == '__main__':
         print(logon_df)
 
     print("-" * 50)
-    usb_storage_df, usb_all_df = parse_usb_devices(system_file)
+    usb_storage_df, usb_all_df = parse_usb_devices(system_file, session=session)
     if usb_storage_df is not None:
         print("\n--- Takılan USB Depolama Aygıtları ---")
         print(usb_storage_df)
@@ -376,13 +1597,13 @@ if __name__ == '__main__':
         print(usb_all_df)
 
     print("-" * 50)
-    installed_programs_df = parse_installed_programs(software_file)
+    installed_programs_df = parse_installed_programs(software_file, session=session)
     if installed_programs_df is not None:
         print("\n--- Kurulu Programlar ---")
         print(installed_programs_df)
 
     print("-" * 50)
-    user_assist_df = parse_user_assist(ntuser_file)
+    user_assist_df = parse_user_assist(ntuser_file, session=session)
     if user_assist_df is not None:
         print("\n--- Çalıştırılan Programlar (UserAssist) ---")
         pd.set_option('display.max_rows', 1000)
@@ -391,7 +1612,7 @@ if __name__ == '__main__':
     # --- KALDIRILDI: Recent Files MRU çağrıları ---
 
     print("-" * 50)
-    network_df = parse_network_list(software_file)
+    network_df = parse_network_list(software_file, session=session)
     if network_df is not None:
         print("\n--- Geçmiş Ağ Bağlantıları (Wi-Fi/LAN) ---")
         print(network_df)
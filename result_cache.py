@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import registry_parser
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("REGISTRY_ANALYSIS_CACHE", Path.home() / ".cache" / "registry_analysis"))
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+DIGEST_STORE_NAME = "digests.json"
+DIGEST_STORE_MAX_ENTRIES = 4096
+
+# Dosya özetleri (yol, boyut, mtime_ns) ile saklanır: süreç içinde sözlükte,
+# süreçler arasında önbellek dizinindeki digests.json'da. Boyutu ve
+# değişiklik zamanı aynı kalan dosya yeniden okunmaz.
+_digest_lock = threading.Lock()
+_digests = None # yol -> {"size", "mtime_ns", "sha256"}
+
+
+def _digest_store_path():
+    return DEFAULT_CACHE_DIR / DIGEST_STORE_NAME
+
+def _load_digests():
+    global _digests
+    if _digests is None:
+        try:
+            with open(_digest_store_path(), "r", encoding="utf-8") as f:
+                _digests = json.load(f)
+        except (OSError, ValueError):
+            _digests = {}
+    return _digests
+
+def _save_digests(digests):
+    """ Kayıtlı özetleri diske yazar; en eski kayıtlar DIGEST_STORE_MAX_ENTRIES'te atılır. """
+    entries = list(digests.items())[-DIGEST_STORE_MAX_ENTRIES:]
+    store_path = _digest_store_path()
+    tmp_path = store_path.with_name(f"{DIGEST_STORE_NAME}.{os.getpid()}.tmp")
+    try:
+        store_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(entries), f)
+        os.replace(tmp_path, store_path)
+    except OSError as e: # Özet kaydı yalnızca hızlandırmadır; yazılamazsa bir sonraki açılışta yeniden hesaplanır
+        print(f"Uyarı: dosya özetleri kaydedilemedi: {e}")
+
+def forget_digests():
+    """ Süreçteki özet kayıtlarını bırakır; dosyalar bir sonraki istekte diskten yeniden yüklenir. """
+    global _digests
+    with _digest_lock:
+        _digests = None
+
+def file_sha256(path, st=None, remember=True):
+    """
+    Dosyanın SHA-256 özeti. Dosya bu boyut ve değişiklik zamanıyla daha önce
+    özetlendiyse kayıtlı özet döner. remember=False ise (ör. dışa aktarılan
+    çıktılar) sonuç kaydedilmez. Okuma hatasında OSError yükselir.
+    """
+    path = Path(path)
+    st = st or path.stat()
+    key = str(path.resolve())
+    with _digest_lock:
+        entry = _load_digests().get(key)
+    if entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+        return entry["sha256"]
+    with open(path, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    if remember:
+        with _digest_lock:
+            digests = _load_digests()
+            digests.pop(key, None) # Yeniden eklenen kayıt en yeni sayılır
+            digests[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+            _save_digests(digests)
+    return digest
+
+
+def file_fingerprint(path):
+    """
+    Kaynak dosyanın kimliği: boyut, değişiklik zamanı ve içerik özeti (SHA-256).
+    Özet file_sha256 ile alınır; değişmeyen dosya yeniden okunmaz.
+    Dosya yoksa None döner.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+        digest = file_sha256(path, st)
+    except OSError:
+        return None
+    return {"name": path.name, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+
+
+class ResultCache:
+    """
+    Analiz sonuçlarının diskte tutulan önbelleği.
+
+    Her kayıt bir iş adı (ör. "SYSTEM"), kaynak dosyaların parmak izleri ve
+    PARSER_VERSION ile anahtarlanır; kategori başına bir Parquet dosyası
+    olarak saklanır. Toplam boyut max_bytes'ı aşarsa en uzun süre
+    kullanılmamış kayıtlar silinir. Birden fazla iş parçacığından
+    kullanılabilir.
+    """
+    INDEX_NAME = "index.json"
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    # --- anahtar
+    def key(self, job_name, source_paths):
+        """
+        Kaynak dosyaların parmak izlerinden önbellek anahtarı üretir.
+        Kaynaklardan biri okunamıyorsa None döner (sonuç önbelleğe alınmaz).
+        """
+        fingerprints = []
+        for path in source_paths:
+            fingerprint = file_fingerprint(path)
+            if fingerprint is None:
+                return None
+            fingerprints.append(fingerprint)
+        material = json.dumps([registry_parser.PARSER_VERSION, job_name, fingerprints], sort_keys=True)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    # --- indeks
+    def _read_index(self):
+        try:
+            with open(self.cache_dir / self.INDEX_NAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_dir / (self.INDEX_NAME + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.cache_dir / self.INDEX_NAME)
+
+    # --- okuma / yazma
+    def load(self, key):
+        """ Önbellekteki {kategori: DataFrame} sözlüğünü döndürür; yoksa None. """
+        if key is None:
+            return None
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+            entry_dir = self.cache_dir / key
+            try:
+                frames = {name: pd.read_parquet(entry_dir / file_name)
+                          for name, file_name in entry["files"].items()}
+            except Exception:
+                # Bozuk ya da yarım kalmış kayıt: sil, yeniden analiz edilsin
+                index.pop(key, None)
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                self._write_index(index)
+                return None
+            entry["last_used"] = time.time()
+            self._write_index(index)
+            return frames
+
+    def store(self, key, frames):
+        """
+        {kategori: DataFrame} sözlüğünü önbelleğe yazar. Yazılamayan
+        (ör. pyarrow kurulu değil) sonuçlar sessizce önbelleğe alınmaz.
+        """
+        if key is None or any(df is None for df in frames.values()):
+            return False
+        with self._lock:
+            entry_dir = self.cache_dir / key
+            tmp_dir = self.cache_dir / (key + ".tmp")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            files = {}
+            try:
+                tmp_dir.mkdir(parents=True)
+                for i, (name, df) in enumerate(frames.items()):
+                    file_name = f"{i}.parquet"
+                    df.to_parquet(tmp_dir / file_name)
+                    files[name] = file_name
+            except Exception as e:
+                print(f"Sonuç önbelleğe yazılamadı: {e}")
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return False
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+
+            index = self._read_index()
+            index[key] = {
+                "files": files,
+                "size": sum(p.stat().st_size for p in entry_dir.iterdir()),
+                "last_used": time.time(),
+            }
+            self._evict(index, keep=key)
+            self._write_index(index)
+            return True
+
+    def _evict(self, index, keep=None):
+        """ Toplam boyut sınırın altına inene kadar en eski kayıtları siler. """
+        total = sum(entry["size"] for entry in index.values())
+        for key in sorted(index, key=lambda k: index[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= index.pop(key)["size"]
+            shutil.rmtree(self.cache_dir / key, ignore_errors=True)
+
+    def clear(self):
+        """ Tüm önbelleği (kayıtlı dosya özetleri dahil) siler. """
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        forget_digests()
+
+    def cached(self, job_name, source_paths, parse, force=False):
+        """
+        parse() sonucunu önbellekten getirir ya da çalıştırıp önbelleğe yazar.
+        force=True ise önbellek okunmaz, sonuç yeniden üretilip üzerine yazılır.
+        parse() None döndürürse (ör. iptal) hiçbir şey yazılmaz.
+        """
+        key = self.key(job_name, source_paths)
+        if not force:
+            frames = self.load(key)
+            if frames is not None:
+                return frames
+        frames = parse()
+        if frames is not None:
+            self.store(key, frames)
+        return frames
@@ -0,0 +1,28 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+# Testler kullanıcının önbellek dizinine (sonuçlar, dosya özetleri) yazmaz
+os.environ["REGISTRY_ANALYSIS_CACHE"] = tempfile.mkdtemp(prefix="registry_analysis_test_")
+
+from benchmarks import synthetic_evtx, synthetic_hive
+
+
+@pytest.fixture(scope="session")
+def security_log(tmp_path_factory):
+    """ Oturum ve gürültü olayları karışık, birkaç chunk'lık sentetik Security.evtx. """
+    path = tmp_path_factory.mktemp("evtx") / "Security.evtx"
+    synthetic_evtx.write_evtx(path, 600, 400, seed=7)
+    return path
+
+
+@pytest.fixture(scope="session")
+def system_hive(tmp_path_factory):
+    path = tmp_path_factory.mktemp("hive") / "SYSTEM"
+    synthetic_hive.build_system_hive(path, 20, seed=1)
+    return path
@@ -0,0 +1,133 @@
+import artifact_engine
+import registry_parser
+
+
+class FakeValue:
+    def __init__(self, name, value):
+        self._name, self._value = name, value
+
+    def name(self):
+        return self._name
+
+    def value(self):
+        return self._value
+
+
+class FakeKey:
+    """ scan_hive'ın kullandığı Registry anahtarı arayüzü; okumaları sayar. """
+    def __init__(self, path, children=(), values=None, broken=False):
+        self._path = path
+        self._name = path.rsplit("\\", 1)[-1]
+        self._children = list(children)
+        self._values = [FakeValue(name, value) for name, value in (values or {}).items()]
+        self.broken = broken
+        self.subkey_reads = 0
+
+    def name(self):
+        return self._name
+
+    def path(self):
+        return self._path
+
+    def subkeys(self):
+        self.subkey_reads += 1
+        if self.broken:
+            raise OSError("bozuk hücre")
+        return list(self._children)
+
+    def values(self):
+        return list(self._values)
+
+
+def _hive(broken=()):
+    """ ROOT\\Enum\\USBSTOR\\<aygıt>\\<seri> ve ROOT\\Enum\\USB\\<vid>\\<seri> ağacı. """
+    def key(path, children=(), values=None):
+        return FakeKey(path, children, values, broken=path in broken)
+    usbstor = key(r"ROOT\Enum\USBSTOR", [
+        key(r"ROOT\Enum\USBSTOR\Disk_A", [key(r"ROOT\Enum\USBSTOR\Disk_A\SER1", values={"FriendlyName": "A"}),
+                                          key(r"ROOT\Enum\USBSTOR\Disk_A\SER2")]),
+        key(r"ROOT\Enum\USBSTOR\Disk_B", [key(r"ROOT\Enum\USBSTOR\Disk_B\SER3", values={"friendlyname": "B"})]),
+    ])
+    usb = key(r"ROOT\Enum\USB", [key(r"ROOT\Enum\USB\VID_1", [key(r"ROOT\Enum\USB\VID_1\SER1")])])
+    enum = key(r"ROOT\Enum", [usbstor, usb])
+    return key("ROOT", [enum, key(r"ROOT\Other", [key(r"ROOT\Other\Deep")])]), usbstor
+
+
+def _capture_rows(match):
+    yield {"captures": match.captures, "friendly": match.value("FriendlyName")}
+
+
+STORAGE = artifact_engine.Artifact("storage", r"Enum\USBSTOR\*\*", _capture_rows, ["captures", "friendly"],
+                                   values=("FriendlyName",))
+DEVICES = artifact_engine.Artifact("devices", [r"Enum\USB\*\*", r"Enum\Yok\*"], _capture_rows,
+                                   ["captures", "friendly"])
+
+
+def test_wildcards_capture_key_names_in_one_pass():
+    root, usbstor = _hive()
+    rows, missing, failed = artifact_engine.scan_hive(root, [STORAGE, DEVICES])
+    assert rows[(0, 0)] == [{"captures": ("Disk_A", "SER1"), "friendly": "A"},
+                            {"captures": ("Disk_A", "SER2"), "friendly": None},
+                            {"captures": ("Disk_B", "SER3"), "friendly": "B"}]
+    assert rows[(1, 0)] == [{"captures": ("VID_1", "SER1"), "friendly": None}]
+    assert usbstor.subkey_reads == 1
+    # Desenlerin uzanmadığı dallara inilmez
+    assert root._children[1].subkey_reads == 0
+    assert missing == {(1, 1): r"Enum\Yok"}
+    assert failed == {}
+
+
+def test_build_frames_keeps_columns_for_empty_results():
+    root, _ = _hive()
+    rows, _, _ = artifact_engine.scan_hive(root, [STORAGE, DEVICES])
+    frames = artifact_engine.build_frames([STORAGE, DEVICES], rows)
+    assert len(frames["storage"]) == 3 and len(frames["devices"]) == 1
+    empty = artifact_engine.build_frames([STORAGE], {})["storage"]
+    assert empty.empty and list(empty.columns) == ["captures", "friendly"]
+
+
+def test_unreadable_branch_is_failed_not_missing():
+    root, _ = _hive(broken=(r"ROOT\Enum\USBSTOR",))
+    rows, missing, failed = artifact_engine.scan_hive(root, [STORAGE, DEVICES])
+    assert list(failed) == [(0, 0)]
+    assert r"Enum\USBSTOR" in failed[(0, 0)]
+    assert rows[(0, 0)] == [] and len(rows[(1, 0)]) == 1
+    assert missing == {(1, 1): r"Enum\Yok"}
+
+
+def test_unreadable_root_names_the_key():
+    root, _ = _hive(broken=("ROOT",))
+    rows, missing, failed = artifact_engine.scan_hive(root, [STORAGE, DEVICES])
+    assert set(failed) == {(0, 0), (1, 0), (1, 1)}
+    assert all(message.startswith("ROOT okunurken hata") for message in failed.values())
+    assert missing == {}
+
+
+class FakeHive:
+    def __init__(self, root):
+        self._root = root
+
+    def root(self):
+        return self._root
+
+
+class FakeSession:
+    """ HiveSession'ın parse_hive_artifacts'in kullandığı kısmı. """
+    def __init__(self, root):
+        self._hive = FakeHive(root)
+
+    def hive(self, hive_path):
+        return self._hive
+
+    def open_key(self, hive_path, key_path):
+        key = self._hive.root()
+        for name in key_path.split("\\"):
+            key = next(child for child in key._children if child.name().lower() == name.lower())
+        return key
+
+
+def test_parse_hive_artifacts_reports_failed_artifacts_as_none():
+    root, _ = _hive(broken=(r"ROOT\Enum\USBSTOR",))
+    frames = registry_parser.parse_hive_artifacts("SYSTEM", [STORAGE, DEVICES], session=FakeSession(root))
+    assert frames["storage"] is None
+    assert len(frames["devices"]) == 1
@@ -0,0 +1,53 @@
+import codecs
+import struct
+from datetime import datetime, UTC
+
+import numpy as np
+import pandas as pd
+
+import binary_decode
+
+
+def test_rot13_round_trip():
+    texts = ["{6D809377-6AF0-444B-8957-A3773F02200E}\\Notepad.exe", "ÇĞİÖŞÜ çğıöşü", "", "A\0B"]
+    assert binary_decode.rot13_many(binary_decode.rot13_many(texts)) == texts
+    assert binary_decode.rot13_many(texts) == [codecs.decode(text, "rot_13") for text in texts]
+
+
+def test_filetime_matches_fromtimestamp():
+    filetimes = np.array([0, 1, binary_decode.EPOCH_AS_FILETIME, 133480000001234567, 133480000001234565,
+                          2**63 + 5], dtype=np.uint64)
+    decoded = binary_decode.filetime_to_datetime64(filetimes)
+    for filetime, value in zip(filetimes.tolist(), decoded):
+        if filetime == 0 or filetime >= 2**63:
+            assert np.isnat(value)
+            continue
+        expected = datetime.fromtimestamp((filetime - binary_decode.EPOCH_AS_FILETIME) / 10**7, UTC)
+        assert pd.Timestamp(value).tz_localize("UTC") == expected
+
+
+def test_filetime_round_trip():
+    moments = pd.date_range("2001-03-04 05:06:07", periods=50, freq="37h", tz="UTC") + pd.Timedelta(microseconds=250)
+    filetimes = (moments.as_unit("us").asi8.astype(np.int64) * 10 + binary_decode.EPOCH_AS_FILETIME).astype(np.uint64)
+    decoded = binary_decode.utc_column(binary_decode.filetime_to_datetime64(filetimes))
+    assert (decoded == moments).all()
+
+
+def test_user_assist_modern_and_legacy():
+    last_run = 133480000000000000
+    modern = struct.pack("<IIII44sQ", 0, 7, 3, 1200, b"\0" * 44, last_run) + b"\0" * 4
+    legacy = struct.pack("<IIQ", 1, 9, last_run)
+    keep, run_count, focus_count, decoded = binary_decode.decode_user_assist([modern, b"short", legacy])
+    assert keep.tolist() == [True, False, True]
+    assert run_count.tolist() == [7, 4]
+    assert focus_count.tolist() == [3, 0]
+    assert decoded[0] == decoded[1] == binary_decode.filetime_to_datetime64(np.array([last_run]))[0]
+
+
+def test_date_created_systemtime_and_filetime():
+    systemtime = struct.pack("<8H", 2024, 5, 3, 17, 13, 45, 30, 250)
+    filetime = struct.pack("<Q", 133480000000000000)
+    decoded = binary_decode.decode_date_created([systemtime, filetime, None, b"\1\2"])
+    assert decoded[0] == np.datetime64("2024-05-17T13:45:30.250000")
+    assert decoded[1] == binary_decode.filetime_to_datetime64(np.array([133480000000000000], dtype=np.uint64))[0]
+    assert np.isnat(decoded[2]) and np.isnat(decoded[3])
@@ -0,0 +1,105 @@
+import struct
+
+import Evtx.Evtx as evtx
+import pandas as pd
+from Registry import Registry
+
+import carver
+import registry_parser
+from benchmarks import synthetic_evtx
+
+HIDDEN_RECORDS = 20
+
+
+def _hide_last_records(path, count):
+    """
+    Son chunk'ın son count kaydını canlı logdan düşürür (chunk'ın boş alanında
+    kalırlar): Windows'un silinmiş/yarım kalmış kayıtları bıraktığı durum.
+    """
+    data = bytearray(path.read_bytes())
+    header_size = struct.unpack_from("<H", data, 0x28)[0]
+    chunk_count = struct.unpack_from("<H", data, 0x2A)[0]
+    last_chunk = header_size + (chunk_count - 1) * synthetic_evtx.CHUNK_SIZE
+    with evtx.Evtx(str(path)) as log:
+        offsets = [record.offset() for record in evtx.ChunkHeader(log._buf, last_chunk).records()]
+    struct.pack_into("<I", data, last_chunk + 0x30, offsets[-count] - last_chunk)
+    last_live_number = struct.unpack_from("<Q", data, offsets[-count - 1] + 8)[0]
+    struct.pack_into("<Q", data, last_chunk + 0x10, last_live_number)
+    path.write_bytes(data)
+
+
+def _sorted_rows(df):
+    return df[registry_parser.LOGON_COLUMNS].astype(str).sort_values(registry_parser.LOGON_COLUMNS) \
+        .reset_index(drop=True)
+
+
+def test_carve_security_log_recovers_hidden_records(security_log, tmp_path):
+    path = tmp_path / "Security.evtx"
+    path.write_bytes(security_log.read_bytes())
+    _hide_last_records(path, HIDDEN_RECORDS)
+    full = registry_parser.parse_security_log(security_log)
+    live = registry_parser.parse_security_log(path)
+    carved = registry_parser.carve_security_log(path)
+    assert len(live) < len(full)
+    assert carved["Kurtarıldı"].all()
+    # Kurtarılan olaylar canlı logda görünmeyenlerin tamamıdır
+    assert _sorted_rows(pd.concat([live, carved])).equals(_sorted_rows(full))
+
+
+def test_carve_security_log_in_disk_image(security_log, tmp_path):
+    """ Rastgele veri arasına gömülü chunk, şerit sınırlarından bağımsız bulunur. """
+    data = security_log.read_bytes()
+    chunk = data[0x1000:0x1000 + synthetic_evtx.CHUNK_SIZE]
+    image = tmp_path / "disk.img"
+    image.write_bytes(b"\xAB" * 300_001 + chunk + b"\xCD" * 70_003)
+    carved = registry_parser.carve_security_log(image, workers=2, stripe_size=1 << 16)
+    with evtx.Evtx(str(security_log)) as log:
+        first_chunk = next(log.chunks())
+        record_numbers = {record.record_num() for record in first_chunk.records()}
+    live = registry_parser.parse_security_log(security_log)
+    assert 0 < len(carved) <= len(live)
+    assert set(carved["EventRecordID"]) <= record_numbers
+
+
+def test_find_all_across_stripes(tmp_path):
+    """ Şerit sınırını aşan imza bir kez, başladığı şeritte bulunur. """
+    path = tmp_path / "data.bin"
+    signature = registry_parser.EVTX_CHUNK_SIGNATURE
+    path.write_bytes(b"." * 1020 + signature + b"." * 3000 + signature + b"." * 10)
+    with carver.open_map(path) as data:
+        offsets = [offset for start, stop in carver.stripes(len(data), 1024)
+                   for offset in carver.find_all(data, signature, start, stop)]
+    assert offsets == [1020, 1020 + 8 + 3000]
+
+
+def test_carve_hive_recovers_deleted_usb_key(system_hive, tmp_path):
+    path = tmp_path / "SYSTEM"
+    path.write_bytes(system_hive.read_bytes())
+    reg = Registry.Registry(str(path))
+    device = reg.open(r"ControlSet001\Enum\USBSTOR").subkeys()[0]
+    victim = device.subkeys()[0]
+    victim_offset = victim._nkrecord.offset()
+    parent_offset = device._nkrecord.offset()
+    data = bytearray(path.read_bytes())
+    # Hücreyi serbest bırak (boyut pozitif) ve üst anahtarın alt anahtar listesinden çıkar
+    size = struct.unpack_from("<i", data, victim_offset - 4)[0]
+    struct.pack_into("<i", data, victim_offset - 4, -size)
+    subkey_count = struct.unpack_from("<I", data, parent_offset + 0x14)[0]
+    subkey_list = 0x1000 + struct.unpack_from("<I", data, parent_offset + 0x1C)[0] + 4
+    entry_count = struct.unpack_from("<H", data, subkey_list + 2)[0]
+    entries = [struct.unpack_from("<II", data, subkey_list + 4 + 8 * i) for i in range(entry_count)]
+    entries = [entry for entry in entries if entry[0] + 0x1000 + 4 != victim_offset]
+    struct.pack_into("<H", data, subkey_list + 2, len(entries))
+    for i, entry in enumerate(entries):
+        struct.pack_into("<II", data, subkey_list + 4 + 8 * i, *entry)
+    struct.pack_into("<I", data, parent_offset + 0x14, subkey_count - 1)
+    path.write_bytes(data)
+
+    live = registry_parser.parse_hive_artifacts(path, [registry_parser.USBSTOR_ARTIFACT])
+    live = live[registry_parser.USBSTOR_ARTIFACT.name]
+    assert victim.name() not in set(live.loc[live["Kontrol Seti"] == "ControlSet001", "Seri Numarası"])
+    carved = registry_parser.carve_hive_artifacts(path, [registry_parser.USBSTOR_ARTIFACT], include_values=False)
+    recovered = carved[registry_parser.carved_category(registry_parser.USBSTOR_ARTIFACT.name)]
+    assert list(recovered["Seri Numarası"]) == [victim.name()]
+    assert list(recovered["Cihaz Adı"]) == [device.name()]
+    assert recovered["Kurtarıldı"].all()
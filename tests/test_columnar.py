@@ -0,0 +1,46 @@
+import pandas as pd
+
+import columnar
+
+
+def test_categorize_sorts_categories_and_keeps_values():
+    df = pd.DataFrame({"Kullanıcı": ["carol", "alice", None, "bob", "alice"], "Sayı": [1, 2, 3, 4, 5]})
+    result = columnar.categorize(df.copy(), ("Kullanıcı", "Eksik Sütun"))
+    assert isinstance(result["Kullanıcı"].dtype, pd.CategoricalDtype)
+    assert list(result["Kullanıcı"].cat.categories) == ["alice", "bob", "carol"]
+    assert result["Kullanıcı"].astype(object).where(result["Kullanıcı"].notna(), None).tolist() == \
+        ["carol", "alice", None, "bob", "alice"]
+    assert result["Sayı"].dtype == df["Sayı"].dtype
+
+
+def test_concat_frames_unions_different_category_sets():
+    left = columnar.categorize(pd.DataFrame({"IP": ["10.0.0.2", "10.0.0.1"], "n": [1, 2]}), ("IP",))
+    right = columnar.categorize(pd.DataFrame({"IP": ["10.0.0.3", "10.0.0.1"], "n": [3, 4]}), ("IP",))
+    combined = columnar.concat_frames([left, right])
+    assert isinstance(combined["IP"].dtype, pd.CategoricalDtype)
+    assert list(combined["IP"].cat.categories) == ["10.0.0.1", "10.0.0.2", "10.0.0.3"]
+    assert combined["IP"].astype(str).tolist() == ["10.0.0.2", "10.0.0.1", "10.0.0.3", "10.0.0.1"]
+    assert combined["n"].tolist() == [1, 2, 3, 4]
+    assert list(combined.index) == [0, 1, 2, 3]
+
+
+def test_concat_frames_skips_empty_and_none():
+    full = columnar.categorize(pd.DataFrame({"IP": ["a", "b"], "n": [1, 2]}), ("IP",))
+    empty = pd.DataFrame({"IP": pd.Categorical([]), "n": pd.Series([], dtype="int64")})
+    combined = columnar.concat_frames([empty, None, full, empty])
+    assert combined["IP"].astype(str).tolist() == ["a", "b"]
+    assert list(combined.columns) == ["IP", "n"]
+    # Hepsi boşsa ilk tablonun sütunları korunur
+    assert list(columnar.concat_frames([empty, empty]).columns) == ["IP", "n"]
+
+
+def test_column_buffer_matches_dataframe():
+    rows = [(pd.Timestamp("2024-01-01 10:00", tz="UTC"), "x", 1), (pd.Timestamp("2024-01-02", tz="UTC"), "y", 2),
+            (None, "x", 3)]
+    buffer = columnar.ColumnBuffer(["Zaman", "Ad", "n"], categorical=("Ad",), datetime=("Zaman",), block_size=2)
+    buffer.extend(rows)
+    df = buffer.to_frame()
+    assert len(buffer) == 3
+    assert df["Ad"].astype(str).tolist() == ["x", "y", "x"]
+    assert df["Zaman"].iloc[0] == rows[0][0] and pd.isna(df["Zaman"].iloc[2])
+    assert df["n"].tolist() == [1, 2, 3]
@@ -0,0 +1,32 @@
+import Evtx.Evtx as evtx
+
+import evtx_fast
+import registry_parser
+
+
+def test_decoder_matches_xml_path(security_log):
+    """ Hızlı yolun çözdüğü her kayıt XML yolundaki EventID ve alanlarla aynıdır. """
+    decoder = evtx_fast.LogonRecordDecoder(registry_parser.LOGON_EVENT_IDS,
+                                           registry_parser.LOGON_DATA_FIELDS + (evtx_fast.COMPUTER_FIELD,))
+    decoded_count = 0
+    with evtx.Evtx(str(security_log)) as log:
+        for record in log.records():
+            decoded = decoder.decode(record)
+            assert decoded is not None
+            event_id, data_fields = registry_parser._xml_event_fields(record)
+            assert decoded[0] == event_id
+            if event_id in registry_parser.LOGON_EVENT_IDS:
+                assert decoded[1] == data_fields
+                decoded_count += 1
+            else:
+                assert decoded[1] is None
+    assert decoded_count == 600
+
+
+def test_parse_security_log_matches_xml_only(security_log, monkeypatch):
+    fast = registry_parser.parse_security_log(security_log)
+    # Hızlı yol hiçbir kaydı çözemezse her kayıt XML yolundan geçer
+    monkeypatch.setattr(evtx_fast.LogonRecordDecoder, "decode", lambda self, record: None)
+    slow = registry_parser.parse_security_log(security_log)
+    assert len(fast) == 600
+    assert fast.equals(slow)
@@ -0,0 +1,105 @@
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import batch_cli
+import exporter
+import registry_parser
+import timeline
+from benchmarks import synthetic_evtx, synthetic_hive
+
+
+@pytest.fixture(scope="module")
+def case_folder(tmp_path_factory):
+    """ Security.evtx, SYSTEM, SOFTWARE ve iki kullanıcı profilinden oluşan sentetik vaka. """
+    folder = tmp_path_factory.mktemp("case")
+    synthetic_evtx.write_evtx(folder / "Security.evtx", 500, 300, seed=11)
+    synthetic_hive.build_system_hive(folder / "SYSTEM", 40, seed=1)
+    synthetic_hive.build_software_hive(folder / "SOFTWARE", 60, n_networks=12, seed=2)
+    for i, user in enumerate(("alice", "bob")):
+        (folder / "Users" / user).mkdir(parents=True)
+        synthetic_hive.build_ntuser_hive(folder / "Users" / user / "NTUSER.DAT", 25, seed=3 + i)
+    return folder
+
+
+def _sha256(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _count_rows(path, output_format):
+    """ Yazılmış dosyadaki satır sayısı, dosya okunarak. """
+    if output_format == "parquet":
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    if output_format == "arrow":
+        import pyarrow as pa
+        with pa.OSFile(str(path), "rb") as source:
+            return pa.ipc.open_file(source).read_all().num_rows
+    if output_format == "csv":
+        return len(pd.read_csv(path, encoding="utf-8-sig"))
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for line in f if line.strip())
+
+
+@pytest.mark.parametrize("output_format", list(exporter.FORMATS))
+def test_export_case_manifest_matches_files(case_folder, tmp_path, output_format):
+    # Küçük parçalar: her kategori birden fazla parçada yazılır
+    manifest = exporter.export_case(case_folder, tmp_path, output_format, batch_size=97)
+    assert manifest is not None
+    assert json.loads((tmp_path / exporter.MANIFEST_NAME).read_text(encoding="utf-8"))["categories"] == \
+        manifest["categories"]
+    # Yarım kalan .part dosyası kalmaz
+    assert not list(tmp_path.glob("*.part"))
+
+    categories = {c["name"]: c for c in manifest["categories"]}
+    assert not [c for c in manifest["categories"] if "error" in c]
+    expected = ["Oturum Logları"] + [a.name for a in registry_parser.SYSTEM_ARTIFACTS +
+                                     registry_parser.SOFTWARE_ARTIFACTS + registry_parser.NTUSER_ARTIFACTS]
+    expected.append(registry_parser.USB_HISTORY_CATEGORY)
+    assert set(expected) <= set(categories)
+    for entry in categories.values():
+        path = tmp_path / entry["file"]
+        assert path.suffix == exporter.FORMATS[output_format]
+        assert entry["size"] == path.stat().st_size
+        assert entry["sha256"] == _sha256(path)
+        assert entry["rows"] == _count_rows(path, output_format)
+    assert manifest["total_rows"] == sum(c["rows"] for c in categories.values())
+
+    assert categories["Oturum Logları"]["rows"] == len(registry_parser.parse_security_log(
+        case_folder / "Security.evtx"))
+    for source in manifest["sources"]:
+        assert source["sha256"] == _sha256(Path(source["path"]))
+
+
+def test_export_case_reports_missing_sources(tmp_path):
+    case = tmp_path / "empty_case"
+    case.mkdir()
+    manifest = exporter.export_case(case, tmp_path / "out", "csv")
+    assert manifest["total_rows"] == 0
+    errors = {c["name"]: c.get("error") for c in manifest["categories"]}
+    assert errors.pop(registry_parser.USB_HISTORY_CATEGORY) == "SYSTEM tabloları yok"
+    assert errors and set(errors.values()) == {"eksik dosya"}
+    assert not list((tmp_path / "out").glob("*.csv"))
+
+
+def test_write_batches_cancel_removes_partial_file(tmp_path):
+    class Cancelled:
+        def is_set(self):
+            return True
+    batches = iter([pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})])
+    assert exporter.write_batches(batches, tmp_path / "tablo", "parquet", cancel_event=Cancelled()) is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_batch_cli_streams_logon_table(case_folder, tmp_path):
+    summary = batch_cli.analyze_case(case_folder, tmp_path, "jsonl", build_timeline=True)
+    manifest = exporter.export_case(case_folder, tmp_path / "export", "jsonl")
+    exported = {c["name"]: c["rows"] for c in manifest["categories"]}
+    assert summary["categories"]["Oturum Logları"] == exported["Oturum Logları"]
+    # Zaman çizelgesi için akıtılan parçalar saklanır
+    assert summary["categories"][timeline.TIMELINE_CATEGORY] >= exported["Oturum Logları"]
+    logon_file = tmp_path / (exporter.file_slug("Oturum Logları") + ".jsonl")
+    assert _sha256(logon_file) == _sha256(tmp_path / "export" / logon_file.name)
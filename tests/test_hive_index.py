@@ -0,0 +1,69 @@
+import pytest
+from Registry import Registry
+
+import hive_index
+from benchmarks import synthetic_hive
+
+
+@pytest.fixture
+def software_hive(tmp_path):
+    path = tmp_path / "SOFTWARE"
+    synthetic_hive.build_software_hive(path, 40, n_networks=12, seed=6)
+    return path
+
+
+@pytest.fixture
+def index(tmp_path):
+    return hive_index.HiveIndex(tmp_path / "index.sqlite")
+
+
+def _all_rows(hive_path):
+    return list(hive_index._iter_hive_rows(Registry.Registry(str(hive_path)).root(), {"keys": 0, "values": 0}))
+
+
+def _expected(rows, query):
+    """ Sorgunun anahtar yolu, değer adı ya da veride geçtiği satırlar (büyük/küçük harf duyarsız). """
+    query = query.lower()
+    return [row for row in rows if any(query in (field or "").lower() for field in row[:2] + row[3:4])]
+
+
+@pytest.mark.parametrize("query", ["vendor 3", "WOW6432", "GUID-00001", "app 1", "1.", "Ap", "_", "%"])
+def test_search_matches_substring_scan(software_hive, index, query):
+    """ 3+ karakterde FTS5 trigram, daha kısa sorgularda LIKE taraması aynı sonucu verir. """
+    index.index_hive(software_hive)
+    rows = _all_rows(software_hive)
+    expected = _expected(rows, query)
+    found = index.search(query, limit=len(rows) + 1)
+    assert [tuple(hit) for hit in found[["Anahtar Yolu", "Değer Adı", "Veri"]].itertuples(index=False)] == \
+        [(row[0], row[1], row[3]) for row in expected]
+    assert (found["Hive"] == "SOFTWARE").all()
+    assert len(index.search(query, limit=3)) == min(3, len(expected))
+
+
+def test_unchanged_hive_is_not_reindexed(software_hive, index):
+    keys = index.index_hive(software_hive)
+    assert keys > 0
+    assert index.is_current(software_hive)
+    assert index.index_hive(software_hive) == 0
+    assert index.index_hive(software_hive, force=True) == keys
+    assert len(index.indexed_hives()) == 1
+
+
+def test_changed_hive_replaces_its_table(software_hive, index, tmp_path):
+    index.index_hive(software_hive)
+    assert not index.search("WiFi-11").empty
+    synthetic_hive.build_software_hive(software_hive, 40, n_networks=5, seed=6)
+    assert not index.is_current(software_hive)
+    assert index.index_hive(software_hive) > 0
+    assert index.search("WiFi-11").empty and not index.search("WiFi-4").empty
+    assert len(index.indexed_hives()) == 1
+
+
+def test_search_is_limited_to_given_hives(software_hive, index, tmp_path):
+    other = tmp_path / "other" / "SOFTWARE"
+    other.parent.mkdir()
+    synthetic_hive.build_software_hive(other, 5, seed=1)
+    index.index_hive(software_hive)
+    index.index_hive(other)
+    assert len(index.search("App 3", hive_paths=[other])) == len(_expected(_all_rows(other), "App 3"))
+    assert index.search("   ").empty
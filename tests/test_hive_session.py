@@ -0,0 +1,61 @@
+import pytest
+from Registry import Registry
+
+import registry_parser
+from benchmarks import synthetic_hive
+
+
+@pytest.fixture(scope="module")
+def software_hive(tmp_path_factory):
+    path = tmp_path_factory.mktemp("session") / "SOFTWARE"
+    synthetic_hive.build_software_hive(path, 30, n_networks=10, seed=2)
+    return path
+
+
+@pytest.fixture
+def opened_hives(monkeypatch):
+    """ Registry.Registry ile açılan hive yolları (her açılış bir kez). """
+    opened = []
+    original = Registry.Registry
+
+    def counting(path, *args, **kwargs):
+        opened.append(path)
+        return original(path, *args, **kwargs)
+    monkeypatch.setattr(Registry, "Registry", counting)
+    return opened
+
+
+def test_parsers_share_one_open_hive(software_hive, opened_hives):
+    with registry_parser.HiveSession() as session:
+        programs = registry_parser.parse_installed_programs(software_hive, session=session)
+        networks = registry_parser.parse_network_list(software_hive, session=session)
+        assert len(opened_hives) == 1
+    # Oturumsuz çağrı her seferinde hive'ı yeniden açar; sonuç aynıdır
+    assert programs.equals(registry_parser.parse_installed_programs(software_hive))
+    assert networks.equals(registry_parser.parse_network_list(software_hive))
+    assert len(opened_hives) == 3
+
+
+def test_open_key_is_cached_case_insensitively(software_hive, opened_hives):
+    session = registry_parser.HiveSession()
+    key = session.open_key(software_hive, r"Microsoft\Windows\CurrentVersion\Uninstall")
+    assert session.open_key(str(software_hive), r"MICROSOFT\windows\CurrentVersion\Uninstall") is key
+    for _ in range(2): # Bulunamama durumu da önbellekten yeniden fırlatılır
+        with pytest.raises(Registry.RegistryKeyNotFoundException):
+            session.open_key(software_hive, r"Microsoft\Yok")
+    assert len(opened_hives) == 1
+    session.close()
+    assert session.open_key(software_hive, r"Microsoft\Windows\CurrentVersion\Uninstall") is not key
+    assert len(opened_hives) == 2
+
+
+def test_unreadable_hive_error_is_cached(tmp_path, opened_hives):
+    path = tmp_path / "SOFTWARE"
+    path.write_bytes(b"bozuk" * 100)
+    session = registry_parser.HiveSession()
+    for _ in range(2):
+        with pytest.raises(Exception):
+            session.hive(path)
+    assert len(opened_hives) == 1
+    assert registry_parser.parse_installed_programs(path, session=session) is None
+    assert len(opened_hives) == 1
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+import evtx_checkpoint
+import parser_metrics
+import registry_parser
+from benchmarks import synthetic_evtx
+
+
+@pytest.fixture(scope="module")
+def full_log(tmp_path_factory):
+    """ 6 chunk'lık log; kısaltılmış ve sarılmış kopyaları bundan üretilir. """
+    path = tmp_path_factory.mktemp("incremental") / "full.evtx"
+    synthetic_evtx.write_evtx(path, 1200, 800, seed=5)
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    return evtx_checkpoint.EvtxCheckpointStore(tmp_path / "checkpoints")
+
+
+def _incremental(path, store):
+    """ (DataFrame, tam tarama yapıldı mı, taranan kayıt sayısı) """
+    metrics = parser_metrics.MetricsCollector()
+    df = registry_parser.parse_security_log_incremental(path, store, metrics=metrics)
+    run = metrics.runs[-1]
+    return df, bool(run.counters["full_scan"]), run.records_scanned
+
+
+def _reset(df):
+    return df.reset_index(drop=True)
+
+
+def test_resume_reads_only_new_records(full_log, store, tmp_path):
+    early = tmp_path / "early.evtx"
+    synthetic_evtx.rewrite_chunks(full_log, early, [0, 1, 2, 3])
+    first, full_scan, _ = _incremental(early, store)
+    assert full_scan
+    assert _reset(first).equals(_reset(registry_parser.parse_security_log(early)))
+
+    # Aynı log büyümüş: yalnızca kontrol noktasından sonraki kayıtlar okunur
+    resumed, full_scan, scanned = _incremental(full_log, store)
+    assert not full_scan
+    assert 0 < scanned < 2000
+    assert _reset(resumed).equals(_reset(registry_parser.parse_security_log(full_log)))
+
+    # Değişmeyen log yeniden okunmaz
+    again, full_scan, scanned = _incremental(full_log, store)
+    assert not full_scan and scanned == 0
+    assert _reset(again).equals(_reset(resumed))
+
+
+def test_wrapped_log_resumes(full_log, store, tmp_path):
+    early = tmp_path / "early.evtx"
+    wrapped = tmp_path / "wrapped.evtx"
+    synthetic_evtx.rewrite_chunks(full_log, early, [0, 1, 2, 3])
+    # İlk iki chunk'ın üzerine 4 ve 5 yazılmış; son işlenen kayıt (chunk 3) hâlâ logda
+    synthetic_evtx.rewrite_chunks(full_log, wrapped, [4, 5, 2, 3])
+    _incremental(early, store)
+    resumed, full_scan, _ = _incremental(wrapped, store)
+    assert not full_scan
+    # Sarılmada kaybolan olaylar önceki sonuçtan gelir: tam logun sonucuyla aynıdır
+    assert _reset(resumed).equals(_reset(registry_parser.parse_security_log(full_log)))
+
+
+def test_overwritten_checkpoint_record_falls_back_to_full_scan(full_log, store, tmp_path):
+    early = tmp_path / "early.evtx"
+    wrapped = tmp_path / "wrapped.evtx"
+    synthetic_evtx.rewrite_chunks(full_log, early, [0, 1])
+    # Son işlenen kaydın chunk'ı (1) sarılmada ezilmiş: aradaki olaylar bilinemez
+    synthetic_evtx.rewrite_chunks(full_log, wrapped, [4, 5, 2, 3])
+    _incremental(early, store)
+    df, full_scan, _ = _incremental(wrapped, store)
+    assert full_scan
+    # Tam tarama kayıtları kayıt numarası sırasıyla okur: sarılmamış eşdeğeriyle aynıdır
+    unwrapped = tmp_path / "unwrapped.evtx"
+    synthetic_evtx.rewrite_chunks(full_log, unwrapped, [2, 3, 4, 5])
+    assert _reset(df).equals(_reset(registry_parser.parse_security_log(unwrapped)))
+
+
+def test_different_log_invalidates_checkpoint(full_log, store, tmp_path):
+    other = tmp_path / "other.evtx"
+    # Aynı bilgisayar adı (aynı kontrol noktası anahtarı), farklı kayıtlar
+    synthetic_evtx.write_evtx(other, 1200, 800, seed=99)
+    _incremental(full_log, store)
+    df, full_scan, _ = _incremental(other, store)
+    assert full_scan
+    assert _reset(df).equals(_reset(registry_parser.parse_security_log(other)))
+
+
+def test_torn_checkpoint_is_ignored(full_log, store):
+    first, _, _ = _incremental(full_log, store)
+    # Sonuç ile kontrol noktası farklı yazımlardan kalmış gibi: satır sayısı uyuşmaz
+    checkpoint_path, = store.directory.glob("*.json")
+    checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    checkpoint["rows"] += 1
+    checkpoint_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+    df, full_scan, _ = _incremental(full_log, store)
+    assert full_scan
+    assert _reset(df).equals(_reset(first))
@@ -0,0 +1,113 @@
+import pandas as pd
+import pytest
+
+import logon_analytics
+import registry_parser
+
+SUCCESS = registry_parser.EVENT_ID_DESCRIPTIONS[4624]
+FAILURE = registry_parser.EVENT_ID_DESCRIPTIONS[4625]
+LOGOFF = registry_parser.EVENT_ID_DESCRIPTIONS[4634]
+NETWORK = registry_parser.LOGON_TYPE_DESCRIPTIONS["3"]
+RDP = registry_parser.LOGON_TYPE_DESCRIPTIONS["10"]
+START = pd.Timestamp("2026-03-01 08:00:00", tz="UTC")
+
+
+def _events(rows):
+    """ (saniye, olay, kullanıcı, oturum türü, IP) satırlarından parser biçiminde tablo. """
+    df = pd.DataFrame(rows, columns=["seconds", "Olay", "Kullanıcı Adı", "Oturum Türü", "Kaynak IP"])
+    df.insert(0, "Timestamp", START + pd.to_timedelta(df.pop("seconds"), unit="s"))
+    return df[registry_parser.LOGON_COLUMNS]
+
+
+def _failures(ip, seconds, users=("admin",)):
+    return [(s, FAILURE, users[i % len(users)], NETWORK, ip) for i, s in enumerate(seconds)]
+
+
+def _in_batches(df, size):
+    aggregator = logon_analytics.LogonAggregator()
+    for _ in aggregator.observe(df.iloc[i:i + size] for i in range(0, len(df), size)):
+        pass
+    return aggregator.frames()
+
+
+@pytest.fixture
+def burst_events():
+    rows = []
+    # 10.0.0.1: 12 deneme 20 sn arayla -> tek patlama; 10 dk ara sonrası 10 deneme -> ikinci patlama
+    rows += _failures("10.0.0.1", range(0, 240, 20), users=("admin", "root", "test"))
+    rows += _failures("10.0.0.1", range(840, 1040, 20))
+    # 10.0.0.2: pencerede yalnızca 9 deneme -> patlama yok
+    rows += _failures("10.0.0.2", range(0, 90, 10))
+    # 10.0.0.3: 10 deneme 40 sn arayla; hiçbir 5 dk pencerede 10'a ulaşmaz
+    rows += _failures("10.0.0.3", range(0, 400, 40))
+    # Patlamaları etkilemeyen başarılı oturumlar
+    rows += [(30, SUCCESS, "admin", NETWORK, "10.0.0.1"), (60, SUCCESS, "bob", RDP, "10.0.0.2")]
+    return _events(sorted(rows, key=lambda row: row[0]))
+
+
+def test_failure_bursts_use_sliding_window(burst_events):
+    bursts = logon_analytics.analyze_logon_frame(burst_events)[logon_analytics.BURST_CATEGORY]
+    assert list(bursts.columns) == logon_analytics.BURST_COLUMNS
+    assert bursts["Kaynak IP"].tolist() == ["10.0.0.1", "10.0.0.1"]
+    first, second = bursts.to_dict("records")
+    assert first["Başlangıç (UTC)"] == START
+    assert first["Bitiş (UTC)"] == START + pd.Timedelta(seconds=220)
+    assert (first["Başarısız Deneme"], first["En Yoğun Pencere"]) == (12, 12)
+    assert first["Hedef Kullanıcı Sayısı"] == 3
+    assert first["Hedef Kullanıcılar"] == "admin, root, test"
+    assert second["Başlangıç (UTC)"] == START + pd.Timedelta(seconds=840)
+    assert second["Başarısız Deneme"] == 10
+
+
+def test_burst_closes_only_after_window_long_gap():
+    # 5 dk'dan kısa aralarla gelen denemeler açık patlamayı uzatır
+    seconds = list(range(0, 100, 10)) + [100 + 280 * i for i in range(1, 4)]
+    bursts = logon_analytics.analyze_logon_frame(_events(_failures("10.9.9.9", seconds)))[
+        logon_analytics.BURST_CATEGORY]
+    assert len(bursts) == 1
+    assert bursts["Başarısız Deneme"].iloc[0] == len(seconds)
+    assert bursts["Bitiş (UTC)"].iloc[0] == START + pd.Timedelta(seconds=seconds[-1])
+    assert bursts["En Yoğun Pencere"].iloc[0] == 10
+
+
+def test_streaming_matches_single_frame(burst_events):
+    whole = logon_analytics.analyze_logon_frame(burst_events)
+    for size in (1, 7, 25):
+        streamed = _in_batches(burst_events, size)
+        for name in logon_analytics.ANALYTICS_CATEGORIES:
+            pd.testing.assert_frame_equal(streamed[name], whole[name], check_categorical=False)
+
+
+def test_first_seen_source_ips_and_rdp():
+    events = _events([
+        (0, SUCCESS, "alice", NETWORK, "192.168.1.5"),
+        (10, FAILURE, "bob", RDP, "192.168.1.5"),
+        (20, SUCCESS, "bob", RDP, "192.168.1.5"),
+        (30, SUCCESS, "carol", RDP, "192.168.1.5"),
+        (40, LOGOFF, "bob", RDP, "192.168.1.5"),
+        (50, FAILURE, "dave", RDP, "172.16.0.9"),
+        (60, SUCCESS, "system", NETWORK, "-"),
+        (70, SUCCESS, "local", RDP, "127.0.0.1"),
+    ])
+    # Parçalar arasında da ilk görülme korunur
+    sources = _in_batches(events, 3)[logon_analytics.SOURCE_IP_CATEGORY]
+    assert list(sources.columns) == logon_analytics.SOURCE_IP_COLUMNS
+    assert sources["Kaynak IP"].tolist() == ["192.168.1.5", "172.16.0.9"]
+    seen, failed_only = sources.to_dict("records")
+    assert seen["İlk Görülme (UTC)"] == START
+    assert seen["Son Görülme (UTC)"] == START + pd.Timedelta(seconds=40)
+    assert (seen["İlk Kullanıcı"], seen["İlk Oturum Türü"]) == ("alice", NETWORK)
+    assert (seen["Başarılı Oturum"], seen["Başarısız Deneme"], seen["RDP Oturumu"]) == (3, 1, 2)
+    assert seen["İlk RDP Oturumu (UTC)"] == START + pd.Timedelta(seconds=20)
+    assert seen["İlk RDP Kullanıcısı"] == "bob"
+    # Başarısız RDP denemesi RDP oturumu sayılmaz
+    assert failed_only["RDP Oturumu"] == 0
+    assert pd.isna(failed_only["İlk RDP Oturumu (UTC)"])
+    assert pd.isna(failed_only["İlk RDP Kullanıcısı"])
+
+
+def test_hourly_buckets_count_event_kinds(burst_events):
+    buckets = logon_analytics.analyze_logon_frame(burst_events)[logon_analytics.BUCKET_CATEGORY]
+    assert buckets["Başarısız Deneme"].sum() == (burst_events["Olay"] == FAILURE).sum()
+    assert buckets["Başarılı Oturum"].sum() == 2
+    assert (buckets["Zaman Dilimi (UTC)"] == START).all()
@@ -0,0 +1,50 @@
+import pytest
+
+import registry_parser
+from benchmarks import synthetic_evtx
+
+
+@pytest.fixture(scope="module")
+def full_log(tmp_path_factory):
+    path = tmp_path_factory.mktemp("merge") / "full.evtx"
+    synthetic_evtx.write_evtx(path, 1200, 800, seed=11)
+    return path
+
+
+def test_overlapping_archive_and_live_log_merge_without_duplicates(full_log, tmp_path):
+    archive = tmp_path / "Archive-Security-2024-01-01-00-00-00-000.evtx"
+    live = tmp_path / "Security.evtx"
+    # Arşiv ve canlı log bir chunk'ı (aynı kayıtları) paylaşır
+    synthetic_evtx.rewrite_chunks(full_log, archive, [0, 1, 2, 3])
+    synthetic_evtx.rewrite_chunks(full_log, live, [3, 4, 5])
+    stats = {}
+    rows = list(registry_parser.iter_logon_events([live, archive], stats=stats))
+    merged = registry_parser.parse_security_log([live, archive])
+    expected = registry_parser.parse_security_log(full_log)
+    assert stats["duplicates"] > 0
+    assert len(rows) == len(expected)
+    assert merged.reset_index(drop=True).equals(expected.reset_index(drop=True))
+    assert merged["Timestamp"].is_monotonic_increasing
+
+
+def test_same_record_ids_from_different_computers_are_kept(tmp_path):
+    first = tmp_path / "dc01.evtx"
+    second = tmp_path / "dc02.evtx"
+    # Aynı tohum: kayıt numaraları ve zamanlar aynı, yalnızca bilgisayar adı farklı
+    synthetic_evtx.write_evtx(first, 300, 100, seed=3, computer="DC01.corp.local")
+    synthetic_evtx.write_evtx(second, 300, 100, seed=3, computer="DC02.corp.local")
+    merged = registry_parser.parse_security_log([first, second])
+    assert len(merged) == 600
+    assert merged["Timestamp"].is_monotonic_increasing
+
+
+def test_discover_security_logs_skips_user_profiles(tmp_path):
+    (tmp_path / "Security.evtx").write_bytes(b"")
+    (tmp_path / "Archive-Security-2024-01-01-00-00-00-000.evtx").write_bytes(b"")
+    (tmp_path / "DC02").mkdir()
+    (tmp_path / "DC02" / "security.EVTX").write_bytes(b"")
+    (tmp_path / "Users" / "ali").mkdir(parents=True)
+    (tmp_path / "Users" / "ali" / "Security.evtx").write_bytes(b"")
+    found = {path.relative_to(tmp_path).as_posix().lower()
+             for path in registry_parser.discover_security_logs(tmp_path)}
+    assert found == {"security.evtx", "archive-security-2024-01-01-00-00-00-000.evtx", "dc02/security.evtx"}
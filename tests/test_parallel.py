@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+import registry_parser
+from benchmarks import synthetic_evtx
+
+
+@pytest.fixture(scope="module")
+def large_log(tmp_path_factory):
+    """ Çok chunk'lık log; 1001 ve 137 satırlık limitler bir chunk aralığının ortasına düşer. """
+    path = tmp_path_factory.mktemp("parallel") / "Security.evtx"
+    synthetic_evtx.write_evtx(path, 1500, 1000, seed=13)
+    return path
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+@pytest.mark.parametrize("limit", [None, 1001, 137])
+def test_parallel_matches_serial(large_log, workers, limit):
+    serial = registry_parser.parse_security_log(large_log, workers=1, limit=limit)
+    parallel = registry_parser.parse_security_log(large_log, workers=workers, limit=limit)
+    assert len(serial) == (limit or 1500)
+    pd.testing.assert_frame_equal(parallel, serial)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+import timeline
+
+
+def test_merge_sorted_runs_matches_stable_sort():
+    rng = np.random.default_rng(4)
+    runs, times, offset = [], [], 0
+    for size in (0, 5, 130, 1, 64, 0, 17):
+        run_times = np.sort(rng.integers(0, 50, size)).astype(np.int64)
+        runs.append((run_times, np.arange(offset, offset + size)))
+        times.append(run_times)
+        offset += size
+    merged = timeline.merge_sorted_runs(runs)
+    # Eşit zamanlarda önceki koşunun satırı önce gelir (kararlı birleştirme)
+    assert merged.tolist() == np.argsort(np.concatenate(times), kind="stable").tolist()
+    assert timeline.merge_sorted_runs([]).tolist() == []
+
+
+def _frames():
+    logons = pd.DataFrame({
+        "Timestamp": pd.to_datetime(["2024-01-01 10:05", "2024-01-01 10:00", "2024-01-01 12:00"], utc=True),
+        "Olay": ["(4624) Başarılı Oturum Açma", "(4625) Başarısız Oturum Denemesi", "(4624) Başarılı Oturum Açma"],
+        "Kullanıcı Adı": ["ali", "ali", None],
+        "Oturum Türü": ["(3) Ağ", "(3) Ağ", "(2) İnteraktif"],
+        "Kaynak IP": ["10.0.0.1", "10.0.0.1", "-"],
+    })
+    programs = pd.DataFrame({
+        "Program Adı": ["Araç", "Bozuk"], "Yayıncı": ["Firma", "N/A"], "Sürüm": ["1.0", "2.0"],
+        "Kurulum Tarihi": ["2024-01-01", "N/A"],
+    })
+    return {"Oturum Logları": logons, "Kurulu Programlar": programs, "Ağ Geçmişi": None}
+
+
+def test_from_frames_merges_categories_in_time_order():
+    events = timeline.Timeline.from_frames(_frames())
+    frame = events.frame
+    assert len(events) == 4 # Zamanı çözülemeyen kurulum satırı atlanır
+    assert frame.index.is_monotonic_increasing
+    assert list(frame["Kaynak"].astype(str)) == ["Kurulu Programlar", "Oturum Logları", "Oturum Logları",
+                                                 "Oturum Logları"]
+    assert all(isinstance(frame[column].dtype, pd.CategoricalDtype) for column in timeline.TIMELINE_COLUMNS[1:])
+    assert list(frame["Açıklama"].astype(str)) == [
+        "Araç 1.0 (Firma)", "Kullanıcı: ali, Tür: (3) Ağ, IP: 10.0.0.1", "Kullanıcı: ali, Tür: (3) Ağ, IP: 10.0.0.1",
+        "Kullanıcı: , Tür: (2) İnteraktif, IP: -"]
+    assert list(frame["Olay Türü"].astype(str))[:2] == ["Program kurulumu", "(4625) Başarısız Oturum Denemesi"]
+    assert timeline.Timeline.from_frames({}).frame.empty
+
+
+def test_range_around_and_nearest():
+    events = timeline.Timeline.from_frames(_frames())
+    assert len(events.range("2024-01-01 10:00", "2024-01-01 10:05")) == 2 # Uçlar dahil
+    assert len(events.range(start="2024-01-01 10:01")) == 2
+    assert len(events.range(end=pd.Timestamp("2024-01-01 09:59", tz="UTC"))) == 1
+    around = events.around("2024-01-01 10:02", before=pd.Timedelta(minutes=2), after=pd.Timedelta(minutes=3))
+    assert list(around["Zaman (UTC)"].dt.strftime("%H:%M")) == ["10:00", "10:05"]
+    assert list(events.nearest("2024-01-01 10:03", count=1)["Zaman (UTC)"].dt.strftime("%H:%M")) == \
+        ["10:00", "10:05"]
+    assert len(events.nearest("2030-01-01", count=2)) == 2
@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, UTC
+
+import pandas as pd
+import pytest
+
+import registry_parser
+from benchmarks.synthetic_hive import HiveBuilder, REG_BINARY
+
+DISK_CLASS = "{53f56307-b6bf-11d0-94f2-00a0c91efb8b}"
+CRUZER = "Disk&Ven_SanDisk&Prod_Cruzer&Rev_1.00"
+KINGSTON = "Disk&Ven_Kingston&Prod_DT50&Rev_1.00"
+FIRST = datetime(2025, 5, 1, 9, 0, tzinfo=UTC)
+
+
+def _device_path(device, serial):
+    return "_??_USBSTOR#%s#%s#%s" % (device, serial, DISK_CLASS)
+
+
+def _add_device(hive, control_set, device, serial, vid_pid, timestamp):
+    hive.key(control_set + r"\Enum\USBSTOR\%s\%s" % (device, serial), timestamp)
+    key = control_set + r"\Enum\USB\%s\%s" % (vid_pid, serial.split("&")[0])
+    hive.key(key, timestamp + timedelta(minutes=2))
+    hive.value(key, "DeviceDesc", "USB Mass Storage Device")
+    hive.value(key, "FriendlyName", device.split("&")[2][5:] + " USB")
+
+
+def _select(hive, current, last_known_good):
+    for name, number in (("Current", current), ("Default", current), ("LastKnownGood", last_known_good)):
+        hive.value("Select", name, number)
+
+
+@pytest.fixture
+def two_set_system(tmp_path):
+    """ Aynı Cruzer aygıtı ControlSet001 ve ControlSet002'de; geçerli set 001. """
+    hive = HiveBuilder("SYSTEM")
+    _add_device(hive, "ControlSet001", CRUZER, "AA11BB22&0", "VID_0781&PID_5567", FIRST + timedelta(days=3))
+    _add_device(hive, "ControlSet002", CRUZER, "AA11BB22&0", "VID_0781&PID_5567", FIRST)
+    # CurrentControlSet çevrimdışı hive'da bir bağlantı değil; okunmaz
+    hive.key(r"CurrentControlSet\Enum\USBSTOR\%s\AA11BB22&0" % CRUZER, FIRST)
+    _select(hive, 1, 2)
+    path = tmp_path / "SYSTEM"
+    hive.write(path)
+    return path
+
+
+def test_device_in_two_control_sets_is_listed_once(two_set_system):
+    history = registry_parser.parse_usb_history(two_set_system)
+    assert list(history.columns) == registry_parser.USB_HISTORY_COLUMNS
+    assert len(history) == 1
+    device = history.iloc[0]
+    assert device["Seri Numarası"] == "AA11BB22&0"
+    assert device["Cihaz Adı"] == CRUZER
+    assert device["Kontrol Setleri"] == "ControlSet001, ControlSet002"
+    assert bool(device["Geçerli Kontrol Setinde"])
+    # Aynı aygıtın en yeni kaydı kalır
+    assert device["İlk Takılma Zamanı"] == pd.Timestamp(FIRST + timedelta(days=3))
+    assert device["VID_PID"] == "VID_0781&PID_5567"
+
+
+@pytest.mark.parametrize("current", [1, 2])
+def test_current_control_set_flag(tmp_path, current):
+    hive = HiveBuilder("SYSTEM")
+    _add_device(hive, "ControlSet001", CRUZER, "AA11BB22&0", "VID_0781&PID_5567", FIRST)
+    _add_device(hive, "ControlSet002", CRUZER, "AA11BB22&0", "VID_0781&PID_5567", FIRST)
+    _add_device(hive, "ControlSet002", KINGSTON, "KK99&0", "VID_0951&PID_1666", FIRST + timedelta(days=1))
+    _select(hive, current, 3 - current)
+    path = tmp_path / "SYSTEM"
+    hive.write(path)
+    history = registry_parser.parse_usb_history(path).set_index("Seri Numarası")
+    assert history.loc["KK99&0", "Kontrol Setleri"] == "ControlSet002"
+    assert history.loc["KK99&0", "Geçerli Kontrol Setinde"] == (current == 2)
+    assert history.loc["AA11BB22&0", "Geçerli Kontrol Setinde"]
+
+
+@pytest.fixture
+def joined_case(tmp_path):
+    """
+    Cruzer: iki sette USBSTOR, MountedDevices'ta E:, G: ve bir birim, WPD'de büyük
+    harfli yol. Eski bir aygıt yalnızca MountedDevices ve WPD'de kalmış.
+    """
+    system = HiveBuilder("SYSTEM")
+    _add_device(system, "ControlSet001", CRUZER, "AA11BB22&0", "VID_0781&PID_5567", FIRST + timedelta(days=3))
+    _add_device(system, "ControlSet002", CRUZER, "AA11BB22&0", "VID_0781&PID_5567", FIRST)
+    cruzer = _device_path(CRUZER, "AA11BB22&0").encode("utf-16le")
+    system.value("MountedDevices", "\\DosDevices\\E:", cruzer, REG_BINARY)
+    system.value("MountedDevices", "\\DosDevices\\G:", cruzer, REG_BINARY)
+    system.value("MountedDevices", "\\??\\Volume{0000aaaa-0000-11ef-a000-000000000000}", cruzer, REG_BINARY)
+    system.value("MountedDevices", "\\DosDevices\\F:", _device_path(KINGSTON, "OLD77&0").encode("utf-16le"),
+                 REG_BINARY)
+    system.value("MountedDevices", "\\DosDevices\\C:", bytes(12), REG_BINARY)
+    _select(system, 1, 2)
+    software = HiveBuilder("SOFTWARE")
+    for device, serial, name in ((CRUZER, "AA11BB22&0", "CRUZER"), (KINGSTON, "OLD77&0", "BACKUP")):
+        key = r"Microsoft\Windows Portable Devices\Devices\SWD#WPDBUSENUM#" + _device_path(device, serial).upper()
+        software.key(key)
+        software.value(key, "FriendlyName", name)
+    system.write(tmp_path / "SYSTEM")
+    software.write(tmp_path / "SOFTWARE")
+    return tmp_path
+
+
+def test_sources_are_joined_by_serial(joined_case):
+    history = registry_parser.parse_usb_history(joined_case / "SYSTEM", joined_case / "SOFTWARE")
+    assert len(history) == 2
+    # En yeni takılan üstte; USBSTOR kaydı olmayan aygıt sonda
+    cruzer, old = history.to_dict("records")
+    assert cruzer["Seri Numarası"] == "AA11BB22&0"
+    assert (cruzer["Sürücü Harfleri"], cruzer["Birimler"]) == ("E:, G:", "{0000aaaa-0000-11ef-a000-000000000000}")
+    assert cruzer["WPD Adı"] == "CRUZER"
+    assert cruzer["Kolay Ad"] == "Cruzer USB"
+    assert cruzer["Kontrol Setleri"] == "ControlSet001, ControlSet002"
+    # Seri ve ad MountedDevices'tan gelir; USBSTOR'a özgü alanlar boş kalır
+    assert (old["Seri Numarası"], old["Cihaz Adı"]) == ("OLD77&0", KINGSTON)
+    assert (old["Sürücü Harfleri"], old["WPD Adı"]) == ("F:", "BACKUP")
+    assert pd.isna(old["İlk Takılma Zamanı"]) and pd.isna(old["Kontrol Setleri"])
+
+
+def test_build_device_history_skips_missing_sources(joined_case):
+    frames = registry_parser.parse_hive_artifacts(joined_case / "SYSTEM", registry_parser.SYSTEM_ARTIFACTS)
+    frames[registry_parser.MOUNTED_DEVICES_ARTIFACT.name] = None
+    frames[registry_parser.CONTROL_SET_ARTIFACT.name] = None
+    history = registry_parser.build_device_history(frames)
+    assert history["Seri Numarası"].tolist() == ["AA11BB22&0"]
+    assert history["Sürücü Harfleri"].isna().all()
+    # Select okunamazsa geçerli set bilinmez
+    assert history["Geçerli Kontrol Setinde"].isna().all()
+    empty = registry_parser.build_device_history({registry_parser.USBSTOR_ARTIFACT.name: None})
+    assert list(empty.columns) == registry_parser.USB_HISTORY_COLUMNS and empty.empty
+
+
+def test_parse_usb_devices_passes_unreadable_hive_through(tmp_path):
+    broken = tmp_path / "SYSTEM"
+    broken.write_bytes(b"not a hive")
+    assert registry_parser.parse_usb_devices(broken) == (None, None)
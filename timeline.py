@@ -0,0 +1,266 @@
+import numpy as np
+import pandas as pd
+
+import columnar
+import logon_analytics
+import registry_parser
+
+
+TIMELINE_CATEGORY = "Zaman Çizelgesi"
+TIMELINE_COLUMNS = ["Zaman (UTC)", "Kaynak", "Olay Türü", "Açıklama"]
+STR_DTYPE = pd.Index([], dtype=str).dtype
+
+
+class TimelineSource:
+    """
+    Bir kategorinin zaman çizelgesine nasıl katılacağı.
+
+    category:    data_frames içindeki kategori adı
+    time_column: olayın zamanı olan sütun
+    event_type:  sabit olay türü metni ya da df -> Series fonksiyonu
+    describe:    df -> Series; satır başına kısa açıklama (vektörel). Büyük
+                 tablolarda _combined ile kategorik üretilir.
+    """
+    def __init__(self, category, time_column, event_type, describe):
+        self.category = category
+        self.time_column = time_column
+        self.event_type = event_type
+        self.describe = describe
+
+    def __repr__(self):
+        return f"TimelineSource({self.category!r})"
+
+
+def _text(df, column):
+    return df[column].astype("string").fillna("")
+
+
+def _combined(template, *columns):
+    """
+    template.format(*değerler) açıklamasını kategorik olarak üreten describe:
+    metin her farklı değer birleşimi için bir kez kurulur, satırlar ona kodla
+    başvurur. Oturum logları gibi milyonlarca satırlı ama az sayıda farklı
+    birleşimli tablolarda satır başına metin oluşmaz. Eksik değerler boş yazılır.
+    """
+    def run(df):
+        key = np.zeros(len(df), dtype=np.int64)
+        labels = []
+        for column in columns:
+            values = df[column].array
+            if not isinstance(values, pd.Categorical):
+                values = pd.Categorical(values)
+            key = key * (len(values.categories) + 1) + (values.codes.astype(np.int64) + 1)
+            labels.append([""] + [str(value) for value in values.categories])
+        codes, unique_keys = pd.factorize(key, sort=True)
+        texts = []
+        for unique_key in unique_keys:
+            parts = []
+            for column_labels in reversed(labels):
+                unique_key, code = divmod(int(unique_key), len(column_labels))
+                parts.append(column_labels[code])
+            texts.append(template.format(*reversed(parts)))
+        # Farklı birleşimler aynı metni verebilir (ör. eksik değer ile boş metin)
+        text_codes, categories = pd.factorize(pd.Index(texts, dtype=str), sort=True)
+        values = pd.Categorical.from_codes(text_codes[codes] if len(codes) else codes, categories=categories)
+        return pd.Series(values, index=df.index)
+    return run
+
+
+def _with_profile(describe):
+    """ Çok kullanıcılı tablolarda açıklamanın başına kullanıcı profilini ekler. """
+    def run(df):
+        text = describe(df)
+        if registry_parser.USER_PROFILE_COLUMN in df.columns:
+            text = "[" + _text(df, registry_parser.USER_PROFILE_COLUMN) + "] " + text
+        return text
+    return run
+
+
+TIMELINE_SOURCES = [
+    TimelineSource(
+        "Oturum Logları", "Timestamp", lambda df: df["Olay"],
+        _combined("Kullanıcı: {}, Tür: {}, IP: {}", "Kullanıcı Adı", "Oturum Türü", "Kaynak IP")),
+    TimelineSource(
+        logon_analytics.BURST_CATEGORY, "Başlangıç (UTC)", "Başarısız oturum patlaması",
+        lambda df: ("IP: " + _text(df, "Kaynak IP") + ", " + _text(df, "Başarısız Deneme") + " deneme, hedef: "
+                    + _text(df, "Hedef Kullanıcılar"))),
+    TimelineSource(
+        logon_analytics.SOURCE_IP_CATEGORY, "İlk Görülme (UTC)", "Kaynak IP ilk görülme",
+        lambda df: ("IP: " + _text(df, "Kaynak IP") + ", Kullanıcı: " + _text(df, "İlk Kullanıcı") + ", Tür: "
+                    + _text(df, "İlk Oturum Türü"))),
+    TimelineSource(
+        "USB Depolama Aygıtları", "İlk Takılma Zamanı", "USB depolama ilk takılma",
+        lambda df: _text(df, "Cihaz Adı") + " / " + _text(df, "Seri Numarası")),
+    TimelineSource(
+        "Tüm USB Aygıtları", "Son Güncelleme", "USB aygıtı son güncelleme",
+        lambda df: (_text(df, "Kolay Ad") + " (" + _text(df, "Açıklama") + ") " + _text(df, "VID_PID")
+                    + " / " + _text(df, "Instance ID / Seri No"))),
+    TimelineSource(
+        "Taşınabilir Aygıtlar (WPD)", "Son Güncelleme", "Taşınabilir aygıt son güncelleme",
+        lambda df: _text(df, "Kolay Ad") + " / " + _text(df, "Cihaz Adı") + " / " + _text(df, "Seri Numarası")),
+    TimelineSource(
+        "Kurulu Programlar", "Kurulum Tarihi", "Program kurulumu",
+        lambda df: _text(df, "Program Adı") + " " + _text(df, "Sürüm") + " (" + _text(df, "Yayıncı") + ")"),
+    TimelineSource(
+        "Çalıştırılan Programlar (UserAssist)", "Son Çalıştırma (UTC)", "Program son çalıştırma",
+        _with_profile(lambda df: (_text(df, "Program Adı (Deşifre Edilmiş)") + " (çalıştırma: "
+                                  + _text(df, "Çalıştırma Sayısı") + ")"))),
+    TimelineSource(
+        "Ağ Geçmişi", "İlk Bağlantı (UTC)", "Ağa ilk bağlantı",
+        lambda df: _text(df, "Ağ Adı (SSID)") + " " + _text(df, "Profil Yolu (GUID)")),
+]
+# Kurtarılan (carving) kategoriler canlı kategorilerle aynı sütunları taşır; "Kaynak" sütunu onları ayırır
+_CARVED_SOURCES = {"Oturum Logları"} | {artifact.name for artifact in registry_parser.CARVE_ARTIFACTS}
+TIMELINE_SOURCES += [
+    TimelineSource(registry_parser.carved_category(source.category), source.time_column, source.event_type,
+                   source.describe)
+    for source in TIMELINE_SOURCES if source.category in _CARVED_SOURCES
+]
+
+
+def _to_utc_ns(values):
+    """ Zaman sütununu datetime64[ns, UTC]'ye çevirir; saat dilimsiz değerler UTC kabul edilir. """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return pd.to_datetime(values, utc=True).dt.as_unit("ns")
+    # Metin sütunları (ör. Kurulum Tarihi 'YYYY-MM-DD' ya da 'N/A')
+    return pd.to_datetime(values, utc=True, errors="coerce", format="mixed").dt.as_unit("ns")
+
+
+def _categorical(values, length):
+    """
+    Sabit metni ya da Series'i 'category' dtype'ına çevirir (kategorik Series
+    kopyalanmaz). Kategoriler str dtype'ındadır; union_categoricals farklı
+    kategori dtype'larını birleştiremez.
+    """
+    if isinstance(values, str):
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=pd.Index([values], dtype=str))
+    values = values.reset_index(drop=True)
+    values = values.array if isinstance(values.dtype, pd.CategoricalDtype) else pd.Categorical(values.astype("string").fillna(""))
+    if values.categories.dtype != STR_DTYPE:
+        values = values.rename_categories(values.categories.astype(str))
+    return values
+
+
+def _normalize(source, df):
+    """
+    Kategoriyi TIMELINE_COLUMNS biçiminde, zamana göre artan sırada döndürür.
+    Kaynak, Olay Türü ve Açıklama 'category' dtype'ındadır; birleştirmede
+    (columnar.concat_frames) satır başına metne dönüşmez.
+    """
+    times = _to_utc_ns(df[source.time_column])
+    keep = times.notna().to_numpy()
+    df, times = df[keep], times[keep]
+    event_type = source.event_type(df) if callable(source.event_type) else source.event_type
+    events = pd.DataFrame({
+        "Zaman (UTC)": times.reset_index(drop=True),
+        "Kaynak": _categorical(source.category, len(df)),
+        "Olay Türü": _categorical(event_type, len(df)),
+        "Açıklama": _categorical(source.describe(df), len(df)),
+    }, columns=TIMELINE_COLUMNS)
+    # Parser çıktıları çoğunlukla zaten sıralıdır (yeni -> eski ya da kayıt sırası)
+    column = events["Zaman (UTC)"]
+    if column.is_monotonic_increasing:
+        return events
+    if column.is_monotonic_decreasing:
+        return events.iloc[::-1]
+    return events.iloc[np.argsort(column.array.asi8, kind="stable")]
+
+
+def _merge_two(left, right):
+    """
+    İki sıralı koşuyu (zaman, satır no) birleştirir. Eşit zamanlarda soldaki
+    koşu önce gelir; böylece birleştirme kararlıdır.
+    """
+    left_times, left_rows = left
+    right_times, right_rows = right
+    positions = np.searchsorted(left_times, right_times, side="right") + np.arange(len(right_times))
+    times = np.empty(len(left_times) + len(right_times), dtype=left_times.dtype)
+    rows = np.empty(len(times), dtype=np.intp)
+    from_left = np.ones(len(times), dtype=bool)
+    from_left[positions] = False
+    times[positions], rows[positions] = right_times, right_rows
+    times[from_left], rows[from_left] = left_times, left_rows
+    return times, rows
+
+
+def merge_sorted_runs(runs):
+    """
+    k adet sıralı koşunun k-yollu birleştirmesi: koşular ikişer ikişer
+    (searchsorted ile vektörel olarak) birleştirilir, toplam O(n log k).
+    runs: [(zaman dizisi int64, satır no dizisi), ...]
+    Dönüş: birleşik sırada satır numaraları.
+    """
+    runs = [run for run in runs if len(run[0])]
+    if not runs:
+        return np.empty(0, dtype=np.intp)
+    while len(runs) > 1:
+        merged = [_merge_two(runs[i], runs[i + 1]) for i in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0][1]
+
+
+class Timeline:
+    """
+    Tüm kategorilerin olaylarını tek bir zaman sıralı akışta tutar.
+    frame'in indeksi datetime64[ns, UTC] ve artan sıralıdır; aralık ve
+    "bu olayın çevresi" sorguları ikili arama ile O(log n) sürede bulunur.
+    """
+    def __init__(self, frame):
+        self.frame = frame
+        self._times = frame.index.asi8 if len(frame) else np.empty(0, dtype=np.int64)
+
+    @classmethod
+    def from_frames(cls, data_frames, sources=TIMELINE_SOURCES):
+        """ {kategori: DataFrame} sözlüğünden zaman çizelgesi kurar; eksik kategoriler atlanır. """
+        parts = []
+        for source in sources:
+            df = data_frames.get(source.category)
+            if df is None or df.empty or source.time_column not in df.columns:
+                continue
+            parts.append(_normalize(source, df))
+        if not parts:
+            empty = pd.DataFrame(columns=TIMELINE_COLUMNS)
+            empty.index = pd.DatetimeIndex([], tz="UTC")
+            return cls(empty)
+        runs = []
+        offset = 0
+        for part in parts:
+            times = part["Zaman (UTC)"].array.asi8
+            runs.append((times, np.arange(offset, offset + len(part))))
+            offset += len(part)
+        combined = columnar.concat_frames(parts)
+        frame = combined.take(merge_sorted_runs(runs))
+        frame.index = pd.DatetimeIndex(frame["Zaman (UTC)"])
+        frame.index.name = None
+        return cls(frame)
+
+    def __len__(self):
+        return len(self.frame)
+
+    @staticmethod
+    def _ns(value):
+        value = pd.Timestamp(value)
+        if value.tzinfo is None:
+            value = value.tz_localize("UTC")
+        return value.as_unit("ns").value
+
+    def range(self, start=None, end=None):
+        """ [start, end] aralığındaki olaylar (uçlar dahil). """
+        lo = 0 if start is None else np.searchsorted(self._times, self._ns(start), side="left")
+        hi = len(self._times) if end is None else np.searchsorted(self._times, self._ns(end), side="right")
+        return self.frame.iloc[lo:hi]
+
+    def around(self, moment, before=pd.Timedelta(minutes=10), after=None):
+        """ moment'tan before öncesi ile after (varsayılan: before) sonrası arasındaki olaylar. """
+        moment = pd.Timestamp(moment)
+        if moment.tzinfo is None:
+            moment = moment.tz_localize("UTC")
+        after = before if after is None else after
+        return self.range(moment - pd.Timedelta(before), moment + pd.Timedelta(after))
+
+    def nearest(self, moment, count=50):
+        """ moment'a en yakın konumdan önceki ve sonraki count'ar olay. """
+        position = np.searchsorted(self._times, self._ns(moment))
+        return self.frame.iloc[max(0, position - count):position + count]